@@ -0,0 +1,78 @@
+"""
+Benchmark: end-to-end concatenation with and without compressed outputs.
+
+Point --dir at the file system you care about (e.g. an NFS mount); inputs
+and outputs are written there, so the timings include its I/O.
+
+Usage:
+    python -m benchmarks.bench_compression [--dir /mnt/nfs/tmp] [--loci 20] [--taxa 200] [--length 50000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.readers.loader import read_files
+from sequence_concatenator.utils.file_utils import compressed_path
+from sequence_concatenator.writers.fasta_writer import write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+
+
+def make_inputs(directory, num_loci, num_taxa, length, compress=None, seed=1):
+    rng = random.Random(seed)
+    paths = []
+    for locus in range(num_loci):
+        rows = {
+            f"Taxon{i+1}": "".join(rng.choice("ACGT") for _ in range(length))
+            for i in range(num_taxa) if rng.random() > 0.1
+        }
+        path = compressed_path(os.path.join(directory, f"locus{locus+1}.fasta"), compress)
+        write_fasta(rows, path, compress=compress)
+        paths.append(path)
+    return paths
+
+
+def run(paths, out_base, compress):
+    start = time.perf_counter()
+    results, errors = read_files(paths)
+    assert not errors, errors
+    merged, partitions = merge_sequences([sequences for _, sequences in results])
+    partition_text = generate_partition_file(partitions, codon=True)
+    outputs = [
+        compressed_path(out_base + ".fasta", compress),
+        compressed_path(out_base + ".nex", compress),
+        compressed_path(out_base + "_partition.txt", compress),
+    ]
+    write_fasta(merged, outputs[0], compress=compress)
+    write_nexus(merged, outputs[1], partition_text, compress=compress)
+    write_partition_file(partition_text, outputs[2], compress=compress)
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(os.path.getsize(p) for p in outputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dir", default=None, help="Working directory (default: system temp)")
+    parser.add_argument("--loci", type=int, default=20)
+    parser.add_argument("--taxa", type=int, default=200)
+    parser.add_argument("--length", type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"{args.loci} loci x {args.taxa} taxa x {args.length} bp")
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for compress in (None, "gzip", "zstd"):
+            try:
+                paths = make_inputs(tmp, args.loci, args.taxa, args.length, compress)
+                elapsed, size = run(paths, os.path.join(tmp, f"out_{compress}"), compress)
+            except ImportError as e:
+                print(f"  {compress}: skipped ({e})")
+                continue
+            print(f"  {compress or 'none':5}: {elapsed:8.3f} s  {size / 1e6:9.1f} MB written")
+
+
+if __name__ == "__main__":
+    main()
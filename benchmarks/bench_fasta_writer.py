@@ -0,0 +1,67 @@
+"""
+Benchmark: Bio.SeqIO FASTA export vs. the buffered native writer.
+
+Usage:
+    python -m benchmarks.bench_fasta_writer [--taxa 200] [--length 1000000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from Bio import SeqIO
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+
+from sequence_concatenator.writers.fasta_writer import write_fasta
+
+
+def write_fasta_seqio(sequence_dict, output_path):
+    """Previous implementation, building a SeqRecord per row."""
+    records = [
+        SeqRecord(Seq(sequence), id=taxon, description="")
+        for taxon, sequence in sequence_dict.items()
+    ]
+    SeqIO.write(records, output_path, "fasta")
+
+
+def make_rows(num_taxa, length, seed=1):
+    rng = random.Random(seed)
+    block = "".join(rng.choice("ACGT-?") for _ in range(10000))
+    row = (block * (length // len(block) + 1))[:length]
+    return {f"Taxon{i+1}": row for i in range(num_taxa)}
+
+
+def time_call(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--taxa", type=int, default=200)
+    parser.add_argument("--length", type=int, default=1000000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.taxa, args.length)
+    with tempfile.TemporaryDirectory() as tmp:
+        seqio_path = os.path.join(tmp, "seqio.fasta")
+        native_path = os.path.join(tmp, "native.fasta")
+        t_seqio = time_call(write_fasta_seqio, rows, seqio_path)
+        t_native = time_call(write_fasta, rows, native_path)
+        t_stream = time_call(write_fasta, iter(rows.items()), native_path)
+        t_flat = time_call(write_fasta, rows, os.path.join(tmp, "flat.fasta"), line_width=0)
+        with open(seqio_path, "rb") as a, open(native_path, "rb") as b:
+            assert a.read() == b.read()
+
+    print(f"{args.taxa} taxa x {args.length} bp")
+    print(f"  SeqIO.write:            {t_seqio:8.3f} s")
+    print(f"  write_fasta (dict):     {t_native:8.3f} s  ({t_seqio / t_native:.1f}x)")
+    print(f"  write_fasta (iterator): {t_stream:8.3f} s")
+    print(f"  write_fasta (unwrapped):{t_flat:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: legacy string-append merge vs. the segment-list merge engine.
+
+Usage:
+    python -m benchmarks.bench_merge [--taxa 50] [--loci 100 1000 10000]
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.utils.sequence_utils import get_all_taxa, pad_sequence
+
+
+def merge_sequences_legacy(sequence_dicts, placeholder="?"):
+    """Original implementation, appending to each row once per locus."""
+    all_taxa = get_all_taxa(sequence_dicts)
+    merged = defaultdict(str)
+    partitions = []
+
+    start = 1
+    for idx, seq_dict in enumerate(sequence_dicts):
+        gene_len = max(len(seq) for seq in seq_dict.values()) if seq_dict else 0
+        end = start + gene_len - 1
+        label = f"gene{idx+1}"
+
+        for taxon in all_taxa:
+            seq = seq_dict.get(taxon, "")
+            padded_seq = pad_sequence(seq, gene_len, filler=placeholder)
+            merged[taxon] += padded_seq
+
+        partitions.append((label, start, end))
+        start = end + 1
+
+    return dict(merged), partitions
+
+
+def make_loci(num_taxa, num_loci, min_len=200, max_len=1500, occupancy=0.8, seed=1):
+    rng = random.Random(seed)
+    taxa = [f"Taxon{i+1}" for i in range(num_taxa)]
+    loci = []
+    for _ in range(num_loci):
+        length = rng.randint(min_len, max_len)
+        block = "".join(rng.choice("ACGT-") for _ in range(length))
+        loci.append({t: block for t in taxa if rng.random() < occupancy})
+    return loci
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--taxa", type=int, default=50)
+    parser.add_argument("--loci", type=int, nargs="+", default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'loci':>8} {'legacy (s)':>12} {'segments (s)':>14} {'speedup':>9}")
+    for num_loci in args.loci:
+        loci = make_loci(args.taxa, num_loci)
+        t_old, (old_merged, old_parts) = time_call(merge_sequences_legacy, loci)
+        t_new, (new_merged, new_parts) = time_call(merge_sequences, loci)
+        assert old_merged == new_merged and old_parts == new_parts
+        print(f"{num_loci:>8} {t_old:>12.3f} {t_new:>14.3f} {t_old / t_new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: sequential read -> merge -> write vs. the overlapped asyncio pipeline.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--taxa 200] [--loci 400] [--length 1000] [--jobs 1]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.core.pipeline import read_and_merge, write_outputs
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.stats import compute_alignment_stats
+from sequence_concatenator.readers.loader import read_files
+from sequence_concatenator.writers.fasta_writer import write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+
+
+def make_inputs(directory, num_taxa, num_loci, length, seed=1):
+    rng = random.Random(seed)
+    paths = []
+    for i in range(num_loci):
+        path = os.path.join(directory, f"locus{i}.fasta")
+        block = "".join(rng.choice("ACGT-") for _ in range(length))
+        with open(path, "w") as f:
+            for t in range(num_taxa):
+                if rng.random() < 0.8:
+                    f.write(f">Taxon{t}\n{block}\n")
+        paths.append(path)
+    return paths
+
+
+def run_sequential(paths, out, jobs):
+    results, _ = read_files(paths, jobs=jobs)
+    merged, partitions = merge_sequences([seqs for _, seqs in results])
+    write_fasta(merged, out + ".fasta")
+    partition_text = generate_partition_file(partitions, codon=True)
+    write_partition_file(partition_text, out + "_partition.txt")
+    write_nexus(merged, out + ".nex", partition_text)
+    return compute_alignment_stats(merged)
+
+
+async def run_overlapped(paths, out, jobs):
+    merged, partitions, _ = await read_and_merge(paths, jobs=jobs)
+    stats, _ = await write_outputs(merged, partitions, out, nexus=True)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--taxa", type=int, default=200)
+    parser.add_argument("--loci", type=int, default=400)
+    parser.add_argument("--length", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_inputs(tmp, args.taxa, args.loci, args.length)
+        print(f"{args.loci} loci x {args.taxa} taxa, {args.length} bp per locus, jobs={args.jobs}")
+
+        start = time.perf_counter()
+        sequential = run_sequential(paths, os.path.join(tmp, "sequential"), args.jobs)
+        print(f"  sequential: {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        overlapped = asyncio.run(run_overlapped(paths, os.path.join(tmp, "overlap"), args.jobs))
+        print(f"  overlapped: {time.perf_counter() - start:.2f} s")
+        assert sequential == overlapped
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: PDF report time vs. matrix size, listing every taxon and partition
+vs. the summarized report (histograms, heatmap, truncated tables).
+
+Usage:
+    python -m benchmarks.bench_report [--sizes 100x200 2000x3000] [--length 300] [--jobs 4] [--skip-full]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from sequence_concatenator.core.alignment import Alignment
+from sequence_concatenator.core.stats import compute_detailed_stats
+from sequence_concatenator.writers.report_writer import DEFAULT_MAX_ITEMS, write_report
+
+
+def make_alignment(num_taxa, num_loci, length, occupancy=0.7, seed=1):
+    rng = np.random.default_rng(seed)
+    matrix = rng.choice(np.frombuffer(b"ACGT-", dtype=np.uint8), size=(num_taxa, num_loci * length))
+    absent = rng.random((num_taxa, num_loci)) > occupancy
+    matrix.reshape(num_taxa, num_loci, length)[absent] = ord("?")
+    partitions = [(f"gene{i+1}", i * length + 1, (i + 1) * length) for i in range(num_loci)]
+    return Alignment([f"Taxon{i+1}" for i in range(num_taxa)], matrix, partitions, "?")
+
+
+def time_report(alignment, stats, path, max_items, jobs):
+    inputs = [f"{label}.fasta" for label, _, _ in alignment.partitions]
+    start = time.perf_counter()
+    write_report(alignment, alignment.partitions, stats, inputs, path, max_items=max_items, jobs=jobs)
+    return time.perf_counter() - start, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=["50x100", "500x1000", "2000x3000"],
+                        help="TAXAxLOCI matrix sizes")
+    parser.add_argument("--length", type=int, default=300, help="Columns per locus")
+    parser.add_argument("--jobs", type=int, default=4, help="Chart-rendering processes")
+    parser.add_argument("--skip-full", action="store_true", help="Skip the one-bar-per-item report")
+    args = parser.parse_args()
+
+    print(f"{'taxa':>6} {'loci':>6} {'every item (s)':>15} {'summarized (s)':>15} "
+          f"{f'jobs={args.jobs} (s)':>12} {'PDF (kB)':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            num_taxa, num_loci = (int(n) for n in size.lower().split("x"))
+            alignment = make_alignment(num_taxa, num_loci, args.length)
+            stats = compute_detailed_stats(alignment)
+            path = os.path.join(tmp, "report.pdf")
+
+            full = "-"
+            if not args.skip_full:
+                elapsed, _ = time_report(alignment, stats, path, max(num_taxa, num_loci), 1)
+                full = f"{elapsed:.2f}"
+            serial, _ = time_report(alignment, stats, path, DEFAULT_MAX_ITEMS, 1)
+            parallel, pdf_size = time_report(alignment, stats, path, DEFAULT_MAX_ITEMS, args.jobs)
+            print(f"{num_taxa:>6} {num_loci:>6} {full:>15} {serial:>15.2f} {parallel:>12.2f} {pdf_size / 1e3:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
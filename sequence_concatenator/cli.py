@@ -0,0 +1,359 @@
+import argparse
+import re
+import sys
+# Only lightweight modules are imported here, so that short runs and
+# --version start quickly; NumPy-backed features (array backend, occupancy
+# filtering, binary output) are imported on the code paths that use them,
+# and Biopython, matplotlib and fpdf are imported lazily by their callers.
+from sequence_concatenator import __version__
+from sequence_concatenator.readers.loader import read_files, split_loci
+from sequence_concatenator.readers.parse_cache import ParseCache, default_cache_dir
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.streaming import UnreadableInputs, index_inputs, reconcile_loci, stream_loci
+from sequence_concatenator.core.taxon_reconciliation import TaxonReconciler, summarize_report
+from sequence_concatenator.core.incremental import run_incremental
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.writers.fasta_writer import write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.taxa_writer import write_reconciliation_report
+from sequence_concatenator.writers.partition_writer import write_partition_file
+from sequence_concatenator.core.stats import compute_alignment_stats, compute_detailed_stats
+from sequence_concatenator.writers.stats_writer import write_stats_csv, write_stats_json
+from sequence_concatenator.writers.report_writer import DEFAULT_MAX_ITEMS, write_report
+from sequence_concatenator.utils.file_utils import compressed_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Concatenate aligned biological sequences and generate report."
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    parser.add_argument(
+        "input_files", nargs="+", help="Paths to input sequence files"
+    )
+    parser.add_argument(
+        "--out", required=True, help="Base name for output files (no extension)"
+    )
+    parser.add_argument(
+        "--missing", default="?", help="Missing data character (default: ? )"
+    )
+    parser.add_argument(
+        "--nexus", action="store_true", help="Also export NEXUS file"
+    )
+    parser.add_argument(
+        "--interleave", action="store_true",
+        help="Write the NEXUS matrix in interleaved blocks"
+    )
+    parser.add_argument(
+        "--pdf", action="store_true", help="Generate a PDF report"
+    )
+    parser.add_argument(
+        "--report-max-items", type=int, default=DEFAULT_MAX_ITEMS,
+        help="Most taxa, partitions or input files listed individually in the PDF report; "
+             "beyond this, charts show distributions and tables are truncated (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--report-jobs", type=int, default=1,
+        help="Render the PDF report's charts in N worker processes; 0 uses all CPUs (default: 1)"
+    )
+    parser.add_argument(
+        "--line-width", type=int, default=60,
+        help="Residues per FASTA line; 0 writes each sequence on one line (default: 60)"
+    )
+    parser.add_argument(
+        "--reader", choices=["fast", "biopython"], default="fast",
+        help="Input parsers: built-in fast parsers or Biopython (default: fast)"
+    )
+    parser.add_argument(
+        "--check-lengths", action="store_true",
+        help="Fail if sequences within a FASTA input differ in length"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Parse input files in N worker processes; 0 uses all CPUs (default: 1)"
+    )
+    parser.add_argument(
+        "--cache-dir", default=default_cache_dir(),
+        help="Directory for the parsed-input cache (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Always parse input files instead of using the cache"
+    )
+    parser.add_argument(
+        "--backend", choices=["dict", "array"], default="dict",
+        help="Supermatrix representation: Python strings or a NumPy uint8 matrix (default: dict)"
+    )
+    parser.add_argument(
+        "--streaming", action="store_true",
+        help="Write outputs row by row without holding the supermatrix in memory"
+    )
+    parser.add_argument(
+        "--overlap", action="store_true",
+        help="Overlap reading, parsing, merging and output writing in an asyncio pipeline "
+             "(helps most when inputs are on slow or network storage)"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Reuse the previous run's outputs and only rebuild loci whose inputs changed"
+    )
+    parser.add_argument(
+        "--compress", choices=["gzip", "zstd"],
+        help="Compress the FASTA, NEXUS and partition outputs (adds .gz or .zst)"
+    )
+    parser.add_argument(
+        "--binary", action="store_true",
+        help="Also write a memory-mappable binary supermatrix (<out>.sqm)"
+    )
+    parser.add_argument(
+        "--taxon-rules", metavar="FILE",
+        help="Regex rules for taxon names: one 'pattern<TAB>replacement' per line, applied in order"
+    )
+    parser.add_argument(
+        "--synonyms", metavar="FILE",
+        help="Synonym table: one 'alias<TAB>taxon' per line (tab or comma separated)"
+    )
+    parser.add_argument(
+        "--accession-map", metavar="FILE",
+        help="Accession lookup table: one 'accession<TAB>taxon' per line (tab or comma separated)"
+    )
+    parser.add_argument(
+        "--min-locus-occupancy", type=float, default=0.0, metavar="FRACTION",
+        help="Drop loci in which fewer than this fraction of taxa have data (0-1, default: 0)"
+    )
+    parser.add_argument(
+        "--min-taxon-occupancy", type=float, default=0.0, metavar="FRACTION",
+        help="Drop taxa with less than this fraction of their cells filled (0-1, default: 0)"
+    )
+    parser.add_argument(
+        "--min-column-occupancy", type=float, default=0.0, metavar="FRACTION",
+        help="Drop columns in which fewer than this fraction of taxa have data (0-1, default: 0)"
+    )
+    parser.add_argument(
+        "--stats-json", action="store_true",
+        help="Write summary, per-taxon and per-partition statistics to <out>_stats.json"
+    )
+    parser.add_argument(
+        "--stats-csv", action="store_true",
+        help="Write per-taxon, per-partition and per-column statistics to <out>_stats_*.csv"
+    )
+    parser.add_argument(
+        "--stats-jobs", type=int, default=1,
+        help="Compute statistics across partitions in N worker processes; 0 uses all CPUs (default: 1)"
+    )
+    args = parser.parse_args()
+    filtering = args.min_taxon_occupancy or args.min_locus_occupancy or args.min_column_occupancy
+    for name in ("taxon", "locus", "column"):
+        if not 0.0 <= getattr(args, f"min_{name}_occupancy") <= 1.0:
+            parser.error(f"--min-{name}-occupancy must be between 0 and 1")
+    if args.line_width < 0:
+        parser.error("--line-width must be 0 or more")
+    cache = None if args.no_cache else ParseCache(args.cache_dir)
+    reconciler = None
+    if args.taxon_rules or args.synonyms or args.accession_map:
+        try:
+            reconciler = TaxonReconciler.from_files(args.taxon_rules, args.synonyms, args.accession_map)
+        except (OSError, ValueError, re.error) as e:
+            parser.error(f"Invalid taxon reconciliation table: {e}")
+
+    if args.incremental:
+        if (args.streaming or args.overlap or args.pdf or args.backend != "dict" or args.compress
+                or args.binary or args.stats_json or args.stats_csv or reconciler or filtering):
+            parser.error(
+                "--incremental cannot be combined with --streaming, --overlap, --pdf, --compress, "
+                "--binary, --stats-json, --stats-csv, --backend array, taxon reconciliation "
+                "or occupancy filtering"
+            )
+        try:
+            mode, partitions, stats = run_incremental(
+                args.input_files, args.out, placeholder=args.missing, nexus=args.nexus,
+                interleave=args.interleave, line_width=args.line_width,
+                reader=args.reader, check_lengths=args.check_lengths, jobs=args.jobs, cache=cache
+            )
+        except IOError as e:
+            sys.exit(str(e))
+        print(f"Incremental update: {mode}")
+        print_summary(stats)
+        print("\nDone.")
+        return
+
+    if args.streaming:
+        if (args.overlap or args.pdf or args.interleave or args.binary or args.backend != "dict"
+                or args.jobs != 1 or args.stats_json or args.stats_csv or filtering):
+            parser.error(
+                "--streaming cannot be combined with --overlap, --pdf, --interleave, --binary, "
+                "--jobs, --stats-json, --stats-csv, --backend array or occupancy filtering"
+            )
+        try:
+            loci = index_inputs(args.input_files, reader=args.reader, check_lengths=args.check_lengths)
+        except UnreadableInputs as e:
+            exit_unreadable(e.errors, len(args.input_files))
+        if reconciler:
+            loci, report = reconcile_loci(loci, reconciler)
+            report_reconciliation(report, args.out)
+        partitions, stats = stream_loci(
+            loci, args.out, placeholder=args.missing, nexus=args.nexus,
+            line_width=args.line_width, compress=args.compress
+        )
+        print_summary(stats)
+        print("\nDone.")
+        return
+
+    if args.overlap:
+        if args.backend != "dict" or reconciler or filtering:
+            parser.error(
+                "--overlap cannot be combined with --backend array, taxon reconciliation "
+                "or occupancy filtering"
+            )
+        run_overlapped(args, cache)
+        return
+
+    # Read inputs
+    for path in args.input_files:
+        print(f"Reading: {path}")
+    results, errors = read_files(
+        args.input_files, jobs=args.jobs, reader=args.reader,
+        check_lengths=args.check_lengths, cache=cache
+    )
+    if errors:
+        exit_unreadable(errors, len(args.input_files))
+    sequence_dicts = [locus for path, sequences in results for locus in split_loci(path, sequences)]
+
+    # Reconcile taxon names (optional)
+    if reconciler:
+        sequence_dicts, report = reconciler.apply(sequence_dicts)
+        report_reconciliation(report, args.out)
+
+    # Merge sequences
+    merged, partitions = merge_sequences(
+        sequence_dicts, placeholder=args.missing, backend=args.backend
+    )
+
+    # Occupancy filtering (optional)
+    codon = True
+    if filtering:
+        from sequence_concatenator.core.alignment import Alignment
+        from sequence_concatenator.core.occupancy import filter_occupancy, summarize_filtering
+
+        try:
+            if not isinstance(merged, Alignment):
+                merged = Alignment.from_dict(merged, partitions, placeholder=args.missing)
+            merged, occupancy = filter_occupancy(
+                merged, min_taxon=args.min_taxon_occupancy, min_locus=args.min_locus_occupancy,
+                min_column=args.min_column_occupancy
+            )
+        except ImportError:
+            sys.exit("Occupancy filtering requires NumPy (pip install 'sequence-concatenator[array]')")
+        partitions = merged.partitions
+        # Codon positions no longer line up in loci that lost columns
+        codon = {label for label, _, _ in partitions} - set(occupancy.trimmed_loci)
+        print(f"Occupancy filtering: {summarize_filtering(occupancy)}")
+
+    # Write FASTA
+    fasta_path = compressed_path(args.out + ".fasta", args.compress)
+    write_fasta(merged, fasta_path, line_width=args.line_width, compress=args.compress)
+
+    # Partition file
+    partition_txt = compressed_path(args.out + "_partition.txt", args.compress)
+    partition_text = generate_partition_file(partitions, codon=codon)
+    write_partition_file(partition_text, partition_txt, compress=args.compress)
+
+    # NEXUS (optional)
+    if args.nexus:
+        nexus_path = compressed_path(args.out + ".nex", args.compress)
+        write_nexus(
+            merged, nexus_path, partition_text, interleave=args.interleave, compress=args.compress
+        )
+
+    # Binary supermatrix (optional)
+    if args.binary:
+        from sequence_concatenator.writers.binary_writer import write_supermatrix
+
+        write_supermatrix(merged, args.out + ".sqm", partitions)
+
+    # Statistics: the detailed engine needs NumPy, so it runs when its results
+    # are written out or the supermatrix is already an array; otherwise the
+    # basic counts keep short runs from paying for the NumPy import
+    stats = None
+    if args.stats_json or args.stats_csv or args.pdf or not isinstance(merged, dict):
+        try:
+            stats = compute_detailed_stats(merged, partitions, missing_char=args.missing, jobs=args.stats_jobs)
+        except ImportError:
+            if args.stats_json or args.stats_csv:
+                sys.exit("--stats-json and --stats-csv require NumPy (pip install 'sequence-concatenator[array]')")
+    if stats is None:
+        stats = compute_alignment_stats(merged, missing_char=args.missing)
+    print_summary(stats)
+    if args.stats_json:
+        write_stats_json(stats, args.out + "_stats.json")
+    if args.stats_csv:
+        write_stats_csv(stats, args.out + "_stats")
+
+    # Report (PDF)
+    if args.pdf:
+        report_path = args.out + ".pdf"
+        write_report(
+            merged, partitions, stats, args.input_files, report_path, missing_char=args.missing,
+            max_items=args.report_max_items, jobs=args.report_jobs
+        )
+        print(f"PDF report written to: {report_path}")
+
+    print("\nDone.")
+
+
+def run_overlapped(args, cache):
+    import asyncio
+    from sequence_concatenator.core.pipeline import run_pipeline
+
+    for path in args.input_files:
+        print(f"Reading: {path}")
+    try:
+        partitions, stats, errors = asyncio.run(run_pipeline(
+            args.input_files, args.out, placeholder=args.missing, reader=args.reader,
+            check_lengths=args.check_lengths, jobs=args.jobs, cache=cache,
+            nexus=args.nexus, interleave=args.interleave, line_width=args.line_width,
+            compress=args.compress, binary=args.binary, stats_json=args.stats_json,
+            stats_csv=args.stats_csv, stats_jobs=args.stats_jobs, pdf=args.pdf,
+            report_max_items=args.report_max_items, report_jobs=args.report_jobs
+        ))
+    except ImportError:
+        if not (args.stats_json or args.stats_csv):
+            raise
+        sys.exit("--stats-json and --stats-csv require NumPy (pip install 'sequence-concatenator[array]')")
+    if errors:
+        exit_unreadable(errors, len(args.input_files))
+    print_summary(stats)
+    if args.pdf:
+        print(f"PDF report written to: {args.out}.pdf")
+    print("\nDone.")
+
+
+def exit_unreadable(errors, total):
+    for path, message in errors:
+        print(f"Error reading {path}: {message}", file=sys.stderr)
+    sys.exit(f"{len(errors)} of {total} input files could not be read.")
+
+
+def report_reconciliation(report, out_base):
+    report_path = out_base + "_taxa.tsv"
+    write_reconciliation_report(report, report_path)
+    print(f"Taxon reconciliation: {summarize_report(report)} (details in {report_path})")
+
+
+def print_summary(stats):
+    print("\nAlignment Summary:")
+    print(f"- Taxa: {stats['num_taxa']}")
+    print(f"- Length: {stats['alignment_length']} bp")
+    print(f"- Missing: {stats['missing_count']} ({stats['missing_percentage']}%)")
+    if "variable_sites" in stats:
+        print(f"- Gaps: {stats['gap_count']} ({stats['gap_percentage']}%)")
+        if stats["gc_content"] is not None:
+            print(f"- GC content: {round(stats['gc_content'] * 100, 2)}%")
+        print(f"- Variable sites: {stats['variable_sites']}")
+        print(f"- Parsimony-informative sites: {stats['informative_sites']}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
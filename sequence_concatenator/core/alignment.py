@@ -0,0 +1,200 @@
+from collections.abc import Mapping
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, see the "array" extra
+    np = None
+
+from sequence_concatenator.utils.sequence_utils import get_ordered_taxa
+
+# Rows are processed in blocks of roughly this many cells when counting, so
+# temporary boolean masks stay small even for multi-gigabyte matrices.
+_BLOCK_CELLS = 1 << 26
+
+
+def require_numpy():
+    """
+    Raises an informative ImportError if NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError(
+            "The array backend requires NumPy. "
+            "Install it with: pip install 'sequence-concatenator[array]'"
+        )
+
+
+class Alignment(Mapping):
+    """
+    Array-backed supermatrix: a taxa index, a 2-D uint8 matrix with one row per
+    taxon (ASCII codes), and the partition table from merge_sequences.
+
+    Behaves like a read-only {taxon: sequence} dict, so it can be passed to the
+    writers unchanged; rows are decoded to str only when accessed.
+    """
+
+    def __init__(self, taxa, matrix, partitions=None, placeholder="?"):
+        require_numpy()
+        if matrix.ndim != 2 or matrix.shape[0] != len(taxa):
+            raise ValueError(
+                f"Matrix shape {matrix.shape} does not match {len(taxa)} taxa"
+            )
+        self.taxa = list(taxa)
+        self.matrix = matrix
+        self.partitions = list(partitions or [])
+        self.placeholder = placeholder
+        self._index = {taxon: i for i, taxon in enumerate(self.taxa)}
+
+    @classmethod
+    def from_dict(cls, sequence_dict, partitions=None, placeholder="?"):
+        """
+        Builds an Alignment from an aligned {taxon: sequence} dict.
+
+        Raises:
+            ValueError: If sequences have inconsistent lengths
+        """
+        require_numpy()
+        taxa = list(sequence_dict)
+        length = len(sequence_dict[taxa[0]]) if taxa else 0
+        if any(len(seq) != length for seq in sequence_dict.values()):
+            raise ValueError("Inconsistent sequence lengths in alignment")
+        buffer = "".join(sequence_dict[t] for t in taxa).encode("ascii")
+        matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(len(taxa), length).copy()
+        if partitions is None:
+            partitions = [("gene1", 1, length)]
+        return cls(taxa, matrix, partitions, placeholder)
+
+    # Mapping interface
+    def __getitem__(self, taxon):
+        return self.matrix[self._index[taxon]].tobytes().decode("ascii")
+
+    def __iter__(self):
+        return iter(self.taxa)
+
+    def __len__(self):
+        return len(self.taxa)
+
+    def __contains__(self, taxon):
+        return taxon in self._index
+
+    @property
+    def num_taxa(self):
+        return self.matrix.shape[0]
+
+    @property
+    def alignment_length(self):
+        return self.matrix.shape[1]
+
+    def row_bytes(self, taxon):
+        """
+        Returns a taxon's row as bytes without decoding it.
+        """
+        return self.matrix[self._index[taxon]].tobytes()
+
+    def row(self, taxon, start=1, end=None):
+        """
+        Returns a taxon's columns start..end (1-based, inclusive), decoding
+        only that slice.
+        """
+        return self.matrix[self._index[taxon], start - 1:end].tobytes().decode("ascii")
+
+    def to_dict(self):
+        """
+        Returns a plain {taxon: sequence} dict.
+        """
+        return {taxon: self[taxon] for taxon in self.taxa}
+
+    def _char_mask(self, rows, chars):
+        codes = np.frombuffer(chars.encode("ascii"), dtype=np.uint8)
+        if len(codes) == 1:
+            return rows == codes[0]
+        return np.isin(rows, codes)
+
+    def _row_blocks(self):
+        step = max(1, _BLOCK_CELLS // max(1, self.alignment_length))
+        for start in range(0, self.num_taxa, step):
+            yield start, self.matrix[start:start + step]
+
+    def missing_per_taxon(self, chars=None):
+        """
+        Counts cells equal to any of `chars` (default: the placeholder) per taxon.
+
+        Returns:
+            numpy.ndarray: shape (num_taxa,)
+        """
+        chars = chars or self.placeholder
+        counts = np.zeros(self.num_taxa, dtype=np.int64)
+        for start, rows in self._row_blocks():
+            counts[start:start + len(rows)] = np.count_nonzero(
+                self._char_mask(rows, chars), axis=1
+            )
+        return counts
+
+    def missing_per_column(self, chars=None):
+        """
+        Counts cells equal to any of `chars` (default: the placeholder) per column.
+
+        Returns:
+            numpy.ndarray: shape (alignment_length,)
+        """
+        chars = chars or self.placeholder
+        counts = np.zeros(self.alignment_length, dtype=np.int64)
+        for _, rows in self._row_blocks():
+            counts += np.count_nonzero(self._char_mask(rows, chars), axis=0)
+        return counts
+
+    def missing_per_partition(self, chars=None):
+        """
+        Counts missing cells per taxon within each partition.
+
+        Returns:
+            numpy.ndarray: shape (num_taxa, num_partitions)
+        """
+        chars = chars or self.placeholder
+        counts = np.zeros((self.num_taxa, len(self.partitions)), dtype=np.int64)
+        for start, rows in self._row_blocks():
+            mask = self._char_mask(rows, chars)
+            for j, (_, p_start, p_end) in enumerate(self.partitions):
+                if p_end >= p_start:
+                    counts[start:start + len(rows), j] = np.count_nonzero(
+                        mask[:, p_start - 1:p_end], axis=1
+                    )
+        return counts
+
+    def missing_count(self, chars=None):
+        """
+        Total number of missing cells.
+        """
+        return int(self.missing_per_taxon(chars).sum())
+
+
+def merge_to_alignment(sequence_dicts, partitions, placeholder="?", progress=None):
+    """
+    Concatenates loci into a preallocated matrix, block-copying each locus.
+
+    Args:
+        sequence_dicts (list of dict): [{taxon: sequence}, ...]
+        partitions (list): [(gene_label, start, end), ...] for sequence_dicts
+        placeholder (str): Placeholder for missing data
+        progress (callable, optional): Called as progress(done, total) after each locus
+
+    Returns:
+        Alignment
+    """
+    require_numpy()
+    taxa = get_ordered_taxa(sequence_dicts)
+    index = {taxon: i for i, taxon in enumerate(taxa)}
+    length = partitions[-1][2] if partitions else 0
+    fill = ord(placeholder)
+    matrix = np.full((len(taxa), length), fill, dtype=np.uint8)
+
+    for done, (seq_dict, (_, start, end)) in enumerate(zip(sequence_dicts, partitions), start=1):
+        gene_len = end - start + 1
+        if seq_dict and gene_len > 0:
+            rows = np.fromiter((index[t] for t in seq_dict), dtype=np.intp, count=len(seq_dict))
+            padded = (seq.ljust(gene_len, placeholder) for seq in seq_dict.values())
+            block = np.frombuffer("".join(padded).encode("ascii"), dtype=np.uint8)
+            matrix[rows, start - 1:end] = block.reshape(len(seq_dict), gene_len)
+        if progress:
+            progress(done, len(partitions))
+
+    return Alignment(taxa, matrix, partitions, placeholder)
@@ -0,0 +1,175 @@
+import bisect
+
+from sequence_concatenator.core.sequence_merger import build_partitions
+
+# Sequences are compared in blocks of this many characters when locating an edit
+_DIFF_BLOCK = 4096
+
+
+class EditJournal:
+    """
+    Ordered record of edits made to a merged alignment: taxon renames,
+    removals and in-place sequence patches.
+
+    Recording an edit costs O(size of the edit). The journal is applied later
+    to the per-locus inputs (apply) or to a merged alignment (apply_merged);
+    only loci and rows an edit touches are copied, so partition boundaries
+    are preserved and untouched loci are shared with the input.
+
+    Operations are tuples:
+        ("rename", old, new)
+        ("remove", taxon)
+        ("patch", taxon, start, text): replace columns start..start+len(text)-1
+            (0-based, merged-matrix coordinates) of a taxon's row with text
+    """
+
+    def __init__(self, operations=None):
+        self.operations = list(operations or [])
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __iter__(self):
+        return iter(self.operations)
+
+    def rename(self, old, new):
+        self.operations.append(("rename", old, new))
+
+    def remove(self, taxon):
+        self.operations.append(("remove", taxon))
+
+    def patch(self, taxon, start, text):
+        if text:
+            self.operations.append(("patch", taxon, start, text))
+
+    def record_sequence(self, taxon, old, new):
+        """
+        Records the change from `old` to `new` as one patch covering the
+        columns that differ.
+
+        Raises:
+            ValueError: If the lengths differ (partitions would no longer line up)
+        """
+        if len(new) != len(old):
+            raise ValueError(
+                f"Edited sequence has {len(new)} columns, expected {len(old)}; "
+                "edits must keep the alignment length so partitions stay aligned"
+            )
+        span = diff_range(old, new)
+        if span is not None:
+            self.patch(taxon, span[0], new[span[0]:span[1]])
+
+    def extend(self, other):
+        self.operations.extend(other)
+
+    def clear(self):
+        self.operations.clear()
+
+    def apply(self, sequence_dicts, partitions=None, placeholder="?"):
+        """
+        Applies the journal to per-locus inputs.
+
+        Args:
+            sequence_dicts (list of dict): [{taxon: sequence}, ...] the edits were made against
+            partitions (list, optional): Partition table of the merged alignment
+                the edits were made on (default: build_partitions(sequence_dicts))
+            placeholder (str): Missing-data character used when patching a
+                taxon into a locus it was absent from
+
+        Returns:
+            tuple:
+                - list: New list of loci; untouched loci are the input dicts themselves
+                - list: Indices of the loci that changed
+
+        Raises:
+            ValueError: If a rename collides with an existing taxon in a locus
+        """
+        if partitions is None:
+            partitions = build_partitions(sequence_dicts)
+        loci = list(sequence_dicts)
+        starts = [start - 1 for _, start, _ in partitions]
+        copied = set()
+
+        def writable(j):
+            if j not in copied:
+                loci[j] = dict(loci[j])
+                copied.add(j)
+            return loci[j]
+
+        for op in self.operations:
+            kind, taxon = op[0], op[1]
+            if kind == "rename":
+                new = op[2]
+                for j, locus in enumerate(loci):
+                    if taxon in locus:
+                        if new in locus:
+                            raise ValueError(f"Cannot rename '{taxon}' to '{new}': both are in locus {j + 1}")
+                        loci[j] = {(new if name == taxon else name): seq for name, seq in locus.items()}
+                        copied.add(j)
+            elif kind == "remove":
+                for j, locus in enumerate(loci):
+                    if taxon in locus:
+                        del writable(j)[taxon]
+            else:
+                start, text = op[2], op[3]
+                end = start + len(text)
+                first = max(0, bisect.bisect_right(starts, start) - 1)
+                for j in range(first, len(partitions)):
+                    _, p_start, p_end = partitions[j]
+                    lo, hi = max(start, p_start - 1), min(end, p_end)
+                    if p_start - 1 >= end:
+                        break
+                    if lo >= hi:
+                        continue
+                    piece = text[lo - start:hi - start]
+                    seq = loci[j].get(taxon)
+                    gene_len = p_end - p_start + 1
+                    if seq is None:
+                        if not piece.strip(placeholder):
+                            continue
+                        seq = placeholder * gene_len
+                    elif len(seq) < gene_len:
+                        seq = seq.ljust(gene_len, placeholder)
+                    offset = p_start - 1
+                    writable(j)[taxon] = seq[:lo - offset] + piece + seq[hi - offset:]
+        return loci, sorted(copied)
+
+    def apply_merged(self, merged):
+        """
+        Applies the journal to a merged {taxon: sequence} dict, returning a
+        new dict; only edited rows are rebuilt.
+        """
+        rows = dict(merged)
+        for op in self.operations:
+            kind, taxon = op[0], op[1]
+            if kind == "rename":
+                rows = {(op[2] if name == taxon else name): seq for name, seq in rows.items()}
+            elif kind == "remove":
+                rows.pop(taxon, None)
+            else:
+                start, text = op[2], op[3]
+                seq = rows[taxon]
+                rows[taxon] = seq[:start] + text + seq[start + len(text):]
+        return rows
+
+
+def diff_range(old, new):
+    """
+    Returns the (start, end) span of columns that differ between two
+    equal-length sequences, or None if they are equal. Blocks are compared
+    in C before single characters, so long identical stretches are cheap.
+    """
+    n = len(old)
+    start = 0
+    while start < n and old[start:start + _DIFF_BLOCK] == new[start:start + _DIFF_BLOCK]:
+        start += _DIFF_BLOCK
+    if start >= n:
+        return None
+    while old[start] == new[start]:
+        start += 1
+    end = n
+    while end - _DIFF_BLOCK > start and old[end - _DIFF_BLOCK:end] == new[end - _DIFF_BLOCK:end]:
+        end -= _DIFF_BLOCK
+    while old[end - 1] == new[end - 1]:
+        end -= 1
+    return start, end
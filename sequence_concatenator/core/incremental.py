@@ -0,0 +1,293 @@
+import hashlib
+import json
+import os
+
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.core.sequence_merger import build_partitions, merge_sequences
+from sequence_concatenator.readers.fasta_reader import read_fasta
+from sequence_concatenator.readers.loader import read_files
+from sequence_concatenator.utils.sequence_utils import get_ordered_taxa
+from sequence_concatenator.writers.fasta_writer import DEFAULT_LINE_WIDTH, write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+
+MANIFEST_VERSION = 1
+
+
+def manifest_path(out_base):
+    return out_base + ".manifest.json"
+
+
+def file_digest(path):
+    """
+    Returns the SHA-256 hex digest of a file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_incremental(paths, out_base, placeholder="?", nexus=False, interleave=False,
+                    line_width=DEFAULT_LINE_WIDTH, reader="fast", check_lengths=False, jobs=1, cache=None):
+    """
+    Concatenates inputs, reusing the previous run's outputs where possible.
+
+    A manifest (<out_base>.manifest.json) records each locus's content hash,
+    taxa, coordinates and missing-data count. On a rerun with the same inputs:
+
+    - unchanged loci: nothing is rewritten;
+    - changed loci with unchanged length and taxa: only their column ranges
+      are patched in place in the FASTA (and sequential NEXUS) output;
+    - otherwise: rows are rebuilt from the previous FASTA plus the re-parsed
+      changed loci, shifting downstream partition coordinates.
+
+    Any mismatch in the input list or settings falls back to a full build.
+
+    Args:
+        paths (list of str): Input file paths, in partition order
+        out_base (str): Base name for output files (no extension)
+        placeholder (str): Placeholder for missing data
+        nexus (bool): Also write a NEXUS file
+        interleave (bool): Interleaved NEXUS matrix (disables in-place patching)
+        line_width (int): Residues per FASTA line; 0 for no wrapping
+        reader (str): FASTA parser, "fast" or "biopython"
+        check_lengths (bool): Fail if sequences within a FASTA input differ in length
+        jobs (int): Worker processes for parsing
+        cache (ParseCache, optional): Parsed-input cache
+
+    Returns:
+        tuple: (mode, partitions, stats) where mode is one of "full",
+        "unchanged", "patched" or "rebuilt"
+
+    Raises:
+        IOError: If any input file cannot be read
+    """
+    settings = {
+        "placeholder": placeholder, "nexus": nexus, "interleave": interleave,
+        "line_width": line_width or 0, "reader": reader, "check_lengths": check_lengths
+    }
+    inputs = [_input_state(path) for path in paths]
+    manifest = _load_manifest(out_base)
+    old_inputs = (manifest or {}).get("inputs", [])
+
+    if (manifest is None or manifest.get("settings") != settings
+            or [i["path"] for i in old_inputs] != [i["path"] for i in inputs]):
+        return _full_build(paths, inputs, out_base, settings, jobs, cache)
+
+    for new, old in zip(inputs, old_inputs):
+        if new["size"] == old["size"] and new["mtime_ns"] == old["mtime_ns"]:
+            new["hash"] = old["hash"]
+        else:
+            new["hash"] = file_digest(new["path"])
+    changed = [i for i, (new, old) in enumerate(zip(inputs, old_inputs)) if new["hash"] != old["hash"]]
+    loci = manifest["loci"]
+
+    if not changed:
+        _save_manifest(out_base, settings, inputs, manifest["taxa"], loci)
+        return "unchanged", _partitions_of(loci), _stats_of(manifest["taxa"], loci)
+
+    parsed = dict(zip(changed, _read_or_raise([paths[i] for i in changed], reader, check_lengths, jobs, cache)))
+    new_loci = [dict(locus) for locus in loci]
+    for i, seq_dict in parsed.items():
+        new_loci[i] = _describe_locus(seq_dict, placeholder)
+    taxa = get_ordered_taxa([dict.fromkeys(locus["taxa"]) for locus in new_loci])
+    _assign_coordinates(new_loci)
+
+    same_shape = (
+        taxa == manifest["taxa"]
+        and all(new_loci[i]["length"] == loci[i]["length"] for i in changed)
+        and not interleave
+    )
+
+    os.remove(manifest_path(out_base))  # outputs are inconsistent until the manifest is rewritten
+    if same_shape:
+        _patch_outputs(out_base, settings, taxa, new_loci, parsed)
+        mode = "patched"
+    else:
+        _rebuild_outputs(out_base, settings, taxa, loci, new_loci, parsed)
+        mode = "rebuilt"
+
+    _save_manifest(out_base, settings, inputs, taxa, new_loci)
+    return mode, _partitions_of(new_loci), _stats_of(taxa, new_loci)
+
+
+def _input_state(path):
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": None}
+
+
+def _read_or_raise(paths, reader, check_lengths, jobs, cache):
+    results, errors = read_files(paths, jobs=jobs, reader=reader, check_lengths=check_lengths, cache=cache)
+    if errors:
+        details = "; ".join(f"{path}: {message}" for path, message in errors)
+        raise IOError(f"Failed to read {len(errors)} input file(s): {details}")
+    return [sequences for _, sequences in results]
+
+
+def _describe_locus(seq_dict, placeholder):
+    length = max((len(seq) for seq in seq_dict.values()), default=0)
+    present_missing = sum(seq.count(placeholder) + length - len(seq) for seq in seq_dict.values())
+    return {"taxa": list(seq_dict), "length": length, "present_missing": present_missing}
+
+
+def _assign_coordinates(loci):
+    start = 1
+    for idx, locus in enumerate(loci):
+        locus["label"] = f"gene{idx+1}"
+        locus["start"] = start
+        locus["end"] = start + locus["length"] - 1
+        start = locus["end"] + 1
+
+
+def _partitions_of(loci):
+    return [(locus["label"], locus["start"], locus["end"]) for locus in loci]
+
+
+def _stats_of(taxa, loci):
+    num_taxa = len(taxa)
+    length = sum(locus["length"] for locus in loci) if taxa else 0
+    missing = sum(
+        locus["present_missing"] + (num_taxa - len(locus["taxa"])) * locus["length"]
+        for locus in loci
+    )
+    total = num_taxa * length
+    return {
+        "num_taxa": num_taxa,
+        "alignment_length": length,
+        "missing_count": missing,
+        "missing_percentage": round((missing / total) * 100, 2) if total else 0.0
+    }
+
+
+def _load_manifest(out_base):
+    path = manifest_path(out_base)
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    outputs = [out_base + ".fasta", out_base + "_partition.txt"]
+    if manifest.get("settings", {}).get("nexus"):
+        outputs.append(out_base + ".nex")
+    if not all(os.path.exists(p) for p in outputs):
+        return None
+    return manifest
+
+
+def _save_manifest(out_base, settings, inputs, taxa, loci):
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "settings": settings,
+        "inputs": inputs,
+        "taxa": taxa,
+        "loci": loci
+    }
+    tmp_path = manifest_path(out_base) + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path(out_base))
+
+
+def _write_outputs(out_base, settings, merged, partitions):
+    write_fasta(merged, out_base + ".fasta", line_width=settings["line_width"])
+    partition_text = generate_partition_file(partitions, codon=True)
+    write_partition_file(partition_text, out_base + "_partition.txt")
+    if settings["nexus"] and merged:
+        write_nexus(merged, out_base + ".nex", partition_text, interleave=settings["interleave"])
+
+
+def _full_build(paths, inputs, out_base, settings, jobs, cache):
+    sequence_dicts = _read_or_raise(paths, settings["reader"], settings["check_lengths"], jobs, cache)
+    for state in inputs:
+        state["hash"] = file_digest(state["path"])
+    merged, partitions = merge_sequences(sequence_dicts, placeholder=settings["placeholder"])
+    _write_outputs(out_base, settings, merged, partitions)
+
+    loci = [_describe_locus(seq_dict, settings["placeholder"]) for seq_dict in sequence_dicts]
+    _assign_coordinates(loci)
+    taxa = list(merged)
+    _save_manifest(out_base, settings, inputs, taxa, loci)
+    return "full", partitions, _stats_of(taxa, loci)
+
+
+def _rebuild_outputs(out_base, settings, taxa, old_loci, new_loci, parsed):
+    placeholder = settings["placeholder"]
+    old_rows = read_fasta(out_base + ".fasta")
+    merged = {}
+    for taxon in taxa:
+        old_row = old_rows.get(taxon)
+        parts = []
+        for i, (old, new) in enumerate(zip(old_loci, new_loci)):
+            if i in parsed:
+                seq = parsed[i].get(taxon, "")
+                parts.append(seq + placeholder * (new["length"] - len(seq)))
+            elif old_row is None:
+                parts.append(placeholder * new["length"])
+            else:
+                parts.append(old_row[old["start"] - 1:old["end"]])
+        merged[taxon] = "".join(parts)
+    _write_outputs(out_base, settings, merged, _partitions_of(new_loci))
+
+
+def _patch_outputs(out_base, settings, taxa, loci, parsed):
+    placeholder = settings["placeholder"]
+    width = settings["line_width"]
+    nchar = loci[-1]["end"] if loci else 0
+
+    def segments(taxon):
+        for i, seq_dict in parsed.items():
+            locus = loci[i]
+            seq = seq_dict.get(taxon, "")
+            yield locus["start"] - 1, (seq + placeholder * (locus["length"] - len(seq))).encode("ascii")
+
+    with open(out_base + ".fasta", "r+b") as f:
+        for taxon, row_offset in zip(taxa, _fasta_row_offsets(taxa, nchar, width)):
+            for col, data in segments(taxon):
+                _patch_wrapped(f, row_offset, col, data, width)
+
+    if settings["nexus"]:
+        with open(out_base + ".nex", "r+b") as f:
+            for taxon, row_offset in _nexus_row_offsets(f, len(taxa), nchar, sorted(taxa)):
+                for col, data in segments(taxon):
+                    f.seek(row_offset + col)
+                    f.write(data)
+
+
+def _fasta_row_offsets(taxa, nchar, width):
+    line_count = -(-nchar // width) if width else (1 if nchar else 0)
+    row_bytes = nchar + line_count
+    offset = 0
+    for taxon in taxa:
+        header = len(f">{taxon}\n".encode("utf-8"))
+        yield offset + header
+        offset += header + row_bytes
+
+
+def _patch_wrapped(handle, row_offset, col, data, width):
+    written = 0
+    while written < len(data):
+        c = col + written
+        chunk = len(data) - written
+        if width:
+            chunk = min(chunk, width - c % width)
+        handle.seek(row_offset + c + (c // width if width else 0))
+        handle.write(data[written:written + chunk])
+        written += chunk
+
+
+def _nexus_row_offsets(handle, ntax, nchar, taxa):
+    handle.seek(0)
+    offset = 0
+    for line in handle:
+        offset += len(line)
+        if line.strip().lower() == b"matrix":
+            break
+    for taxon in taxa[:ntax]:
+        line = handle.readline()
+        offset += len(line)
+        yield taxon, offset - 1 - nchar
+        handle.seek(offset)
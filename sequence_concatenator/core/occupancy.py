@@ -0,0 +1,151 @@
+from collections import namedtuple
+
+from sequence_concatenator.core.alignment import Alignment, np, require_numpy
+
+OccupancyReport = namedtuple(
+    "OccupancyReport",
+    ["dropped_loci", "dropped_taxa", "dropped_columns", "trimmed_loci", "locus_occupancy", "taxon_occupancy"]
+)
+OccupancyReport.__doc__ = """
+What filter_occupancy removed.
+
+    dropped_loci (list): Labels of loci removed (below the locus threshold, or
+        left without columns after column filtering)
+    dropped_taxa (list): Taxa removed
+    dropped_columns (int): Columns removed from the loci that were kept
+    trimmed_loci (list): Labels of kept loci that lost columns, whose codon
+        positions therefore no longer follow their coordinates
+    locus_occupancy (dict): {label: fraction of taxa with data in the locus}
+    taxon_occupancy (dict): {taxon: fraction of cells with data in kept loci}
+"""
+
+
+def filter_occupancy(alignment, min_taxon=0.0, min_locus=0.0, min_column=0.0, missing_chars=None):
+    """
+    Removes loci, taxa and columns whose occupancy (fraction of cells holding
+    data) is below the given thresholds, rewriting partition coordinates.
+
+    Filters are applied in this order, each on what the previous one kept:
+
+    - a locus is kept if at least `min_locus` of the taxa have data in it;
+    - a taxon is kept if at least `min_taxon` of its cells in kept loci hold data;
+    - a column is kept if at least `min_column` of the kept taxa have data in it.
+
+    Occupancy counts come from one vectorized pass over the matrix in row
+    blocks; column counts are then corrected for the dropped taxa only.
+
+    Args:
+        alignment (Alignment): Supermatrix with its partition table
+        min_taxon (float): Threshold between 0 and 1
+        min_locus (float): Threshold between 0 and 1
+        min_column (float): Threshold between 0 and 1
+        missing_chars (str, optional): Characters counted as missing data
+            (default: the alignment's placeholder and "-")
+
+    Returns:
+        tuple: (filtered Alignment, OccupancyReport)
+
+    Raises:
+        ValueError: If a threshold is outside [0, 1]
+    """
+    require_numpy()
+    for name, value in (("taxon", min_taxon), ("locus", min_locus), ("column", min_column)):
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f"Minimum {name} occupancy must be between 0 and 1, got {value}")
+    if missing_chars is None:
+        missing_chars = "".join(dict.fromkeys(alignment.placeholder + "-"))
+
+    partitions = alignment.partitions
+    num_taxa = alignment.num_taxa
+    taxon_locus, column_counts = _occupied_counts(alignment, partitions, missing_chars)
+    lengths = np.array([max(0, end - start + 1) for _, start, end in partitions], dtype=np.int64)
+
+    # Loci
+    present = np.count_nonzero(taxon_locus, axis=0)
+    locus_occupancy = present / num_taxa if num_taxa else np.zeros(len(partitions))
+    keep_locus = (locus_occupancy >= min_locus) & (lengths > 0)
+
+    # Taxa, over the kept loci
+    kept_length = int(lengths[keep_locus].sum())
+    if kept_length:
+        taxon_occupancy = taxon_locus[:, keep_locus].sum(axis=1) / kept_length
+    else:
+        taxon_occupancy = np.zeros(num_taxa)
+    keep_taxon = taxon_occupancy >= min_taxon if kept_length else np.zeros(num_taxa, dtype=bool)
+
+    # Columns, over the kept taxa
+    keep_column = np.zeros(alignment.alignment_length, dtype=bool)
+    for keep, (_, start, end) in zip(keep_locus, partitions):
+        if keep:
+            keep_column[start - 1:end] = True
+    dropped_rows = np.flatnonzero(~keep_taxon)
+    if len(dropped_rows):
+        mask = alignment._char_mask(alignment.matrix[dropped_rows], missing_chars)
+        column_counts = column_counts - np.count_nonzero(~mask, axis=0)
+    kept_taxa_count = int(keep_taxon.sum())
+    if min_column > 0:
+        if kept_taxa_count:
+            keep_column &= column_counts / kept_taxa_count >= min_column
+        else:
+            keep_column[:] = False
+
+    # Rewrite partitions
+    new_partitions = []
+    dropped_loci = []
+    trimmed_loci = []
+    dropped_columns = 0
+    position = 0
+    for keep, (label, start, end) in zip(keep_locus, partitions):
+        kept = int(keep_column[start - 1:end].sum()) if keep else 0
+        if not kept:
+            dropped_loci.append(label)
+            continue
+        if kept < end - start + 1:
+            trimmed_loci.append(label)
+            dropped_columns += end - start + 1 - kept
+        new_partitions.append((label, position + 1, position + kept))
+        position += kept
+
+    taxa = [taxon for taxon, keep in zip(alignment.taxa, keep_taxon) if keep]
+    rows = np.flatnonzero(keep_taxon)
+    columns = np.flatnonzero(keep_column)
+    matrix = alignment.matrix[np.ix_(rows, columns)]
+    filtered = Alignment(taxa, matrix, new_partitions, alignment.placeholder)
+
+    report = OccupancyReport(
+        dropped_loci=dropped_loci,
+        dropped_taxa=[taxon for taxon, keep in zip(alignment.taxa, keep_taxon) if not keep],
+        dropped_columns=dropped_columns,
+        trimmed_loci=trimmed_loci,
+        locus_occupancy={label: float(f) for (label, _, _), f in zip(partitions, locus_occupancy)},
+        taxon_occupancy={taxon: float(f) for taxon, f in zip(alignment.taxa, taxon_occupancy)},
+    )
+    return filtered, report
+
+
+def _occupied_counts(alignment, partitions, missing_chars):
+    """
+    Returns (taxa x loci occupied-cell counts, occupied-taxa count per column).
+    """
+    taxon_locus = np.zeros((alignment.num_taxa, len(partitions)), dtype=np.int64)
+    column_counts = np.zeros(alignment.alignment_length, dtype=np.int64)
+    nonempty = [j for j, (_, start, end) in enumerate(partitions) if end >= start]
+    starts = np.array([partitions[j][1] - 1 for j in nonempty], dtype=np.intp)
+
+    for first, rows in alignment._row_blocks():
+        occupied = ~alignment._char_mask(rows, missing_chars)
+        column_counts += np.count_nonzero(occupied, axis=0)
+        if len(starts):
+            sums = np.add.reduceat(occupied.view(np.uint8), starts, axis=1, dtype=np.int64)
+            taxon_locus[first:first + len(rows), nonempty] = sums
+    return taxon_locus, column_counts
+
+
+def summarize_filtering(report):
+    """
+    Returns a one-line summary of an OccupancyReport.
+    """
+    return (
+        f"removed {len(report.dropped_loci)} loci, {len(report.dropped_taxa)} taxa "
+        f"and {report.dropped_columns} columns"
+    )
@@ -4,7 +4,8 @@ def generate_partition_file(partitions, codon=False):
 
     Args:
         partitions (list of tuples): [(gene_label, start, end), ...]
-        codon (bool): If True, also generate codon position CHARSETs (1st, 2nd, 3rd positions)
+        codon (bool or collection): If True, also generate codon position CHARSETs
+            (1st, 2nd, 3rd positions); a collection of labels limits them to those partitions
 
     Returns:
         str: Partition file content (as a string)
@@ -14,7 +15,7 @@ def generate_partition_file(partitions, codon=False):
     for label, start, end in partitions:
         lines.append(f"CHARSET {label} = {start}-{end};")
 
-        if codon:
+        if codon is True or (codon and label in codon):
             lines.append(f"CHARSET {label}_pos1 = {start}-{end}\\3;")
             lines.append(f"CHARSET {label}_pos2 = {start+1}-{end}\\3;")
             lines.append(f"CHARSET {label}_pos3 = {start+2}-{end}\\3;")
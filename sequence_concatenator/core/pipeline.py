@@ -0,0 +1,246 @@
+import asyncio
+import os
+
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.core.sequence_merger import LocusMerger
+from sequence_concatenator.core.stats import compute_alignment_stats, compute_detailed_stats
+from sequence_concatenator.readers.loader import cache_variant, read_file_cached, split_loci
+from sequence_concatenator.utils.file_utils import compressed_path
+from sequence_concatenator.writers.fasta_writer import DEFAULT_LINE_WIDTH, write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+from sequence_concatenator.writers.report_writer import DEFAULT_MAX_ITEMS, write_report
+from sequence_concatenator.writers.stats_writer import write_stats_csv, write_stats_json
+
+# Files read ahead of the parsers, and parsed files waiting to be merged
+DEFAULT_QUEUE_SIZE = 4
+_PREFETCH_BLOCK = 1 << 20
+
+
+def prefetch(path):
+    """
+    Reads a file once so that the parser that opens it next finds it in the
+    page cache instead of waiting on slow or remote storage.
+    """
+    buffer = bytearray(_PREFETCH_BLOCK)
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while f.readinto(buffer):
+                pass
+    except OSError:
+        pass  # the parser reports unreadable files
+
+
+async def read_and_merge(paths, placeholder="?", reader="fast", check_lengths=False, jobs=1,
+                         cache=None, queue_size=DEFAULT_QUEUE_SIZE, progress=None):
+    """
+    Reads, parses and merges input files as three overlapping stages joined
+    by bounded queues: files are read ahead on a thread (I/O), parsed by
+    `jobs` workers (processes when jobs > 1), and merged in input order as
+    soon as each next locus is parsed.
+
+    Args:
+        paths (list of str): Input file paths, in partition order
+        placeholder (str): Missing data character
+        reader (str): Parser family, "fast" or "biopython"
+        check_lengths (bool): Fail if FASTA sequences differ in length
+        jobs (int): Parser workers; 0 or None uses one per CPU
+        cache (ParseCache, optional): Parsed-input cache; cached files are not read ahead
+        queue_size (int): Files read ahead of the parsers
+        progress (callable, optional): Called as progress(done, total) as files are merged
+
+    Returns:
+        tuple:
+            - dict: {taxon: concatenated_sequence}, or None if any file failed
+            - list: [(gene_label, start, end), ...]
+            - list: [(path, error_message), ...] for files that failed
+    """
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(paths) or 1))
+    executor = None
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+    loop = asyncio.get_running_loop()
+    variant = cache_variant(reader, check_lengths)
+    fetched = asyncio.Queue(maxsize=queue_size)
+    parsed = asyncio.Queue(maxsize=queue_size)
+
+    async def read_stage():
+        for index, path in enumerate(paths):
+            if cache is None or not cache.contains(path, variant):
+                await asyncio.to_thread(prefetch, path)
+            await fetched.put((index, path))
+        for _ in range(workers):
+            await fetched.put(None)
+
+    async def parse_stage():
+        while True:
+            item = await fetched.get()
+            if item is None:
+                return
+            index, path = item
+            try:
+                sequences = await loop.run_in_executor(
+                    executor, read_file_cached, path, reader, check_lengths, cache
+                )
+                await parsed.put((index, path, sequences, None))
+            except Exception as e:
+                await parsed.put((index, path, None, str(e)))
+
+    async def merge_stage():
+        merger = LocusMerger(placeholder)
+        errors = []
+        waiting = {}
+        merged_count = 0
+        for _ in paths:
+            index, path, sequences, error = await parsed.get()
+            waiting[index] = (path, sequences, error)
+            # Loci are merged strictly in input order so partitions are stable
+            ready = []
+            while merged_count in waiting:
+                path, sequences, error = waiting.pop(merged_count)
+                merged_count += 1
+                if error is not None:
+                    errors.append((path, error))
+                elif not errors:
+                    ready.extend(split_loci(path, sequences))
+                if progress:
+                    progress(merged_count, len(paths))
+            if ready and not errors:
+                await asyncio.to_thread(_add_loci, merger, ready)
+        return merger, errors
+
+    try:
+        results = await _gather_stages(read_stage(), *(parse_stage() for _ in range(workers)), merge_stage())
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    merger, errors = results[-1]
+    if errors:
+        return None, merger.partitions, errors
+    merged, partitions = await asyncio.to_thread(merger.result)
+    return merged, partitions, []
+
+
+async def write_outputs(merged, partitions, out_base, placeholder="?", nexus=False, interleave=False,
+                        line_width=DEFAULT_LINE_WIDTH, compress=None, binary=False,
+                        stats_json=False, stats_csv=False, stats_jobs=1, pdf=False, input_files=(),
+                        report_max_items=DEFAULT_MAX_ITEMS, report_jobs=1):
+    """
+    Writes every requested output of one merged alignment concurrently: the
+    FASTA, partition, NEXUS and binary files are written on separate threads
+    while statistics are computed, and the stats files and PDF report follow
+    as soon as the statistics are ready.
+
+    Detailed statistics are computed when stats files or a report are
+    requested, otherwise the basic counts.
+
+    Returns:
+        tuple:
+            - dict: Alignment statistics
+            - dict: {output_name: path} of the files written
+
+    Raises:
+        ImportError: If stats files are requested and NumPy is not installed
+    """
+    partition_text = generate_partition_file(partitions, codon=True)
+    paths = {
+        "fasta": compressed_path(out_base + ".fasta", compress),
+        "partition": compressed_path(out_base + "_partition.txt", compress),
+    }
+    stages = [
+        asyncio.to_thread(write_fasta, merged, paths["fasta"], line_width=line_width, compress=compress),
+        asyncio.to_thread(write_partition_file, partition_text, paths["partition"], compress=compress),
+    ]
+    if nexus:
+        paths["nexus"] = compressed_path(out_base + ".nex", compress)
+        stages.append(asyncio.to_thread(
+            write_nexus, merged, paths["nexus"], partition_text, interleave=interleave, compress=compress
+        ))
+    if binary:
+        from sequence_concatenator.writers.binary_writer import write_supermatrix
+
+        paths["binary"] = out_base + ".sqm"
+        stages.append(asyncio.to_thread(write_supermatrix, merged, paths["binary"], partitions))
+
+    async def stats_stage():
+        stats = await asyncio.to_thread(
+            _compute_stats, merged, partitions, placeholder, stats_json or stats_csv or pdf,
+            stats_json or stats_csv, stats_jobs
+        )
+        followers = []
+        if stats_json:
+            paths["stats_json"] = out_base + "_stats.json"
+            followers.append(asyncio.to_thread(write_stats_json, stats, paths["stats_json"]))
+        if stats_csv:
+            paths["stats_csv"] = out_base + "_stats"
+            followers.append(asyncio.to_thread(write_stats_csv, stats, paths["stats_csv"]))
+        if pdf:
+            paths["report"] = out_base + ".pdf"
+            followers.append(asyncio.to_thread(
+                write_report, merged, partitions, stats, list(input_files), paths["report"],
+                missing_char=placeholder, max_items=report_max_items, jobs=report_jobs
+            ))
+        await _gather_stages(*followers)
+        return stats
+
+    results = await _gather_stages(stats_stage(), *stages)
+    return results[0], paths
+
+
+async def run_pipeline(paths, out_base, placeholder="?", reader="fast", check_lengths=False, jobs=1,
+                       cache=None, queue_size=DEFAULT_QUEUE_SIZE, **output_options):
+    """
+    Runs read_and_merge, then write_outputs, for the CLI's --overlap mode.
+    Outputs are not written if any input fails to parse.
+
+    Args:
+        output_options: Passed to write_outputs
+
+    Returns:
+        tuple:
+            - list: [(gene_label, start, end), ...]
+            - dict: Alignment statistics, or None if inputs failed
+            - list: [(path, error_message), ...] for files that failed
+    """
+    merged, partitions, errors = await read_and_merge(
+        paths, placeholder=placeholder, reader=reader, check_lengths=check_lengths,
+        jobs=jobs, cache=cache, queue_size=queue_size
+    )
+    if errors:
+        return partitions, None, errors
+    stats, _ = await write_outputs(
+        merged, partitions, out_base, placeholder=placeholder, input_files=paths, **output_options
+    )
+    return partitions, stats, []
+
+
+def _add_loci(merger, loci):
+    for locus in loci:
+        merger.add(locus)
+
+
+def _compute_stats(merged, partitions, placeholder, detailed, required, jobs):
+    if detailed:
+        try:
+            return compute_detailed_stats(merged, partitions, missing_char=placeholder, jobs=jobs)
+        except ImportError:
+            if required:
+                raise
+    return compute_alignment_stats(merged, missing_char=placeholder)
+
+
+async def _gather_stages(*coroutines):
+    """
+    Runs stages concurrently; if one fails, the others are cancelled and the
+    error is raised.
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
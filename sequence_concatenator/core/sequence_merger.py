@@ -1,35 +1,105 @@
-from collections import defaultdict
-from sequence_concatenator.utils.sequence_utils import get_all_taxa, pad_sequence
+from sequence_concatenator.utils.sequence_utils import pad_sequence
 
-def merge_sequences(sequence_dicts, placeholder="?"):
+
+def merge_sequences(sequence_dicts, placeholder="?", backend="dict", progress=None):
     """
     Concatenates sequences across multiple input sources, aligning by taxon name.
 
+    Each taxon's row is collected as a list of per-locus segments and joined
+    once at the end, so the cost is linear in the size of the supermatrix
+    rather than quadratic in the number of loci.
+
     Args:
         sequence_dicts (list of dict): List of dictionaries [{taxon: sequence}, ...]
         placeholder (str): Placeholder for missing data (e.g., "?" or "-")
+        backend (str): "dict" for a {taxon: str} result, or "array" for an
+            Alignment backed by a NumPy uint8 matrix (requires numpy)
+        progress (callable, optional): Called as progress(done, total) after
+            each locus is merged; an exception it raises aborts the merge
 
     Returns:
         tuple:
-            - dict: {taxon: concatenated_sequence}
+            - dict or Alignment: {taxon: concatenated_sequence}, taxa in order of first appearance
             - list: list of (gene_label, start, end) tuples for partition info
     """
-    all_taxa = get_all_taxa(sequence_dicts)
-    merged = defaultdict(str)
-    partitions = []
+    if backend == "array":
+        from sequence_concatenator.core.alignment import merge_to_alignment
+        partitions = build_partitions(sequence_dicts)
+        return merge_to_alignment(sequence_dicts, partitions, placeholder, progress), partitions
+    if backend != "dict":
+        raise ValueError(f"Unknown merge backend: {backend}")
 
-    start = 1
-    for idx, seq_dict in enumerate(sequence_dicts):
-        gene_len = max(len(seq) for seq in seq_dict.values()) if seq_dict else 0
-        end = start + gene_len - 1
-        label = f"gene{idx+1}"
+    merger = LocusMerger(placeholder)
+    for done, seq_dict in enumerate(sequence_dicts, start=1):
+        merger.add(seq_dict)
+        if progress:
+            progress(done, len(sequence_dicts))
+    return merger.result()
+
+
+class LocusMerger:
+    """
+    Merges loci one at a time, in partition order, as they become available;
+    merge_sequences uses it for the dict backend and the --overlap pipeline
+    feeds it loci as they are parsed. A taxon first seen in a later locus is
+    padded for the loci before it.
+    """
+
+    def __init__(self, placeholder="?"):
+        self.placeholder = placeholder
+        self.segments = {}   # taxon -> per-locus segments
+        self.partitions = []
+        self.length = 0
+
+    def add(self, seq_dict):
+        gene_len = _locus_length(seq_dict)
+        for taxon in seq_dict:
+            if taxon not in self.segments:
+                self.segments[taxon] = [self.placeholder * self.length] if self.length else []
+
+        missing_block = self.placeholder * gene_len
+        for taxon, parts in self.segments.items():
+            seq = seq_dict.get(taxon)
+            if seq is None:
+                parts.append(missing_block)
+            elif len(seq) == gene_len:
+                parts.append(seq)
+            else:
+                parts.append(pad_sequence(seq, gene_len, filler=self.placeholder))
 
-        for taxon in all_taxa:
-            seq = seq_dict.get(taxon, "")
-            padded_seq = pad_sequence(seq, gene_len, filler=placeholder)
-            merged[taxon] += padded_seq
+        start = self.length + 1
+        self.length += gene_len
+        self.partitions.append((f"gene{len(self.partitions) + 1}", start, self.length))
 
-        partitions.append((label, start, end))
+    def result(self):
+        """
+        Returns:
+            tuple: (merged, partitions) as from merge_sequences
+        """
+        merged = {taxon: "".join(parts) for taxon, parts in self.segments.items()}
+        return merged, list(self.partitions)
+
+
+def build_partitions(sequence_dicts):
+    """
+    Computes the partition table for a list of loci; each locus spans the
+    length of its longest sequence.
+
+    Args:
+        sequence_dicts (list of dict): [{taxon: sequence}, ...]
+
+    Returns:
+        list: [(gene_label, start, end), ...] with 1-based inclusive coordinates
+    """
+    partitions = []
+    start = 1
+    for idx, seq_dict in enumerate(sequence_dicts):
+        end = start + _locus_length(seq_dict) - 1
+        partitions.append((f"gene{idx+1}", start, end))
         start = end + 1
+    return partitions
+
 
-    return dict(merged), partitions
\ No newline at end of file
+def _locus_length(seq_dict):
+    # A locus spans its longest sequence
+    return max(len(seq) for seq in seq_dict.values()) if seq_dict else 0
@@ -1,9 +1,16 @@
+import os
+from collections.abc import Mapping
+
+# NumPy (through core.alignment) and multiprocessing are imported by the
+# functions that use them, so the basic statistics stay cheap to import.
+
+
 def compute_alignment_stats(sequence_dict, missing_char="?"):
     """
     Computes basic statistics from a concatenated sequence alignment.
 
     Args:
-        sequence_dict (dict): {taxon: sequence}
+        sequence_dict (dict or Alignment): {taxon: sequence}
         missing_char (str): Character used for missing data ("?" or "-")
 
     Returns:
@@ -22,16 +29,404 @@ def compute_alignment_stats(sequence_dict, missing_char="?"):
             "missing_percentage": 0.0
         }
 
-    num_taxa = len(sequence_dict)
-    alignment_length = len(next(iter(sequence_dict.values())))
+    if hasattr(sequence_dict, "missing_count"):  # Alignment
+        num_taxa = sequence_dict.num_taxa
+        alignment_length = sequence_dict.alignment_length
+        missing_count = sequence_dict.missing_count(missing_char)
+    else:
+        num_taxa = len(sequence_dict)
+        alignment_length = len(next(iter(sequence_dict.values())))
+        missing_count = sum(seq.count(missing_char) for seq in sequence_dict.values())
     total_positions = num_taxa * alignment_length
 
-    missing_count = sum(seq.count(missing_char) for seq in sequence_dict.values())
-    missing_percentage = round((missing_count / total_positions) * 100, 2)
+    missing_percentage = round((missing_count / total_positions) * 100, 2) if total_positions else 0.0
 
     return {
         "num_taxa": num_taxa,
         "alignment_length": alignment_length,
         "missing_count": missing_count,
         "missing_percentage": missing_percentage
-    }
\ No newline at end of file
+    }
+
+# Byte classes used for per-column counts: letters A-Z (case-folded, U as T),
+# then missing, gap and anything else.
+_MISSING, _GAP, _OTHER = 26, 27, 28
+_NUM_CLASSES = 29
+_DNA_STATES = "ACGT"
+_PROTEIN_STATES = "ACDEFGHIKLMNPQRSTVWY"
+_NUCLEOTIDE_SYMBOLS = set("ACGTURYSWKMBDHVN")
+# Columns are processed in chunks of about this many cells per partition
+_CHUNK_CELLS = 1 << 22
+
+
+class AlignmentStats(Mapping):
+    """
+    Per-taxon, per-partition and per-column statistics of a supermatrix.
+
+    As a mapping it holds the summary (the keys of compute_alignment_stats,
+    plus gap, GC and site counts), so it can be used wherever that dict was;
+    the detailed tables come from taxon_table(), partition_table() and the
+    column_* arrays.
+
+    Variable sites have at least two character states among unambiguous
+    residues (A/C/G/T for DNA, the 20 amino acids for protein); parsimony-
+    informative sites have at least two states that each occur in at least
+    two taxa.
+    """
+
+    def __init__(self, taxa, partitions, missing_char, gap_char, taxon_hist, partition_hist,
+                 taxon_partition_missing, column_missing, column_gaps, column_flags):
+        self.taxa = list(taxa)
+        self.partitions = list(partitions)
+        self.missing_char = missing_char
+        self.gap_char = gap_char
+        self.taxon_hist = taxon_hist                          # (taxa, classes) symbol-class counts
+        self.partition_hist = partition_hist                  # (partitions, classes)
+        self.taxon_partition_missing = taxon_partition_missing  # (taxa, partitions)
+        self.column_missing = column_missing
+        self.column_gaps = column_gaps
+
+        totals = partition_hist.sum(axis=0)
+        letters = {chr(65 + i) for i in range(26) if totals[i]}
+        self.datatype = "dna" if letters <= _NUCLEOTIDE_SYMBOLS else "protein"
+        self.column_variable, self.column_informative = column_flags[self.datatype]
+        self._summary = self._build_summary()
+
+    # Mapping interface (summary)
+    def __getitem__(self, key):
+        return self._summary[key]
+
+    def __iter__(self):
+        return iter(self._summary)
+
+    def __len__(self):
+        return len(self._summary)
+
+    @property
+    def num_taxa(self):
+        return len(self.taxa)
+
+    @property
+    def alignment_length(self):
+        return len(self.column_missing)
+
+    @property
+    def states(self):
+        return _DNA_STATES if self.datatype == "dna" else _PROTEIN_STATES
+
+    def composition(self, hist):
+        """
+        Returns {state: count} from a symbol-class histogram (letters are
+        case-folded and U is counted as T).
+        """
+        return {state: int(hist[ord(state) - 65]) for state in self.states}
+
+    def _gc(self, composition):
+        if self.datatype != "dna":
+            return None
+        total = sum(composition.values())
+        return round((composition["G"] + composition["C"]) / total, 4) if total else None
+
+    def _build_summary(self):
+        cells = self.num_taxa * self.alignment_length
+        missing = int(self.column_missing.sum())
+        gaps = int(self.column_gaps.sum())
+        composition = self.composition(self.partition_hist.sum(axis=0))
+        return {
+            "num_taxa": self.num_taxa,
+            "alignment_length": self.alignment_length if self.num_taxa else 0,
+            "missing_count": missing,
+            "missing_percentage": round((missing / cells) * 100, 2) if cells else 0.0,
+            "gap_count": gaps,
+            "gap_percentage": round((gaps / cells) * 100, 2) if cells else 0.0,
+            "gc_content": self._gc(composition),
+            "variable_sites": int(self.column_variable.sum()),
+            "informative_sites": int(self.column_informative.sum()),
+            "datatype": self.datatype,
+            "composition": composition,
+        }
+
+    def summary(self):
+        """
+        Returns the summary as a plain dict.
+        """
+        return dict(self._summary)
+
+    def taxon_missing_fraction(self):
+        """
+        Returns the fraction of missing cells per taxon (numpy array).
+        """
+        length = self.alignment_length
+        return self.taxon_hist[:, _MISSING] / max(length, 1)
+
+    def taxon_table(self):
+        """
+        Returns one dict per taxon: missing/gap counts and fractions, GC
+        content and base composition.
+        """
+        length = self.alignment_length
+        rows = []
+        for taxon, hist in zip(self.taxa, self.taxon_hist):
+            composition = self.composition(hist)
+            missing = int(hist[_MISSING])
+            gaps = int(hist[_GAP])
+            rows.append({
+                "taxon": taxon,
+                "missing": missing,
+                "missing_fraction": round(missing / length, 4) if length else 0.0,
+                "gaps": gaps,
+                "gap_fraction": round(gaps / length, 4) if length else 0.0,
+                "gc_content": self._gc(composition),
+                "composition": composition,
+            })
+        return rows
+
+    def partition_table(self):
+        """
+        Returns one dict per partition: length, missing/gap fractions, GC
+        content, variable and parsimony-informative sites, composition and
+        the number of taxa with any data.
+        """
+        rows = []
+        for j, ((label, start, end), hist) in enumerate(zip(self.partitions, self.partition_hist)):
+            length = max(0, end - start + 1)
+            cells = length * self.num_taxa
+            missing = int(self.column_missing[start - 1:end].sum())
+            gaps = int(self.column_gaps[start - 1:end].sum())
+            composition = self.composition(hist)
+            rows.append({
+                "label": label,
+                "start": start,
+                "end": end,
+                "length": length,
+                "taxa_present": int((self.taxon_partition_missing[:, j] < length).sum()),
+                "missing_fraction": round(missing / cells, 4) if cells else 0.0,
+                "gap_fraction": round(gaps / cells, 4) if cells else 0.0,
+                "gc_content": self._gc(composition),
+                "variable_sites": int(self.column_variable[start - 1:end].sum()),
+                "informative_sites": int(self.column_informative[start - 1:end].sum()),
+                "composition": composition,
+            })
+        return rows
+
+    def to_dict(self):
+        """
+        Returns the summary, taxon and partition tables as JSON-serialisable data.
+        """
+        return {
+            "summary": self.summary(),
+            "taxa": self.taxon_table(),
+            "partitions": self.partition_table(),
+        }
+
+
+def compute_detailed_stats(sequence_dict, partitions=None, missing_char="?", gap_char="-", jobs=1):
+    """
+    Computes AlignmentStats in one pass over the matrix.
+
+    Each partition is processed in column chunks; per chunk the cells are
+    mapped to symbol classes (letters, missing, gap, other) and a class
+    histogram per taxon and per column is built with numpy.bincount, from
+    which all metrics are derived.
+
+    With several jobs the partition table is split into contiguous shards of
+    similar length, handled by worker processes that read the matrix from a
+    shared-memory block (it is copied there once, never pickled). Partial
+    results are merged in shard order, so the output does not depend on the
+    number of workers.
+
+    Args:
+        sequence_dict (dict or Alignment): {taxon: sequence} with equal-length sequences
+        partitions (list, optional): [(gene_label, start, end), ...]; defaults
+            to the Alignment's partitions or one partition over all columns
+        missing_char (str): Missing-data character (takes precedence if equal to gap_char)
+        gap_char (str): Gap character
+        jobs (int): Worker processes used across partitions; 1 computes in
+            this process, 0 or None uses one per CPU
+
+    Returns:
+        AlignmentStats
+    """
+    from sequence_concatenator.core.alignment import Alignment, require_numpy
+
+    require_numpy()
+    if isinstance(sequence_dict, Alignment):
+        alignment = sequence_dict
+    else:
+        alignment = Alignment.from_dict(sequence_dict, partitions, missing_char)
+    if partitions is None:
+        partitions = alignment.partitions
+    if not partitions and alignment.alignment_length:
+        partitions = [("gene1", 1, alignment.alignment_length)]
+
+    lut = _class_lut(missing_char, gap_char)
+    shards = _shards(partitions, jobs)
+    if len(shards) <= 1:
+        results = [_shard_stats(alignment.matrix, partitions, shard, lut) for shard in shards]
+    else:
+        results = _pool_stats(alignment.matrix, partitions, shards, lut, jobs)
+    return _combine(alignment, partitions, missing_char, gap_char, shards, results)
+
+
+# Worker-process state: the shared matrix, set up once per worker
+_worker = {}
+
+
+def _pool_stats(matrix, partitions, shards, lut, jobs):
+    """Runs _shard_stats over the shards in a process pool, in shard order."""
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    from sequence_concatenator.core.alignment import np
+
+    workers = min(jobs or os.cpu_count() or 1, len(shards))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, matrix.nbytes))
+    try:
+        np.ndarray(matrix.shape, dtype=np.uint8, buffer=shm.buf)[...] = matrix
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(shm.name, matrix.shape, partitions, lut)
+        ) as executor:
+            return list(executor.map(_worker_shard_stats, shards))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _init_worker(name, shape, partitions, lut):
+    from multiprocessing import shared_memory
+    from sequence_concatenator.core.alignment import np
+
+    shm = shared_memory.SharedMemory(name=name)
+    _worker.update(
+        shm=shm,
+        matrix=np.ndarray(shape, dtype=np.uint8, buffer=shm.buf),
+        partitions=partitions,
+        lut=lut,
+    )
+
+
+def _worker_shard_stats(shard):
+    return _shard_stats(_worker["matrix"], _worker["partitions"], shard, _worker["lut"])
+
+
+def _class_lut(missing_char, gap_char):
+    from sequence_concatenator.core.alignment import np
+
+    lut = np.full(256, _OTHER, dtype=np.uint8)
+    for i in range(26):
+        lut[65 + i] = lut[97 + i] = i
+    lut[ord("U")] = lut[ord("u")] = ord("T") - 65
+    lut[ord(gap_char)] = _GAP
+    lut[ord(missing_char)] = _MISSING
+    return lut
+
+
+def _shards(partitions, jobs):
+    """Splits partition indices into contiguous shards of similar total length."""
+    workers = jobs or os.cpu_count() or 1
+    if workers <= 1 or len(partitions) <= 1:
+        return [list(range(len(partitions)))] if partitions else []
+    count = min(len(partitions), workers * 4)
+    total = sum(max(0, end - start + 1) for _, start, end in partitions) or 1
+    shards = [[] for _ in range(count)]
+    position = 0
+    for j, (_, start, end) in enumerate(partitions):
+        shards[min(count - 1, position * count // total)].append(j)
+        position += max(0, end - start + 1)
+    return [shard for shard in shards if shard]
+
+
+def _state_flags(col_hist, states):
+    counts = col_hist[:, [ord(s) - 65 for s in states]]
+    variable = (counts > 0).sum(axis=1) >= 2
+    informative = (counts >= 2).sum(axis=1) >= 2
+    return variable, informative
+
+
+def _shard_stats(matrix, partitions, shard, lut):
+    """
+    Statistics for a contiguous group of partitions.
+
+    Returns:
+        dict of partial results (taxon histogram summed over the shard, and
+        per-partition and per-column arrays covering the shard)
+    """
+    from sequence_concatenator.core.alignment import np
+
+    num_taxa = matrix.shape[0]
+    row_offsets = (np.arange(num_taxa, dtype=np.int32) * _NUM_CLASSES)[:, None]
+    taxon_hist = np.zeros((num_taxa, _NUM_CLASSES), dtype=np.int64)
+    partition_hist = np.zeros((len(shard), _NUM_CLASSES), dtype=np.int64)
+    taxon_partition_missing = np.zeros((num_taxa, len(shard)), dtype=np.int64)
+    first = partitions[shard[0]][1] - 1
+    last = max(first, partitions[shard[-1]][2])
+    width = last - first
+    column_missing = np.zeros(width, dtype=np.int32)
+    column_gaps = np.zeros(width, dtype=np.int32)
+    flags = {kind: (np.zeros(width, dtype=bool), np.zeros(width, dtype=bool)) for kind in ("dna", "protein")}
+    step = max(1, _CHUNK_CELLS // max(1, num_taxa))
+
+    for k, j in enumerate(shard):
+        _, start, end = partitions[j]
+        for c0 in range(start - 1, end, step):
+            c1 = min(end, c0 + step)
+            codes = lut[matrix[:, c0:c1]].astype(np.int32)
+            w = c1 - c0
+
+            hist = np.bincount(
+                (codes + row_offsets).ravel(), minlength=num_taxa * _NUM_CLASSES
+            ).reshape(num_taxa, _NUM_CLASSES)
+            taxon_hist += hist
+            partition_hist[k] += hist.sum(axis=0)
+            taxon_partition_missing[:, k] += hist[:, _MISSING]
+
+            col_hist = np.bincount(
+                (codes + np.arange(w, dtype=np.int32) * _NUM_CLASSES).ravel(),
+                minlength=w * _NUM_CLASSES
+            ).reshape(w, _NUM_CLASSES)
+            local = slice(c0 - first, c1 - first)
+            column_missing[local] = col_hist[:, _MISSING]
+            column_gaps[local] = col_hist[:, _GAP]
+            for kind, states in (("dna", _DNA_STATES), ("protein", _PROTEIN_STATES)):
+                variable, informative = _state_flags(col_hist, states)
+                flags[kind][0][local] = variable
+                flags[kind][1][local] = informative
+
+    return {
+        "taxon_hist": taxon_hist,
+        "partition_hist": partition_hist,
+        "taxon_partition_missing": taxon_partition_missing,
+        "first": first,
+        "column_missing": column_missing,
+        "column_gaps": column_gaps,
+        "flags": flags,
+    }
+
+
+def _combine(alignment, partitions, missing_char, gap_char, shards, results):
+    from sequence_concatenator.core.alignment import np
+
+    num_taxa = alignment.num_taxa
+    length = alignment.alignment_length
+    taxon_hist = np.zeros((num_taxa, _NUM_CLASSES), dtype=np.int64)
+    partition_hist = np.zeros((len(partitions), _NUM_CLASSES), dtype=np.int64)
+    taxon_partition_missing = np.zeros((num_taxa, len(partitions)), dtype=np.int64)
+    column_missing = np.zeros(length, dtype=np.int32)
+    column_gaps = np.zeros(length, dtype=np.int32)
+    flags = {kind: (np.zeros(length, dtype=bool), np.zeros(length, dtype=bool)) for kind in ("dna", "protein")}
+
+    for shard, result in zip(shards, results):
+        taxon_hist += result["taxon_hist"]
+        partition_hist[shard] = result["partition_hist"]
+        taxon_partition_missing[:, shard] = result["taxon_partition_missing"]
+        span = slice(result["first"], result["first"] + len(result["column_missing"]))
+        column_missing[span] = result["column_missing"]
+        column_gaps[span] = result["column_gaps"]
+        for kind in flags:
+            flags[kind][0][span] = result["flags"][kind][0]
+            flags[kind][1][span] = result["flags"][kind][1]
+
+    return AlignmentStats(
+        alignment.taxa, partitions, missing_char, gap_char, taxon_hist, partition_hist,
+        taxon_partition_missing, column_missing, column_gaps, flags
+    )
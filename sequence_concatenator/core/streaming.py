@@ -0,0 +1,352 @@
+from collections import OrderedDict
+
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.readers.loader import read_file_auto
+from sequence_concatenator.readers.registry import detect_format
+from sequence_concatenator.utils.file_utils import compressed_path, get_compression
+from sequence_concatenator.writers.fasta_writer import DEFAULT_LINE_WIDTH, write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+
+MAX_OPEN_FILES = 64
+# Rows assembled together by iter_rows, in bytes
+ROW_BATCH_BYTES = 1 << 26
+
+
+class UnreadableInputs(IOError):
+    """
+    Raised by index_inputs when input files cannot be read; `errors` lists
+    (path, error_message) pairs as returned by read_files.
+    """
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} input files could not be read")
+        self.errors = errors
+
+
+class FastaLocusIndex:
+    """
+    Byte-offset index of one FASTA locus: sequences are re-read from disk on
+    demand, so only the index (taxon -> offsets and length) stays in memory.
+    """
+
+    def __init__(self, path, entries):
+        self.path = path
+        self.entries = entries  # {taxon: (start_offset, end_offset, seq_length)}
+        self.lengths = {taxon: entry[2] for taxon, entry in entries.items()}
+
+    def read(self, taxon, handles):
+        entry = self.entries.get(taxon)
+        if entry is None:
+            return None
+        start, end, _ = entry
+        handle = handles.get(self.path)
+        handle.seek(start)
+        return b"".join(handle.read(end - start).split()).decode("ascii")
+
+
+class InMemoryLocusIndex:
+    """
+    Fallback for inputs that cannot be indexed by offset (NEXUS, GenBank,
+    compressed files and FASTA the fast parser rejects); the parsed locus is
+    held in memory.
+    """
+
+    def __init__(self, path, sequences):
+        self.path = path
+        self.sequences = sequences
+        self.lengths = {taxon: len(seq) for taxon, seq in sequences.items()}
+
+    def read(self, taxon, handles):
+        return self.sequences.get(taxon)
+
+
+class SupermatrixLocusIndex:
+    """
+    One partition of a binary .sqm input; rows are sliced from its memory map.
+    """
+
+    def __init__(self, matrix, start, end):
+        self.path = matrix.path
+        self.matrix = matrix
+        self.start = start
+        self.end = end
+        self.lengths = dict.fromkeys(matrix.taxa, end - start + 1)
+
+    def read(self, taxon, handles):
+        if taxon not in self.matrix:
+            return None
+        return self.matrix.row(taxon, self.start, self.end)
+
+
+class RenamedLocusIndex:
+    """
+    Presents another locus index under reconciled taxon names.
+    """
+
+    def __init__(self, locus, mapping):
+        self.path = locus.path
+        self.locus = locus
+        self.names = {taxon: name for name, taxon in mapping.items()}
+        self.lengths = {taxon: locus.lengths[name] for name, taxon in mapping.items()}
+
+    def read(self, taxon, handles):
+        name = self.names.get(taxon)
+        return None if name is None else self.locus.read(name, handles)
+
+
+class _HandlePool:
+    """Keeps a bounded number of input files open, closing the least recently used."""
+
+    def __init__(self, limit=MAX_OPEN_FILES):
+        self.limit = limit
+        self.handles = OrderedDict()
+
+    def get(self, path):
+        handle = self.handles.pop(path, None)
+        if handle is None:
+            if len(self.handles) >= self.limit:
+                _, oldest = self.handles.popitem(last=False)
+                oldest.close()
+            handle = open(path, "rb")
+        self.handles[path] = handle
+        return handle
+
+    def close(self):
+        for handle in self.handles.values():
+            handle.close()
+        self.handles.clear()
+
+
+def index_fasta(path):
+    """
+    Scans a FASTA file once, recording where each record's sequence lies.
+
+    Args:
+        path (str): Path to the FASTA file
+
+    Returns:
+        dict: {taxon: (start_offset, end_offset, seq_length)}, or None if the
+        file needs the full parser (text before the first header, non-ASCII
+        headers or sequence lines)
+    """
+    entries = {}
+    taxon = None
+    start = length = 0
+    offset = 0
+    with open(path, "rb", buffering=1 << 20) as handle:
+        for line in handle:
+            if line.startswith(b">"):
+                if taxon is not None:
+                    entries[taxon] = (start, offset, length)
+                words = line[1:].split(None, 1)
+                try:
+                    taxon = words[0].decode("ascii") if words else ""
+                except UnicodeDecodeError:
+                    return None
+                start = offset + len(line)
+                length = 0
+            elif taxon is not None:
+                if not line.isascii():
+                    return None
+                length += len(line) - sum(line.count(ws) for ws in (b" ", b"\t", b"\r", b"\n"))
+            elif line.strip():
+                return None
+            offset += len(line)
+    if taxon is not None:
+        entries[taxon] = (start, offset, length)
+    return entries
+
+
+def index_inputs(paths, reader="fast", check_lengths=False):
+    """
+    Builds a locus index for every input file.
+
+    Every file is tried, so that all unreadable inputs are reported together.
+
+    Args:
+        paths (list of str): Input file paths, in partition order
+        reader (str): FASTA parser used for inputs that need full parsing
+        check_lengths (bool): Fail if sequences within a FASTA input differ in length
+
+    Returns:
+        list: FastaLocusIndex or InMemoryLocusIndex per input, and one
+        SupermatrixLocusIndex per partition of each binary supermatrix input
+
+    Raises:
+        UnreadableInputs: If any input cannot be read
+    """
+    loci = []
+    errors = []
+    for path in paths:
+        try:
+            loci.extend(_index_one(path, reader, check_lengths))
+        except Exception as e:
+            errors.append((path, str(e)))
+    if errors:
+        raise UnreadableInputs(errors)
+    return loci
+
+
+def _index_one(path, reader, check_lengths):
+    entries = None
+    fmt = detect_format(path)
+    if fmt == "supermatrix":
+        from sequence_concatenator.readers.binary_reader import SupermatrixFile
+
+        matrix = SupermatrixFile(path)
+        return [SupermatrixLocusIndex(matrix, start, end) for _, start, end in matrix.partitions]
+    if fmt == "fasta" and reader == "fast" and get_compression(path) is None:
+        try:
+            entries = index_fasta(path)
+        except OSError as e:
+            raise IOError(f"Failed to read FASTA file '{path}': {e}")
+    if entries is None:
+        return [InMemoryLocusIndex(path, read_file_auto(path, reader=reader, check_lengths=check_lengths))]
+    if check_lengths and entries:
+        expected = next(iter(entries.values()))[2]
+        for taxon, (_, _, length) in entries.items():
+            if length != expected:
+                raise ValueError(
+                    f"Failed to parse FASTA file '{path}': Inconsistent sequence lengths: "
+                    f"'{taxon}' has {length}, expected {expected}"
+                )
+    return [FastaLocusIndex(path, entries)]
+
+
+def reconcile_loci(loci, reconciler):
+    """
+    Renames the taxa of each locus index with a TaxonReconciler.
+
+    Returns:
+        tuple: (list of RenamedLocusIndex, ReconciliationReport)
+    """
+    renames, report = reconciler.plan(locus.lengths for locus in loci)
+    return [RenamedLocusIndex(locus, mapping) for locus, mapping in zip(loci, renames)], report
+
+
+def plan_supermatrix(loci):
+    """
+    Derives taxa order and partitions from locus indexes, matching merge_sequences.
+
+    Returns:
+        tuple: (list of taxa in first-seen order, [(gene_label, start, end), ...])
+    """
+    taxa = {}
+    partitions = []
+    start = 1
+    for idx, locus in enumerate(loci):
+        taxa.update(dict.fromkeys(locus.lengths))
+        gene_len = max(locus.lengths.values()) if locus.lengths else 0
+        end = start + gene_len - 1
+        partitions.append((f"gene{idx+1}", start, end))
+        start = end + 1
+    return list(taxa), partitions
+
+
+def iter_rows(loci, partitions, taxa, placeholder="?", batch_bytes=ROW_BATCH_BYTES):
+    """
+    Yields (taxon, concatenated_row) in the order of `taxa`.
+
+    Rows are assembled for a batch of taxa at a time (about `batch_bytes` of
+    rows), reading each locus for the whole batch while its file is open, so
+    every input is opened once per batch rather than once per taxon.
+    """
+    nchar = partitions[-1][2] if partitions else 0
+    batch_size = max(1, batch_bytes // max(1, nchar))
+    handles = _HandlePool()
+    try:
+        for first in range(0, len(taxa), batch_size):
+            batch = taxa[first:first + batch_size]
+            rows = {taxon: [] for taxon in batch}
+            for locus, (_, start, end) in zip(loci, partitions):
+                gene_len = end - start + 1
+                for taxon, parts in rows.items():
+                    seq = locus.read(taxon, handles)
+                    if seq is None:
+                        parts.append(placeholder * gene_len)
+                    else:
+                        parts.append(seq + placeholder * (gene_len - len(seq)))
+            for taxon in batch:
+                yield taxon, "".join(rows.pop(taxon))
+    finally:
+        handles.close()
+
+
+def stream_concatenate(paths, out_base, placeholder="?", nexus=False, reader="fast",
+                       line_width=DEFAULT_LINE_WIDTH, compress=None, check_lengths=False):
+    """
+    Concatenates input files without holding the supermatrix in memory.
+
+    Writes <out_base>.fasta, <out_base>_partition.txt and optionally
+    <out_base>.nex, byte-identical to the in-memory pipeline. Peak memory is
+    one batch of rows (see iter_rows) plus the locus indexes (and any loci
+    that are not FASTA).
+
+    Args:
+        paths (list of str): Input file paths
+        out_base (str): Base name for output files (no extension)
+        placeholder (str): Placeholder for missing data
+        nexus (bool): Also write a NEXUS file
+        reader (str): FASTA parser, "fast" or "biopython"
+        line_width (int): Residues per FASTA line; 0 for no wrapping
+        compress (str, optional): "gzip" or "zstd" to compress the outputs
+            (adds .gz/.zst to each file name)
+        check_lengths (bool): Fail if sequences within a FASTA input differ in length
+
+    Returns:
+        tuple: (partitions, stats dict as returned by compute_alignment_stats)
+
+    Raises:
+        UnreadableInputs: If any input cannot be read
+    """
+    loci = index_inputs(paths, reader=reader, check_lengths=check_lengths)
+    return stream_loci(loci, out_base, placeholder, nexus, line_width, compress)
+
+
+def stream_loci(loci, out_base, placeholder="?", nexus=False, line_width=DEFAULT_LINE_WIDTH,
+                compress=None):
+    """
+    Writes the outputs of stream_concatenate from prepared locus indexes
+    (e.g. after reconcile_loci).
+
+    Returns:
+        tuple: (partitions, stats dict as returned by compute_alignment_stats)
+    """
+    taxa, partitions = plan_supermatrix(loci)
+    nchar = partitions[-1][2] if partitions else 0
+
+    missing_count = 0
+
+    def counted_rows():
+        nonlocal missing_count
+        for taxon, row in iter_rows(loci, partitions, taxa, placeholder):
+            missing_count += row.count(placeholder)
+            yield taxon, row
+
+    write_fasta(
+        counted_rows(), compressed_path(out_base + ".fasta", compress),
+        line_width=line_width, compress=compress
+    )
+
+    partition_text = generate_partition_file(partitions, codon=True)
+    write_partition_file(
+        partition_text, compressed_path(out_base + "_partition.txt", compress), compress=compress
+    )
+
+    if nexus and taxa:
+        nexus_taxa = sorted(taxa)
+        write_nexus(
+            iter_rows(loci, partitions, nexus_taxa, placeholder),
+            compressed_path(out_base + ".nex", compress),
+            partition_text, taxa=nexus_taxa, nchar=nchar, compress=compress
+        )
+
+    total = len(taxa) * nchar
+    stats = {
+        "num_taxa": len(taxa),
+        "alignment_length": nchar if taxa else 0,
+        "missing_count": missing_count,
+        "missing_percentage": round((missing_count / total) * 100, 2) if total else 0.0
+    }
+    return partitions, stats
@@ -0,0 +1,167 @@
+import csv
+import re
+from collections import namedtuple
+
+ReconciliationReport = namedtuple("ReconciliationReport", ["renamed", "merged", "conflicts"])
+ReconciliationReport.__doc__ = """
+Outcome of reconciling taxon names across loci.
+
+    renamed (dict): {raw_name: (taxon, source)} for every name that changed;
+        source is "accession", "rule" or "synonym"
+    merged (dict): {taxon: [raw_name, ...]} for taxa that several distinct
+        input names were merged into
+    conflicts (list): [(locus_index, taxon, kept_name, [dropped_name, ...]), ...]
+        where one locus had several records for the same taxon; the first
+        record is kept
+"""
+
+
+class TaxonReconciler:
+    """
+    Maps input taxon names to canonical taxa.
+
+    Each name is resolved in this order: the accession table (exact name, then
+    the name without its ".version" suffix), otherwise the regex rules in
+    order followed by the synonym table. Resolutions are memoized, so every
+    distinct name is resolved once and reconciling is linear in the number of
+    records.
+    """
+
+    def __init__(self, rules=(), synonyms=None, accessions=None):
+        """
+        Args:
+            rules (iterable): [(pattern, replacement), ...] applied with re.sub
+            synonyms (dict, optional): {alias: taxon}
+            accessions (dict, optional): {accession: taxon}
+        """
+        self.rules = [(re.compile(pattern), replacement) for pattern, replacement in rules]
+        self.synonyms = dict(synonyms or {})
+        self.accessions = dict(accessions or {})
+        self._resolved = {}
+
+    @classmethod
+    def from_files(cls, rules_path=None, synonyms_path=None, accessions_path=None):
+        """
+        Builds a reconciler from two-column (tab- or comma-separated) files.
+        Blank lines and lines starting with '#' are ignored.
+        """
+        return cls(
+            rules=load_table(rules_path) if rules_path else (),
+            synonyms=dict(load_table(synonyms_path)) if synonyms_path else None,
+            accessions=dict(load_table(accessions_path)) if accessions_path else None,
+        )
+
+    def resolve(self, name):
+        """
+        Returns (taxon, source) for an input name; source is None if unchanged.
+        """
+        resolved = self._resolved.get(name)
+        if resolved is None:
+            resolved = self._resolved[name] = self._resolve(name)
+        return resolved
+
+    def canonical(self, name):
+        """
+        Returns the canonical taxon for an input name.
+        """
+        return self.resolve(name)[0]
+
+    def _resolve(self, name):
+        if self.accessions:
+            taxon = self.accessions.get(name)
+            if taxon is None and "." in name:
+                taxon = self.accessions.get(name.rsplit(".", 1)[0])
+            if taxon is not None:
+                return taxon, "accession"
+        taxon = name
+        for pattern, replacement in self.rules:
+            taxon = pattern.sub(replacement, taxon)
+        source = "rule" if taxon != name else None
+        if taxon in self.synonyms:
+            taxon, source = self.synonyms[taxon], "synonym"
+        return taxon, source
+
+    def plan(self, names_per_locus):
+        """
+        Builds a rename map per locus.
+
+        Args:
+            names_per_locus (iterable): Taxon names of each locus, in order
+
+        Returns:
+            tuple:
+                - list: [{raw_name: taxon}, ...] per locus; names dropped
+                  because of a conflict are left out
+                - ReconciliationReport
+        """
+        renames = []
+        renamed = {}
+        sources = {}
+        conflicts = []
+        for locus_index, names in enumerate(names_per_locus):
+            mapping = {}
+            kept = {}
+            dropped = {}
+            for name in names:
+                taxon, source = self.resolve(name)
+                if source is not None:
+                    renamed[name] = (taxon, source)
+                if taxon in kept:
+                    dropped.setdefault(taxon, []).append(name)
+                    continue
+                kept[taxon] = name
+                mapping[name] = taxon
+                sources.setdefault(taxon, {})[name] = None
+            for taxon, names_dropped in dropped.items():
+                conflicts.append((locus_index, taxon, kept[taxon], names_dropped))
+            renames.append(mapping)
+        merged = {taxon: list(names) for taxon, names in sources.items() if len(names) > 1}
+        return renames, ReconciliationReport(renamed, merged, conflicts)
+
+    def apply(self, sequence_dicts):
+        """
+        Renames the taxa of each locus.
+
+        Args:
+            sequence_dicts (list of dict): [{taxon: sequence}, ...]
+
+        Returns:
+            tuple: (list of renamed dicts, ReconciliationReport)
+        """
+        renames, report = self.plan(sequence_dicts)
+        reconciled = [
+            {taxon: seq_dict[name] for name, taxon in mapping.items()}
+            for seq_dict, mapping in zip(sequence_dicts, renames)
+        ]
+        return reconciled, report
+
+
+def load_table(path):
+    """
+    Reads a two-column tab- or comma-separated file.
+
+    Returns:
+        list: [(first, second), ...] in file order
+
+    Raises:
+        ValueError: If a line does not have two columns
+    """
+    with open(path, newline="") as f:
+        lines = [line for line in f if line.strip() and not line.lstrip().startswith("#")]
+    delimiter = "\t" if lines and "\t" in lines[0] else ","
+    rows = []
+    for number, row in enumerate(csv.reader(lines, delimiter=delimiter), start=1):
+        if len(row) != 2:
+            raise ValueError(f"{path}: expected 2 columns, found {len(row)} in row {number}")
+        rows.append((row[0].strip(), row[1].strip()))
+    return rows
+
+
+def summarize_report(report):
+    """
+    Returns a one-line summary of a ReconciliationReport.
+    """
+    return (
+        f"{len(report.renamed)} names renamed, {len(report.merged)} taxa merged "
+        f"from several names, {len(report.conflicts)} conflicts"
+    )
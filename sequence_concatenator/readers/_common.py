@@ -0,0 +1,2 @@
+class _NeedsFallback(Exception):
+    """Raised by a fast parser for input it does not handle; its reader falls back to Biopython."""
@@ -0,0 +1,193 @@
+import json
+import mmap
+from collections.abc import Mapping
+
+from sequence_concatenator.core.alignment import Alignment, np, require_numpy
+from sequence_concatenator.writers.binary_writer import (
+    DATA_ALIGNMENT, ENCODINGS, FORMAT_VERSION, HEADER, MAGIC
+)
+
+
+def read_supermatrix(file_path, reader="fast"):
+    """
+    Reads a binary .sqm supermatrix into a {taxon: sequence} dict.
+
+    Args:
+        file_path (str): Path to the .sqm file
+        reader (str): Accepted for interface compatibility; there is one reader.
+
+    Returns:
+        dict: A dictionary where keys are taxa names and values are sequences (as strings).
+    """
+    try:
+        with SupermatrixFile(file_path) as matrix:
+            return matrix.to_dict()
+    except Exception as e:
+        raise IOError(f"Failed to read supermatrix file '{file_path}': {e}")
+
+
+def read_supermatrix_partitions(file_path):
+    """
+    Returns the partition table stored in a .sqm file without mapping its matrix.
+
+    Returns:
+        list: [(gene_label, start, end), ...]
+    """
+    with open(file_path, "rb") as f:
+        header = _read_header(f)
+    return [tuple(p) for p in header["partitions"]]
+
+
+class SupermatrixFile(Mapping):
+    """
+    Memory-mapped view of a binary .sqm supermatrix.
+
+    Behaves like a read-only {taxon: sequence} dict, so it can be passed to the
+    FASTA and NEXUS writers; each access decodes only the bytes it needs, so
+    a taxon row or a partition's columns cost time proportional to the slice.
+    """
+
+    def __init__(self, file_path):
+        self.path = file_path
+        self._file = open(file_path, "rb")
+        try:
+            header = _read_header(self._file)
+            self.taxa = header["taxa"]
+            self.partitions = [tuple(p) for p in header["partitions"]]
+            self.nchar = header["nchar"]
+            self.encoding = header["encoding"]
+            self.alphabet = header["alphabet"].encode("latin-1")
+            self.row_stride = header["row_stride"]
+            self.data_offset = header["data_offset"]
+            if self.encoding not in ENCODINGS:
+                raise ValueError(f"Unknown supermatrix encoding: {self.encoding}")
+            if self.encoding != "byte":
+                require_numpy()
+            expected = self.data_offset + self.row_stride * len(self.taxa)
+            if self.taxa and self.nchar:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if len(self._map) < expected:
+                    raise ValueError("Truncated supermatrix file")
+            else:
+                self._map = b""
+        except Exception:
+            self._file.close()
+            raise
+        self._index = {taxon: i for i, taxon in enumerate(self.taxa)}
+        self._per_byte = ENCODINGS[self.encoding]
+        if self._per_byte > 1:
+            self._symbols = np.frombuffer(self.alphabet.ljust(1 << (8 // self._per_byte), b"?"), dtype=np.uint8)
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Mapping interface
+    def __getitem__(self, taxon):
+        return self.row(taxon)
+
+    def __iter__(self):
+        return iter(self.taxa)
+
+    def __len__(self):
+        return len(self.taxa)
+
+    def __contains__(self, taxon):
+        return taxon in self._index
+
+    def row(self, taxon, start=1, end=None):
+        """
+        Returns one taxon's sequence, or its columns start..end (1-based, inclusive).
+
+        Raises:
+            KeyError: If the taxon is not in the matrix
+        """
+        return self.row_bytes(taxon, start, end).decode("ascii")
+
+    def row_bytes(self, taxon, start=1, end=None):
+        """
+        Returns one taxon's columns start..end (1-based, inclusive) as bytes.
+        """
+        end = self.nchar if end is None else min(end, self.nchar)
+        if end < start:
+            return b""
+        base = self.data_offset + self._index[taxon] * self.row_stride
+        first, last = start - 1, end  # 0-based half-open columns
+        per_byte = self._per_byte
+        if per_byte == 1:
+            return self._map[base + first:base + last]
+        data = self._map[base + first // per_byte:base + -(-last // per_byte)]
+        symbols = self._symbols[unpack_codes(data, per_byte)]
+        skip = first % per_byte
+        return symbols[skip:skip + last - first].tobytes()
+
+    def columns(self, start, end, taxa=None):
+        """
+        Returns columns start..end (1-based, inclusive) for the given taxa (default: all).
+
+        Returns:
+            dict: {taxon: sequence}
+        """
+        return {taxon: self.row(taxon, start, end) for taxon in (taxa or self.taxa)}
+
+    def partition(self, label, taxa=None):
+        """
+        Returns one partition's columns by its label (e.g. "gene2").
+
+        Raises:
+            KeyError: If no partition has this label
+        """
+        for name, start, end in self.partitions:
+            if name == label:
+                return self.columns(start, end, taxa)
+        raise KeyError(label)
+
+    def to_dict(self):
+        """
+        Returns a plain {taxon: sequence} dict.
+        """
+        return {taxon: self.row(taxon) for taxon in self.taxa}
+
+    def to_alignment(self, placeholder="?"):
+        """
+        Unpacks the whole matrix into an Alignment.
+        """
+        require_numpy()
+        matrix = np.empty((len(self.taxa), self.nchar), dtype=np.uint8)
+        for i, taxon in enumerate(self.taxa):
+            matrix[i] = np.frombuffer(self.row_bytes(taxon), dtype=np.uint8)
+        return Alignment(self.taxa, matrix, self.partitions, placeholder)
+
+
+def unpack_codes(data, per_byte):
+    """
+    Inverse of binary_writer.pack_codes: expands packed bytes into symbol codes.
+
+    Returns:
+        numpy.ndarray: uint8 array of length len(data) * per_byte
+    """
+    packed = np.frombuffer(data, dtype=np.uint8)
+    bits = 8 // per_byte
+    mask = (1 << bits) - 1
+    codes = np.empty((len(packed), per_byte), dtype=np.uint8)
+    for i in range(per_byte):
+        codes[:, i] = (packed >> (8 - bits * (i + 1))) & mask
+    return codes.ravel()
+
+
+def _read_header(handle):
+    magic, version, length = HEADER.unpack(handle.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a binary supermatrix file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported supermatrix format version {version}")
+    header = json.loads(handle.read(length).decode("utf-8"))
+    header["data_offset"] = -(-(HEADER.size + length) // DATA_ALIGNMENT) * DATA_ALIGNMENT
+    return header
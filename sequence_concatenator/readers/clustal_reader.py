@@ -0,0 +1,77 @@
+from sequence_concatenator.readers._common import _NeedsFallback
+from sequence_concatenator.utils.file_utils import open_input
+
+# First words of the header line written by Clustal-compatible aligners
+CLUSTAL_HEADERS = (b"CLUSTAL", b"MUSCLE", b"PROBCONS", b"MSAPROBS", b"Kalign")
+
+
+def read_clustal(file_path, reader="fast"):
+    """
+    Reads aligned sequences from a Clustal (.aln) file.
+
+    Args:
+        file_path (str): Path to the Clustal file (optionally gzip/zstd-compressed).
+        reader (str): "fast" for the built-in parser, or "biopython" to parse
+            with Bio.AlignIO. The fast parser falls back to Biopython for
+            input it does not recognise.
+
+    Returns:
+        dict: A dictionary where keys are taxa names and values are sequences (as strings).
+    """
+    try:
+        if reader == "fast":
+            try:
+                with open_input(file_path) as handle:
+                    return parse_clustal(handle)
+            except _NeedsFallback:
+                return _read_biopython(file_path)
+        elif reader == "biopython":
+            return _read_biopython(file_path)
+        else:
+            raise ValueError(f"Unknown Clustal reader: {reader}")
+
+    except Exception as e:
+        raise IOError(f"Failed to parse Clustal file '{file_path}': {e}")
+
+
+def parse_clustal(lines):
+    """
+    Parses Clustal from an iterable of byte lines: the header, then blocks of
+    "name sequence [count]" lines, each followed by a conservation line.
+
+    Returns:
+        dict: {taxon: sequence}
+    """
+    lines = iter(lines)
+    for header in lines:
+        if header.strip():
+            break
+    else:
+        raise _NeedsFallback("empty file")
+    if not header.startswith(CLUSTAL_HEADERS):
+        raise _NeedsFallback("missing CLUSTAL header")
+
+    chunks = {}
+    for line in lines:
+        if not line.strip() or line[:1] in b" \t":
+            continue  # block separator or conservation line
+        words = line.split()
+        if len(words) < 2 or len(words) > 3:
+            raise _NeedsFallback("unexpected sequence line")
+        chunks.setdefault(words[0], []).append(words[1])
+
+    try:
+        return {
+            taxon.decode("ascii"): b"".join(parts).decode("ascii")
+            for taxon, parts in chunks.items()
+        }
+    except UnicodeDecodeError:
+        raise _NeedsFallback("non-ASCII content")
+
+
+def _read_biopython(file_path):
+    from Bio import AlignIO
+
+    with open_input(file_path, "r") as handle:
+        alignment = AlignIO.read(handle, "clustal")
+    return {record.id: str(record.seq) for record in alignment}
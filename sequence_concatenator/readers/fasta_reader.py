@@ -1,20 +1,131 @@
-from Bio import SeqIO
+import mmap
+import os
 
-def read_fasta(file_path):
+from sequence_concatenator.readers._common import _NeedsFallback
+from sequence_concatenator.utils.file_utils import get_compression, open_input
+
+
+def read_fasta(file_path, reader="fast", check_lengths=False, use_mmap=False):
     """
     Reads aligned sequences from a FASTA file.
 
     Args:
-        file_path (str): Path to the FASTA file.
+        file_path (str): Path to the FASTA file (optionally gzip/zstd-compressed).
+        reader (str): "fast" for the built-in byte-level parser, or "biopython"
+            to parse with Bio.SeqIO. The fast parser falls back to Biopython for
+            input it does not recognise (e.g. text before the first header).
+        check_lengths (bool): If True, fail unless all sequences have equal length.
+        use_mmap (bool): If True, read the file through a memory map.
 
     Returns:
         dict: A dictionary where keys are sequence IDs and values are sequences (as strings).
     """
     sequences = {}
     try:
-        for record in SeqIO.parse(file_path, "fasta"):
-            sequences[record.id] = str(record.seq)
+        if reader == "fast":
+            try:
+                records = list(iter_fasta_file(file_path, check_lengths, use_mmap))
+            except _NeedsFallback:
+                records = _iter_biopython(file_path, check_lengths)
+        elif reader == "biopython":
+            records = _iter_biopython(file_path, check_lengths)
+        else:
+            raise ValueError(f"Unknown FASTA reader: {reader}")
+        for taxon, sequence in records:
+            sequences[taxon] = sequence
     except Exception as e:
         raise IOError(f"Failed to parse FASTA file '{file_path}': {e}")
-    
+
     return sequences
+
+
+def iter_fasta_file(file_path, check_lengths=False, use_mmap=False):
+    """
+    Yields (taxon, sequence) pairs from a FASTA file in a single pass.
+
+    Args:
+        file_path (str): Path to the FASTA file (optionally gzip/zstd-compressed).
+        check_lengths (bool): If True, raise ValueError on the first sequence
+            whose length differs from the first one.
+        use_mmap (bool): If True, read the file through a memory map
+            (ignored for compressed files).
+    """
+    if use_mmap and get_compression(file_path) is None:
+        with open(file_path, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size > 0:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from iter_fasta(iter(mapped.readline, b""), check_lengths)
+        return
+    with open_input(file_path) as handle:
+        yield from iter_fasta(handle, check_lengths)
+
+
+def iter_fasta(lines, check_lengths=False):
+    """
+    Yields (taxon, sequence) pairs from an iterable of FASTA byte lines.
+
+    The taxon is the first whitespace-delimited word of the header, matching
+    Bio.SeqIO's record.id; whitespace inside sequence lines is dropped.
+
+    Raises:
+        ValueError: If check_lengths is set and sequence lengths differ
+    """
+    expected_length = None
+    taxon = None
+    chunks = []
+
+    for line in lines:
+        if line.startswith(b">"):
+            if taxon is not None:
+                sequence = _finish_record(taxon, chunks)
+                expected_length = _check_length(taxon, sequence, expected_length, check_lengths)
+                yield taxon, sequence
+            words = line[1:].split(None, 1)
+            taxon = _decode(words[0]) if words else ""
+            chunks = []
+        elif taxon is not None:
+            chunks.append(line)
+        elif line.strip():
+            raise _NeedsFallback("content before first FASTA header")
+
+    if taxon is not None:
+        sequence = _finish_record(taxon, chunks)
+        _check_length(taxon, sequence, expected_length, check_lengths)
+        yield taxon, sequence
+
+
+def _finish_record(taxon, chunks):
+    data = b"".join(chunks)
+    if b" " in data or b"\t" in data or b"\r" in data:
+        data = b"".join(data.split())
+    else:
+        data = data.replace(b"\n", b"")
+    return _decode(data)
+
+
+def _check_length(taxon, sequence, expected_length, check_lengths):
+    if expected_length is None:
+        return len(sequence)
+    if check_lengths and len(sequence) != expected_length:
+        raise ValueError(
+            f"Inconsistent sequence lengths: '{taxon}' has {len(sequence)}, expected {expected_length}"
+        )
+    return expected_length
+
+
+def _decode(data):
+    try:
+        return data.decode("ascii")
+    except UnicodeDecodeError:
+        raise _NeedsFallback("non-ASCII content")
+
+
+def _iter_biopython(file_path, check_lengths=False):
+    from Bio import SeqIO
+
+    expected_length = None
+    with open_input(file_path, "r") as handle:
+        for record in SeqIO.parse(handle, "fasta"):
+            sequence = str(record.seq)
+            expected_length = _check_length(record.id, sequence, expected_length, check_lengths)
+            yield record.id, sequence
@@ -1,22 +1,118 @@
-from Bio import SeqIO
+import io
+import warnings
+from collections import namedtuple
 
-def read_genbank(file_path):
+from sequence_concatenator.utils.file_utils import open_input
+
+GenBankRecord = namedtuple("GenBankRecord", ["label", "organism", "record_id", "sequence"])
+GenBankRecord.__doc__ = """
+One GenBank record as seen by the scanner.
+
+    label (str): Taxon label (first word of the organism, else the record ID)
+    organism (str or None): ORGANISM line
+    record_id (str): VERSION, ACCESSION or LOCUS name
+    sequence (str): Uppercase ORIGIN sequence
+"""
+
+_SEQUENCE_JUNK = b"0123456789 \t\r\n"
+
+
+class GenBankLabelCollisionWarning(UserWarning):
+    """Several records in one GenBank file map to the same taxon label."""
+
+
+def read_genbank(file_path, reader="fast"):
     """
     Reads aligned sequences from a GenBank (.gbff) file.
     Uses the organism name as the taxon label.
 
+    When two records share a label the last one wins, as before, and a
+    GenBankLabelCollisionWarning lists the affected labels.
+
     Args:
-        file_path (str): Path to the GenBank file.
+        file_path (str): Path to the GenBank file (optionally gzip/zstd-compressed).
+        reader (str): "fast" for the built-in line scanner, or "biopython" to
+            parse with Bio.SeqIO.
 
     Returns:
         dict: A dictionary where keys are organism names and values are sequences (as strings).
     """
     sequences = {}
     try:
-        for record in SeqIO.parse(file_path, "genbank"):
-            organism = record.annotations.get("organism", record.id).split()[0]  # Get just "Taxon1"
-            sequences[organism] = str(record.seq)
+        if reader == "fast":
+            records = scan_genbank(file_path)
+        elif reader == "biopython":
+            records = _iter_biopython(file_path)
+        else:
+            raise ValueError(f"Unknown GenBank reader: {reader}")
+
+        collisions = set()
+        for record in records:
+            if record.label in sequences:
+                collisions.add(record.label)
+            sequences[record.label] = record.sequence
     except Exception as e:
         raise IOError(f"Failed to parse GenBank file '{file_path}': {e}")
-    
+
+    if collisions:
+        warnings.warn(
+            f"{file_path}: several records share the taxon label(s) "
+            f"{', '.join(sorted(collisions))}; keeping the last of each",
+            GenBankLabelCollisionWarning
+        )
     return sequences
+
+
+def scan_genbank(file_path):
+    """
+    Yields GenBankRecord tuples, reading only the LOCUS, VERSION, ACCESSION,
+    ORGANISM and ORIGIN sections; feature tables are skipped.
+
+    Args:
+        file_path (str): Path to the GenBank file (optionally gzip/zstd-compressed).
+    """
+    with open_input(file_path) as handle:
+        yield from _scan(handle)
+
+
+def _scan(lines):
+    in_record = False
+    in_origin = False
+    for line in lines:
+        if not in_record:
+            if line.startswith(b"LOCUS"):
+                in_record = True
+                words = line.split()
+                locus = words[1].decode() if len(words) > 1 else ""
+                organism = accession = version = None
+                chunks = []
+                in_origin = False
+        elif line.startswith(b"//"):
+            sequence = b"".join(chunks).translate(None, _SEQUENCE_JUNK).upper().decode("ascii")
+            record_id = version or accession or locus
+            words = (organism or record_id).split()
+            label = words[0] if words else ""
+            yield GenBankRecord(label, organism, record_id, sequence)
+            in_record = False
+        elif in_origin:
+            chunks.append(line)
+        elif line.startswith(b"  ORGANISM"):
+            if organism is None:
+                organism = line[10:].strip().decode("utf-8", "replace")
+        elif line.startswith(b"VERSION"):
+            words = line.split()
+            version = words[1].decode() if len(words) > 1 else None
+        elif line.startswith(b"ACCESSION"):
+            words = line.split()
+            accession = words[1].decode() if len(words) > 1 else None
+        elif line.startswith(b"ORIGIN"):
+            in_origin = True
+
+
+def _iter_biopython(file_path):
+    from Bio import SeqIO
+
+    with open_input(file_path) as raw:
+        for record in SeqIO.parse(io.TextIOWrapper(raw), "genbank"):
+            organism = record.annotations.get("organism", record.id).split()[0]  # Get just "Taxon1"
+            yield GenBankRecord(organism, record.annotations.get("organism"), record.id, str(record.seq))
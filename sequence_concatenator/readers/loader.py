@@ -0,0 +1,137 @@
+import os
+
+from sequence_concatenator.readers.registry import detect_format, read_sequences
+
+
+def read_file_auto(path, reader="fast", check_lengths=False):
+    """
+    Reads a sequence file, choosing the parser from its content (see
+    readers.registry), falling back to its extension.
+
+    Args:
+        path (str): Path to a FASTA, NEXUS, GenBank, PHYLIP, Clustal or
+            Stockholm file, or any format registered by a plugin
+        reader (str): Parser family, "fast" or "biopython"
+        check_lengths (bool): Fail if FASTA sequences differ in length
+
+    Returns:
+        dict: {taxon: sequence}
+    """
+    return read_sequences(path, reader=reader, check_lengths=check_lengths)
+
+
+def split_loci(path, sequences):
+    """
+    Splits a binary supermatrix input back into its partitions, so that
+    concatenating it reproduces the original loci; other inputs are one locus.
+
+    Args:
+        path (str): Input file path
+        sequences (dict): {taxon: sequence} as read from `path`
+
+    Returns:
+        list of dict: [{taxon: sequence}, ...]
+    """
+    if detect_format(path) != "supermatrix":
+        return [sequences]
+    from sequence_concatenator.readers.binary_reader import read_supermatrix_partitions
+
+    return [
+        {taxon: seq[start - 1:end] for taxon, seq in sequences.items()}
+        for _, start, end in read_supermatrix_partitions(path)
+    ]
+
+
+def read_files(paths, jobs=1, reader="fast", check_lengths=False, cache=None, progress=None):
+    """
+    Reads many sequence files, optionally in parallel worker processes.
+
+    Results are returned in input order so partition numbering is stable, and
+    a failure in one file does not stop the others from being read.
+
+    Args:
+        paths (list of str): Input file paths
+        jobs (int): Number of worker processes; 1 reads serially, 0 or None
+            uses one worker per CPU
+        reader (str): Parser family, "fast" or "biopython"
+        check_lengths (bool): Fail if FASTA sequences differ in length
+        cache (ParseCache, optional): Parsed-input cache consulted before parsing
+        progress (callable, optional): Called as progress(done, total) as files
+            finish; an exception it raises stops reading (files not yet started
+            are skipped) and is propagated
+
+    Returns:
+        tuple:
+            - list: [(path, {taxon: sequence}), ...] for files read successfully
+            - list: [(path, error_message), ...] for files that failed
+    """
+    tasks = [(path, reader, check_lengths, cache) for path in paths]
+    workers = jobs or os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+
+    outcomes = []
+    if workers <= 1:
+        for task in tasks:
+            outcomes.append(_read_one(task))
+            if progress:
+                progress(len(outcomes), len(tasks))
+    else:
+        # multiprocessing is only imported when worker processes are used
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(tasks) // (workers * 4))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            for outcome in executor.map(_read_one, tasks, chunksize=chunksize):
+                outcomes.append(outcome)
+                if progress:
+                    progress(len(outcomes), len(tasks))
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    results = []
+    errors = []
+    for path, sequences, error in outcomes:
+        if error is None:
+            results.append((path, sequences))
+        else:
+            errors.append((path, error))
+    return results, errors
+
+
+def read_file_cached(path, reader="fast", check_lengths=False, cache=None):
+    """
+    Reads a sequence file through a parse cache, if one is given.
+
+    Args:
+        path (str): Input file path
+        reader (str): Parser family, "fast" or "biopython"
+        check_lengths (bool): Fail if FASTA sequences differ in length
+        cache (ParseCache, optional): Parsed-input cache consulted before parsing
+
+    Returns:
+        dict: {taxon: sequence}
+    """
+    if cache is None:
+        return read_file_auto(path, reader, check_lengths)
+    return cache.read(
+        path, lambda p: read_file_auto(p, reader, check_lengths),
+        variant=cache_variant(reader, check_lengths)
+    )
+
+
+def cache_variant(reader="fast", check_lengths=False):
+    """
+    Returns the parse-cache variant for a reader configuration.
+    """
+    return f"{reader}:{int(check_lengths)}"
+
+
+def _read_one(task):
+    path, reader, check_lengths, cache = task
+    try:
+        return path, read_file_cached(path, reader, check_lengths, cache), None
+    except Exception as e:
+        return path, None, str(e)
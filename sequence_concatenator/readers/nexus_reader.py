@@ -1,25 +1,308 @@
-from Bio.Nexus import Nexus
+import re
+from collections import namedtuple
 
-def read_nexus(file_path):
+from sequence_concatenator.readers._common import _NeedsFallback
+from sequence_concatenator.utils.file_utils import open_input
+
+NexusMatrix = namedtuple("NexusMatrix", ["sequences", "charsets", "missing", "gap", "matchchar"])
+NexusMatrix.__doc__ = """
+Parsed NEXUS character matrix.
+
+    sequences (dict): {taxon: sequence}
+    charsets (dict): {name: [(start, end, step), ...]} with 1-based inclusive coordinates
+    missing (str): Missing-data symbol from the FORMAT command
+    gap (str): Gap symbol from the FORMAT command
+    matchchar (str or None): Match symbol, already resolved in `sequences`
+"""
+
+
+_OPTION = re.compile(r"(\w+)\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s;]+)|(\w+)")
+_LABEL = re.compile(r"\s*('(?:[^']|'')*'|\S+)\s*")
+_RANGE = re.compile(r"(\d+|\.)(?:\s*-\s*(\d+|\.))?(?:\s*\\\s*(\d+))?")
+
+
+def read_nexus(file_path, reader="fast"):
     """
     Reads aligned sequences from a NEXUS file.
 
     Args:
-        file_path (str): Path to the NEXUS file.
+        file_path (str): Path to the NEXUS file (optionally gzip/zstd-compressed).
+        reader (str): "fast" for the built-in DATA/CHARACTERS block reader, or
+            "biopython" to parse with Bio.Nexus. The fast reader falls back to
+            Bio.Nexus for matrices it does not handle (e.g. polymorphisms).
 
     Returns:
         dict: A dictionary where keys are taxa names and values are sequences (as strings).
     """
     try:
-        nexus_obj = Nexus.Nexus()
-        nexus_obj.read(file_path)
-        
-        sequences = {
-            taxon: ''.join(nexus_obj.matrix[taxon])
-            for taxon in nexus_obj.matrix
-        }
-        
-        return sequences
+        if reader == "fast":
+            return parse_nexus(file_path).sequences
+        elif reader == "biopython":
+            return _read_biopython(file_path)
+        else:
+            raise ValueError(f"Unknown NEXUS reader: {reader}")
 
     except Exception as e:
         raise IOError(f"Failed to parse NEXUS file '{file_path}': {e}")
+
+
+def parse_nexus(file_path):
+    """
+    Parses the character matrix, FORMAT tokens and CHARSETs of a NEXUS file
+    in one pass over its text, without building Bio.Nexus objects.
+
+    Handles sequential and interleaved matrices, quoted taxon labels,
+    comments, and the missing/gap/matchchar FORMAT tokens.
+
+    Args:
+        file_path (str): Path to the NEXUS file.
+
+    Returns:
+        NexusMatrix
+    """
+    with open_input(file_path, "r") as f:
+        text = f.read()
+    text = text.lstrip()
+    if not text[:6].upper() == "#NEXUS":
+        raise ValueError("File does not start with #NEXUS")
+    text = text[6:]
+    if "[" in text:
+        text = _strip_comments(text)
+
+    try:
+        return _parse_text(text)
+    except _NeedsFallback:
+        charsets = {}
+        for command in _split_commands(text):
+            keyword, body = _split_keyword(command)
+            if keyword == "charset":
+                charsets.update(_parse_charset(body))
+        return NexusMatrix(_read_biopython(file_path), charsets, "?", "-", None)
+
+
+def _parse_text(text):
+    ntax = nchar = None
+    options = {}
+    matrix = None
+    charsets = {}
+    block = None
+    data_seen = False
+
+    for command in _split_commands(text):
+        keyword, body = _split_keyword(command)
+        if keyword == "begin":
+            block = body.strip().lower()
+        elif keyword in ("end", "endblock"):
+            data_seen = data_seen or block in ("data", "characters")
+            block = None
+        elif keyword == "charset":
+            charsets.update(_parse_charset(body))
+        elif block in ("data", "characters") and not data_seen:
+            if keyword == "dimensions":
+                dimensions = _parse_options(body)
+                ntax = int(dimensions["ntax"]) if "ntax" in dimensions else None
+                nchar = int(dimensions["nchar"]) if "nchar" in dimensions else None
+            elif keyword == "format":
+                options = _parse_options(body)
+            elif keyword == "matrix":
+                matrix = body
+
+    if matrix is None:
+        raise _NeedsFallback("no DATA/CHARACTERS block with a MATRIX command")
+    if "{" in matrix or "(" in matrix:
+        raise _NeedsFallback("polymorphic or uncertain states")
+
+    interleave = options.get("interleave", "no").lower() in ("yes", "true", "")
+    if interleave:
+        sequences = _parse_interleaved(matrix)
+    else:
+        sequences = _parse_sequential(matrix, ntax, nchar)
+
+    matchchar = options.get("matchchar")
+    if matchchar and sequences:
+        sequences = _resolve_matchchar(sequences, matchchar)
+
+    return NexusMatrix(
+        sequences, charsets, options.get("missing", "?"), options.get("gap", "-"), matchchar
+    )
+
+
+def _split_keyword(command):
+    match = re.match(r"\s*(\w+)", command)
+    if not match:
+        return "", command
+    return match.group(1).lower(), command[match.end():]
+
+
+def _split_commands(block):
+    """Splits a block into commands on ';', ignoring semicolons in quoted labels."""
+    if "'" not in block:
+        return block.split(";")
+    commands = []
+    current = []
+    pos = 0
+    while pos < len(block):
+        semi = block.find(";", pos)
+        quote = block.find("'", pos)
+        if semi == -1:
+            current.append(block[pos:])
+            break
+        if quote != -1 and quote < semi:
+            end = _end_of_quote(block, quote)
+            current.append(block[pos:end])
+            pos = end
+        else:
+            current.append(block[pos:semi])
+            commands.append("".join(current))
+            current = []
+            pos = semi + 1
+    if current:
+        commands.append("".join(current))
+    return commands
+
+
+def _parse_options(body):
+    options = {}
+    for match in _OPTION.finditer(body):
+        if match.group(1):
+            options[match.group(1).lower()] = match.group(2).strip("\"'")
+        else:
+            options[match.group(3).lower()] = ""
+    return options
+
+
+def _unquote(label):
+    if len(label) >= 2 and label[0] == label[-1] == "'":
+        return label[1:-1].replace("''", "'")
+    return label
+
+
+def _split_label(line):
+    match = _LABEL.match(line)
+    return _unquote(match.group(1)), line[match.end():]
+
+
+def _parse_interleaved(matrix):
+    chunks = {}
+    for line in matrix.splitlines():
+        if not line.strip():
+            continue
+        taxon, rest = _split_label(line)
+        chunks.setdefault(taxon, []).append("".join(rest.split()))
+    return {taxon: "".join(parts) for taxon, parts in chunks.items()}
+
+
+def _parse_sequential(matrix, ntax, nchar):
+    lines = [line for line in matrix.splitlines() if line.strip()]
+
+    # Common case: one taxon per line
+    if ntax is None or len(lines) == ntax:
+        sequences = {}
+        for line in lines:
+            taxon, rest = _split_label(line)
+            sequences[taxon] = "".join(rest.split())
+        if ntax is not None or nchar is None or all(len(seq) == nchar for seq in sequences.values()):
+            return sequences
+
+    # Sequences wrapped over several lines: read nchar characters per taxon
+    if nchar is None:
+        raise _NeedsFallback("wrapped sequential matrix without NCHAR")
+    sequences = {}
+    tokens = _LABEL.findall(matrix)
+    i = 0
+    while i < len(tokens):
+        taxon = _unquote(tokens[i])
+        i += 1
+        parts = []
+        length = 0
+        while length < nchar and i < len(tokens):
+            parts.append(tokens[i])
+            length += len(tokens[i])
+            i += 1
+        if length != nchar:
+            raise ValueError(f"Taxon {taxon}: expected {nchar} characters, found {length}")
+        sequences[taxon] = "".join(parts)
+    return sequences
+
+
+def _resolve_matchchar(sequences, matchchar):
+    taxa = list(sequences)
+    reference = sequences[taxa[0]]
+    for taxon in taxa[1:]:
+        seq = sequences[taxon]
+        if matchchar in seq:
+            sequences[taxon] = "".join(
+                ref if ch == matchchar else ch for ch, ref in zip(seq, reference)
+            ) + seq[len(reference):]
+    return sequences
+
+
+def _parse_charset(body):
+    match = re.match(r"\s*('(?:[^']|'')*'|[^\s=]+)\s*=(.*)", body, re.DOTALL)
+    if not match:
+        return {}
+    ranges = []
+    for start, end, step in _RANGE.findall(match.group(2)):
+        start = None if start == "." else int(start)
+        if end:
+            end = None if end == "." else int(end)
+        else:
+            end = start
+        ranges.append((start, end, int(step) if step else 1))
+    return {_unquote(match.group(1)): ranges}
+
+
+def _strip_comments(text):
+    """Removes (possibly nested) [comments], leaving quoted labels intact."""
+    out = []
+    pos = 0
+    while True:
+        bracket = text.find("[", pos)
+        if bracket == -1:
+            out.append(text[pos:])
+            return "".join(out)
+        quote = text.find("'", pos, bracket)
+        if quote != -1:
+            end = _end_of_quote(text, quote)
+            out.append(text[pos:end])
+            pos = end
+            continue
+        out.append(text[pos:bracket])
+        depth = 1
+        pos = bracket + 1
+        while depth:
+            close = text.find("]", pos)
+            if close == -1:
+                raise ValueError("Unterminated comment")
+            opening = text.find("[", pos, close)
+            if opening != -1:
+                depth += 1
+                pos = opening + 1
+            else:
+                depth -= 1
+                pos = close + 1
+
+
+def _end_of_quote(text, quote):
+    """Returns the index just past the quoted token starting at `quote` ('' escapes a quote)."""
+    pos = quote + 1
+    while True:
+        close = text.find("'", pos)
+        if close == -1:
+            return len(text)
+        if text[close + 1:close + 2] != "'":
+            return close + 1
+        pos = close + 2
+
+
+def _read_biopython(file_path):
+    from Bio.Nexus import Nexus
+
+    nexus_obj = Nexus.Nexus()
+    with open_input(file_path, "r") as handle:
+        nexus_obj.read(handle)
+
+    return {
+        taxon: ''.join(nexus_obj.matrix[taxon])
+        for taxon in nexus_obj.matrix
+    }
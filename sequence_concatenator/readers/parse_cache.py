@@ -0,0 +1,286 @@
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+DEFAULT_MEMORY_BYTES = 256 << 20  # 256 MiB
+
+_MAGIC = b"SQCC"
+_HEADER = struct.Struct("<4sBI")   # magic, format version, number of records
+_TAXON_LEN = struct.Struct("<I")
+_SEQ_LEN = struct.Struct("<Q")
+
+
+def default_cache_dir():
+    """
+    Returns the default cache directory ($XDG_CACHE_HOME/sequencecat or ~/.cache/sequencecat).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "sequencecat")
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed input files ({taxon: sequence}), keyed by the
+    file's absolute path, size and modification time (or its content hash),
+    with least-recently-used eviction once the cache exceeds max_bytes.
+
+    The directory is scanned once for its size; later writes keep a running
+    total and the directory is only rescanned when that total crosses
+    max_bytes. Entries written by other processes are not in the total, so
+    the cache may briefly exceed max_bytes until a writer's total catches up.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, content_hash=False):
+        """
+        Args:
+            cache_dir (str, optional): Directory for cache entries
+            max_bytes (int): Size bound for the whole cache directory
+            content_hash (bool): Key entries on a SHA-256 of the file contents
+                instead of its modification time
+        """
+        self.cache_dir = Path(cache_dir or default_cache_dir())
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+        self._total_bytes = None  # unknown until the directory is scanned
+
+    def key(self, path, variant=""):
+        """
+        Returns the cache key for a file and parser variant (e.g. the reader name).
+        """
+        stat = os.stat(path)
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_FORMAT_VERSION}\0{variant}\0{os.path.abspath(path)}\0{stat.st_size}\0".encode())
+        if self.content_hash:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        else:
+            digest.update(str(stat.st_mtime_ns).encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return self.cache_dir / f"{key}.seqc"
+
+    def get(self, path, variant=""):
+        """
+        Returns the cached {taxon: sequence} for a file, or None on a miss.
+        """
+        entry = self._entry_path(self.key(path, variant))
+        try:
+            with open(entry, "rb") as f:
+                sequences = _decode(f.read())
+            os.utime(entry)  # mark as recently used
+        except (OSError, ValueError, struct.error):
+            return None
+        return sequences
+
+    def contains(self, path, variant=""):
+        """
+        Returns whether a file has a cache entry, without reading it.
+        """
+        try:
+            return self._entry_path(self.key(path, variant)).exists()
+        except OSError:
+            return False
+
+    def put(self, path, sequences, variant=""):
+        """
+        Stores parsed sequences for a file, then evicts old entries if needed.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if self._total_bytes is None:
+            self.evict()
+        entry = self._entry_path(self.key(path, variant))
+        data = _encode(sequences)
+        try:
+            replaced = entry.stat().st_size
+        except OSError:
+            replaced = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._total_bytes += len(data) - replaced
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def read(self, path, parse, variant=""):
+        """
+        Returns cached sequences for a file, parsing and caching them on a miss.
+
+        Args:
+            path (str): Input file path
+            parse (callable): parse(path) -> {taxon: sequence}
+            variant (str): Distinguishes results of different parsers for one file
+        """
+        sequences = self.get(path, variant)
+        if sequences is None:
+            sequences = parse(path)
+            try:
+                self.put(path, sequences, variant)
+            except OSError:
+                pass  # a read-only or full cache must not break parsing
+        return sequences
+
+    def evict(self):
+        """
+        Removes least recently used entries until the cache fits in max_bytes.
+        """
+        entries = []
+        total = 0
+        for entry in self.cache_dir.glob("*.seqc"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+            total += stat.st_size
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._total_bytes = total
+
+    def clear(self):
+        """
+        Removes every cache entry.
+        """
+        for entry in self.cache_dir.glob("*.seqc"):
+            entry.unlink()
+        self._total_bytes = 0
+
+
+class WarmParseCache(ParseCache):
+    """
+    ParseCache that also keeps recently used entries in memory, for
+    long-running processes that parse the same inputs repeatedly (e.g. the
+    HTTP service). Lookups are thread-safe; cached dicts are shared between
+    callers and must not be modified.
+
+    `hits` counts lookups served from memory or disk, `disk_hits` those of
+    them that missed memory, and `misses` those served from neither.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, content_hash=False,
+                 memory_bytes=DEFAULT_MEMORY_BYTES):
+        """
+        Args:
+            memory_bytes (int): Size bound for entries kept in memory, counted
+                as the total length of their taxa and sequences
+        """
+        super().__init__(cache_dir, max_bytes, content_hash)
+        self.memory_bytes = memory_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (sequences, size)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Worker processes get the on-disk cache only
+        state = self.__dict__.copy()
+        state.update(_entries=OrderedDict(), _size=0, _lock=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, path, variant=""):
+        key = self.key(path, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        sequences = super().get(path, variant)
+        with self._lock:
+            if sequences is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.disk_hits += 1
+        if sequences is not None:
+            self._remember(key, sequences)
+        return sequences
+
+    def contains(self, path, variant=""):
+        try:
+            key = self.key(path, variant)
+        except OSError:
+            return False
+        return key in self._entries or self._entry_path(key).exists()
+
+    def put(self, path, sequences, variant=""):
+        self._remember(self.key(path, variant), sequences)
+        super().put(path, sequences, variant)
+
+    def _remember(self, key, sequences):
+        size = sum(len(taxon) + len(seq) for taxon, seq in sequences.items())
+        if size > self.memory_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (sequences, size)
+            self._size += size
+            while self._size > self.memory_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        super().clear()
+
+
+def _encode(sequences):
+    parts = [_HEADER.pack(_MAGIC, CACHE_FORMAT_VERSION, len(sequences))]
+    for taxon, sequence in sequences.items():
+        taxon_bytes = taxon.encode("utf-8")
+        seq_bytes = sequence.encode("utf-8")
+        parts.append(_TAXON_LEN.pack(len(taxon_bytes)))
+        parts.append(taxon_bytes)
+        parts.append(_SEQ_LEN.pack(len(seq_bytes)))
+        parts.append(seq_bytes)
+    return b"".join(parts)
+
+
+def _decode(data):
+    magic, version, count = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != CACHE_FORMAT_VERSION:
+        raise ValueError("Not a sequence cache entry")
+    view = memoryview(data)
+    offset = _HEADER.size
+    sequences = {}
+    for _ in range(count):
+        (taxon_len,) = _TAXON_LEN.unpack_from(data, offset)
+        offset += _TAXON_LEN.size
+        taxon = bytes(view[offset:offset + taxon_len]).decode("utf-8")
+        offset += taxon_len
+        (seq_len,) = _SEQ_LEN.unpack_from(data, offset)
+        offset += _SEQ_LEN.size
+        sequences[taxon] = bytes(view[offset:offset + seq_len]).decode("utf-8")
+        offset += seq_len
+    if offset != len(data):
+        raise ValueError("Truncated sequence cache entry")
+    return sequences
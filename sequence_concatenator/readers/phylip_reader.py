@@ -0,0 +1,145 @@
+from sequence_concatenator.readers._common import _NeedsFallback
+from sequence_concatenator.utils.file_utils import open_input
+
+
+def read_phylip(file_path, reader="fast"):
+    """
+    Reads aligned sequences from a PHYLIP file (strict or relaxed names,
+    interleaved or sequential).
+
+    Args:
+        file_path (str): Path to the PHYLIP file (optionally gzip/zstd-compressed).
+        reader (str): "fast" for the built-in parser, or "biopython" to parse
+            with Bio.AlignIO ("phylip-relaxed"). The fast parser falls back to
+            Biopython for input it does not recognise.
+
+    Returns:
+        dict: A dictionary where keys are taxa names and values are sequences (as strings).
+    """
+    try:
+        if reader == "fast":
+            try:
+                with open_input(file_path) as handle:
+                    return parse_phylip(handle)
+            except _NeedsFallback:
+                return _read_biopython(file_path)
+        elif reader == "biopython":
+            return _read_biopython(file_path)
+        else:
+            raise ValueError(f"Unknown PHYLIP reader: {reader}")
+
+    except Exception as e:
+        raise IOError(f"Failed to parse PHYLIP file '{file_path}': {e}")
+
+
+def parse_phylip(lines):
+    """
+    Parses PHYLIP from an iterable of byte lines.
+
+    The matrix is read as interleaved (the PHYLIP default) unless the header
+    carries the "S" option or interleaved reading gives the wrong lengths,
+    in which case it is read as sequential with wrapped sequence lines.
+
+    Returns:
+        dict: {taxon: sequence}
+    """
+    lines = iter(lines)
+    header = b""
+    for header in lines:
+        if header.strip():
+            break
+    words = header.split()
+    try:
+        ntax, nchar = int(words[0]), int(words[1])
+    except (IndexError, ValueError):
+        raise _NeedsFallback("missing 'ntax nchar' header")
+    options = b"".join(words[2:]).upper()
+
+    body = [line.rstrip(b"\r\n") for line in lines]
+    # Relaxed names end at the first space; strict names fill a fixed
+    # 10-character field and may contain spaces, so they are tried when the
+    # relaxed split gives the wrong residue counts
+    if b"S" not in options:
+        for split_name in (_split_relaxed, _split_strict):
+            sequences = _parse_interleaved(body, ntax, split_name)
+            if sequences is not None and all(len(seq) == nchar for seq in sequences.values()):
+                return sequences
+    try:
+        sequences = _parse_sequential(body, ntax, nchar, _split_relaxed)
+    except ValueError as e:
+        try:
+            sequences = _parse_sequential(body, ntax, nchar, _split_strict)
+        except ValueError:
+            raise e
+    if len(sequences) != ntax:
+        raise ValueError(f"Expected {ntax} taxa, found {len(sequences)}")
+    return sequences
+
+
+def _split_relaxed(line):
+    words = line.split(None, 1)
+    if len(words) == 2:
+        return _decode(words[0]), words[1]
+    return _split_strict(line)
+
+
+def _split_strict(line):
+    # Strict PHYLIP: a 10-character name field, possibly glued to the sequence
+    return _decode(line[:10].strip()), line[10:]
+
+
+def _parse_interleaved(body, ntax, split_name):
+    lines = [line for line in body if line.strip()]
+    if len(lines) < ntax or len(lines) % ntax:
+        return None
+    taxa = []
+    chunks = []
+    for line in lines[:ntax]:
+        taxon, rest = split_name(line)
+        taxa.append(taxon)
+        chunks.append([rest])
+    for i, line in enumerate(lines[ntax:]):
+        chunks[i % ntax].append(line)
+    if len(set(taxa)) != ntax:
+        return None
+    return {taxon: _join(parts) for taxon, parts in zip(taxa, chunks)}
+
+
+def _parse_sequential(body, ntax, nchar, split_name):
+    sequences = {}
+    lines = (line for line in body if line.strip())
+    for line in lines:
+        if len(sequences) == ntax:
+            break
+        taxon, rest = split_name(line)
+        parts = [rest]
+        length = len(b"".join(rest.split()))
+        while length < nchar:
+            line = next(lines, None)
+            if line is None:
+                break
+            parts.append(line)
+            length += len(b"".join(line.split()))
+        if length != nchar:
+            raise ValueError(f"Taxon {taxon}: expected {nchar} characters, found {length}")
+        sequences[taxon] = _join(parts)
+    return sequences
+
+
+def _join(parts):
+    return _decode(b"".join(b"".join(parts).split()))
+
+
+def _decode(data):
+    try:
+        return data.decode("ascii")
+    except UnicodeDecodeError:
+        raise _NeedsFallback("non-ASCII content")
+
+
+def _read_biopython(file_path):
+    from Bio import AlignIO
+
+    with open_input(file_path, "r") as handle:
+        alignment = AlignIO.read(handle, "phylip-relaxed")
+    return {record.id: str(record.seq) for record in alignment}
@@ -0,0 +1,230 @@
+"""
+Registry of input formats.
+
+Each format has a reader, the file extensions it usually carries and a sniff
+function that recognises it from the first bytes of the (decompressed) file.
+Formats are detected from content first and from the extension only when no
+sniffer matches, so a FASTA file named "loci.aln" is still read as FASTA.
+
+Third-party packages can add readers through the
+"sequence_concatenator.readers" entry-point group; each entry point must
+resolve to a ReaderSpec (or a list of them).
+"""
+import os
+import re
+from collections import namedtuple
+
+from sequence_concatenator.readers.clustal_reader import CLUSTAL_HEADERS
+from sequence_concatenator.utils.file_utils import get_extension, open_input
+
+ENTRY_POINT_GROUP = "sequence_concatenator.readers"
+SNIFF_BYTES = 4096
+
+ReaderSpec = namedtuple("ReaderSpec", ["name", "label", "extensions", "read", "sniff"])
+ReaderSpec.__doc__ = """
+One input format.
+
+    name (str): Short format name, e.g. "fasta"
+    label (str): Human-readable name for file dialogs, e.g. "FASTA"
+    extensions (tuple of str): Lowercase extensions without the dot
+    read (callable): read(path, reader="fast", check_lengths=False) -> {taxon: sequence}
+    sniff (callable or None): sniff(head) -> bool, given the first bytes of the
+        file with leading whitespace and byte-order mark removed
+"""
+
+_formats = {}
+_plugins_loaded = False
+_detected = {}  # (path, size, mtime_ns) -> format name
+
+
+def register_reader(spec):
+    """
+    Adds or replaces an input format.
+
+    Args:
+        spec (ReaderSpec): Format description
+    """
+    _formats[spec.name] = spec
+    _detected.clear()
+
+
+def get_reader(name):
+    """
+    Returns the ReaderSpec registered under `name`.
+
+    Raises:
+        ValueError: If no such format is registered
+    """
+    _load_plugins()
+    try:
+        return _formats[name]
+    except KeyError:
+        raise ValueError(f"Unsupported format: {name}")
+
+
+def registered_formats():
+    """
+    Returns all registered formats in registration order.
+
+    Returns:
+        list of ReaderSpec
+    """
+    _load_plugins()
+    return list(_formats.values())
+
+
+def format_for_extension(path):
+    """
+    Returns the format name whose extensions include the file's extension
+    (compression suffixes ignored), or None.
+    """
+    ext = get_extension(path)
+    for spec in registered_formats():
+        if ext in spec.extensions:
+            return spec.name
+    return None
+
+
+def detect_format(path):
+    """
+    Detects the format of a file from its first bytes, falling back to the
+    extension. Results are cached per path, size and modification time.
+
+    Args:
+        path (str): File path
+
+    Returns:
+        str or None: Format name, or None if the file is not recognised
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return format_for_extension(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _detected:
+        _detected[key] = sniff_format(path) or format_for_extension(path)
+    return _detected[key]
+
+
+def sniff_format(path):
+    """
+    Returns the first registered format whose sniffer accepts the file's
+    leading bytes, or None.
+    """
+    try:
+        with open_input(path) as handle:
+            head = handle.read(SNIFF_BYTES)
+    except (OSError, EOFError, ImportError):
+        return None
+    head = head.lstrip(b"\xef\xbb\xbf").lstrip()
+    if not head:
+        return None
+    for spec in registered_formats():
+        if spec.sniff is not None and spec.sniff(head):
+            return spec.name
+    return None
+
+
+def read_sequences(path, reader="fast", check_lengths=False, fmt=None):
+    """
+    Reads a sequence file with the reader for its detected format.
+
+    Args:
+        path (str): File path
+        reader (str): Parser family, "fast" or "biopython"
+        check_lengths (bool): Fail if sequences differ in length (FASTA)
+        fmt (str, optional): Format name, skipping detection
+
+    Returns:
+        dict: {taxon: sequence}
+
+    Raises:
+        ValueError: If the format is not recognised
+    """
+    fmt = fmt or detect_format(path)
+    if fmt is None:
+        raise ValueError(f"Unsupported format: {get_extension(path) or path}")
+    return get_reader(fmt).read(path, reader=reader, check_lengths=check_lengths)
+
+
+def _load_plugins():
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return
+    points = entry_points()
+    if hasattr(points, "select"):
+        points = points.select(group=ENTRY_POINT_GROUP)
+    else:
+        points = points.get(ENTRY_POINT_GROUP, [])
+    for point in points:
+        try:
+            loaded = point.load()
+        except Exception:
+            continue  # a broken plugin must not stop the built-in formats
+        specs = [loaded] if isinstance(loaded, ReaderSpec) else loaded
+        for spec in specs:
+            if isinstance(spec, ReaderSpec):
+                register_reader(spec)
+
+
+# Built-in formats; parsers are imported on first use.
+
+def _read_fasta(path, reader="fast", check_lengths=False):
+    from sequence_concatenator.readers.fasta_reader import read_fasta
+    return read_fasta(path, reader=reader, check_lengths=check_lengths)
+
+
+def _read_nexus(path, reader="fast", check_lengths=False):
+    from sequence_concatenator.readers.nexus_reader import read_nexus
+    return read_nexus(path, reader=reader)
+
+
+def _read_genbank(path, reader="fast", check_lengths=False):
+    from sequence_concatenator.readers.genbank_reader import read_genbank
+    return read_genbank(path, reader=reader)
+
+
+def _read_phylip(path, reader="fast", check_lengths=False):
+    from sequence_concatenator.readers.phylip_reader import read_phylip
+    return read_phylip(path, reader=reader)
+
+
+def _read_clustal(path, reader="fast", check_lengths=False):
+    from sequence_concatenator.readers.clustal_reader import read_clustal
+    return read_clustal(path, reader=reader)
+
+
+def _read_stockholm(path, reader="fast", check_lengths=False):
+    from sequence_concatenator.readers.stockholm_reader import read_stockholm
+    return read_stockholm(path, reader=reader)
+
+
+def _read_supermatrix(path, reader="fast", check_lengths=False):
+    from sequence_concatenator.readers.binary_reader import read_supermatrix
+    return read_supermatrix(path, reader=reader)
+
+
+_PHYLIP_HEADER = re.compile(rb"\d+[ \t]+\d+[ \t]*[A-Za-z \t]*\r?\n")
+
+for _spec in (
+    ReaderSpec("fasta", "FASTA", ("fasta", "fa", "fas", "fna", "faa", "fsa", "mfa"),
+               _read_fasta, lambda head: head.startswith(b">")),
+    ReaderSpec("nexus", "NEXUS", ("nex", "nexus", "nxs"),
+               _read_nexus, lambda head: head[:6].upper() == b"#NEXUS"),
+    ReaderSpec("genbank", "GenBank", ("gbff", "gb", "gbk"),
+               _read_genbank, lambda head: head.startswith(b"LOCUS")),
+    ReaderSpec("stockholm", "Stockholm", ("sto", "stk", "sth"),
+               _read_stockholm, lambda head: head.startswith(b"# STOCKHOLM")),
+    ReaderSpec("clustal", "Clustal", ("aln", "clustal", "clw"),
+               _read_clustal, lambda head: head.startswith(CLUSTAL_HEADERS)),
+    ReaderSpec("phylip", "PHYLIP", ("phy", "phylip"),
+               _read_phylip, lambda head: _PHYLIP_HEADER.match(head) is not None),
+    ReaderSpec("supermatrix", "Binary supermatrix", ("sqm",),
+               _read_supermatrix, lambda head: head.startswith(b"SQCMATRX")),
+):
+    register_reader(_spec)
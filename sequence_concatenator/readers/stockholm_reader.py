@@ -0,0 +1,75 @@
+from sequence_concatenator.readers._common import _NeedsFallback
+from sequence_concatenator.utils.file_utils import open_input
+
+
+def read_stockholm(file_path, reader="fast"):
+    """
+    Reads aligned sequences from the first alignment in a Stockholm file.
+    Markup lines (#=GF, #=GS, #=GR, #=GC) are skipped.
+
+    Args:
+        file_path (str): Path to the Stockholm file (optionally gzip/zstd-compressed).
+        reader (str): "fast" for the built-in parser, or "biopython" to parse
+            with Bio.AlignIO.
+
+    Returns:
+        dict: A dictionary where keys are sequence names and values are sequences (as strings).
+    """
+    try:
+        if reader == "fast":
+            try:
+                with open_input(file_path) as handle:
+                    return parse_stockholm(handle)
+            except _NeedsFallback:
+                return _read_biopython(file_path)
+        elif reader == "biopython":
+            return _read_biopython(file_path)
+        else:
+            raise ValueError(f"Unknown Stockholm reader: {reader}")
+
+    except Exception as e:
+        raise IOError(f"Failed to parse Stockholm file '{file_path}': {e}")
+
+
+def parse_stockholm(lines):
+    """
+    Parses the first Stockholm alignment from an iterable of byte lines.
+
+    Returns:
+        dict: {name: sequence}
+    """
+    lines = iter(lines)
+    for header in lines:
+        if header.strip():
+            break
+    else:
+        raise _NeedsFallback("empty file")
+    if not header.startswith(b"# STOCKHOLM"):
+        raise _NeedsFallback("missing '# STOCKHOLM' header")
+
+    chunks = {}
+    for line in lines:
+        if line.startswith(b"//"):
+            break
+        if line.startswith(b"#") or not line.strip():
+            continue
+        words = line.split()
+        if len(words) != 2:
+            raise _NeedsFallback("unexpected sequence line")
+        chunks.setdefault(words[0], []).append(words[1])
+
+    try:
+        return {
+            name.decode("ascii"): b"".join(parts).decode("ascii")
+            for name, parts in chunks.items()
+        }
+    except UnicodeDecodeError:
+        raise _NeedsFallback("non-ASCII content")
+
+
+def _read_biopython(file_path):
+    from Bio import AlignIO
+
+    with open_input(file_path, "r") as handle:
+        alignment = next(AlignIO.parse(handle, "stockholm"))
+    return {record.id: str(record.seq) for record in alignment}
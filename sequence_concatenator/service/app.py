@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+from typing import List, Literal
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+
+from sequence_concatenator import __version__
+from sequence_concatenator.readers.parse_cache import DEFAULT_MEMORY_BYTES, WarmParseCache, default_cache_dir
+from sequence_concatenator.service.jobs import (
+    DEFAULT_MAX_PENDING, DEFAULT_MAX_UPLOAD_BYTES, JobQueue, QueueFull, UploadStore, UploadTooLarge
+)
+
+DEFAULT_MAX_UPLOADS = 4
+# Seconds clients are asked to wait before resubmitting when the queue is full
+RETRY_AFTER = 5
+
+
+class JobRequest(BaseModel):
+    uploads: List[str] = Field(min_length=1, description="Upload ids, in partition order")
+    placeholder: str = Field("?", min_length=1, max_length=1)
+    nexus: bool = False
+    interleave: bool = False
+    line_width: int = Field(60, ge=0)
+    reader: Literal["fast", "biopython"] = "fast"
+    check_lengths: bool = False
+
+
+def create_app(data_dir=None, workers=2, max_pending=DEFAULT_MAX_PENDING,
+               max_upload_bytes=DEFAULT_MAX_UPLOAD_BYTES, max_uploads=DEFAULT_MAX_UPLOADS,
+               cache_dir=None, memory_bytes=DEFAULT_MEMORY_BYTES):
+    """
+    Builds the concatenation service.
+
+    Inputs are uploaded one file per request as the raw request body
+    (POST /uploads?name=locus1.fasta), then concatenated by a job
+    (POST /jobs) that runs on a bounded worker pool; clients poll
+    GET /jobs/{id} and download outputs from GET /jobs/{id}/results/{name}.
+    Parsed inputs are cached in memory and on disk across requests.
+
+    Args:
+        data_dir (str, optional): Directory for uploads and job outputs
+        workers (int): Jobs run at the same time
+        max_pending (int): Jobs queued or running before submissions get 503
+        max_upload_bytes (int): Largest accepted upload (larger ones get 413)
+        max_uploads (int): Uploads received at the same time; further uploads
+            wait without their bodies being read
+        cache_dir (str, optional): Parsed-input cache directory (default: the CLI's)
+        memory_bytes (int): Size bound for parsed inputs kept in memory
+
+    Returns:
+        FastAPI
+    """
+    data_dir = data_dir or os.path.join(default_cache_dir(), "service")
+    store = UploadStore(os.path.join(data_dir, "uploads"), max_bytes=max_upload_bytes)
+    cache = WarmParseCache(cache_dir, memory_bytes=memory_bytes)
+    queue = JobQueue(os.path.join(data_dir, "jobs"), workers=workers, max_pending=max_pending, cache=cache)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # Created here so the semaphore belongs to the server's event loop
+        app.state.upload_slots = asyncio.Semaphore(max_uploads)
+        yield
+        queue.shutdown(wait=False)
+
+    app = FastAPI(title="Sequence Concatenator", version=__version__, lifespan=lifespan)
+    app.state.store = store
+    app.state.queue = queue
+    app.state.cache = cache
+
+    @app.get("/health")
+    async def health():
+        return {
+            "status": "ok",
+            "version": __version__,
+            "pending_jobs": queue.pending(),
+            "cache": {"hits": cache.hits, "disk_hits": cache.disk_hits, "misses": cache.misses},
+        }
+
+    @app.post("/uploads", status_code=201)
+    async def upload(request: Request, name: str = ""):
+        length = request.headers.get("content-length")
+        if length is not None and length.isdigit() and int(length) > store.max_bytes:
+            raise HTTPException(413, f"Upload exceeds {store.max_bytes} bytes")
+        async with request.app.state.upload_slots:
+            writer = await run_in_threadpool(store.begin, name)
+            try:
+                # The next chunk is only read once the previous one is on
+                # disk, so a slow disk throttles the client
+                async for chunk in request.stream():
+                    await run_in_threadpool(writer.write, chunk)
+            except UploadTooLarge as e:
+                raise HTTPException(413, str(e))
+            except BaseException:
+                writer.abort()
+                raise
+            upload_id = await run_in_threadpool(writer.finish)
+        return {"upload_id": upload_id, "size": writer.size}
+
+    @app.delete("/uploads/{upload_id}", status_code=204)
+    async def delete_upload(upload_id: str):
+        try:
+            os.remove(store.path(upload_id))
+        except KeyError:
+            raise HTTPException(404, f"Unknown upload: {upload_id}")
+        return Response(status_code=204)
+
+    @app.post("/jobs", status_code=202)
+    async def submit_job(request: JobRequest, response: Response):
+        try:
+            inputs = [store.path(upload_id) for upload_id in request.uploads]
+        except KeyError as e:
+            raise HTTPException(404, f"Unknown upload: {e.args[0]}")
+        options = request.model_dump(exclude={"uploads"})
+        try:
+            job = queue.submit(inputs, options)
+        except QueueFull as e:
+            raise HTTPException(503, str(e), headers={"Retry-After": str(RETRY_AFTER)})
+        response.headers["Location"] = f"/jobs/{job.id}"
+        return job.to_dict()
+
+    @app.get("/jobs/{job_id}")
+    async def job_status(job_id: str):
+        return _job(queue, job_id).to_dict()
+
+    @app.get("/jobs/{job_id}/results/{name}")
+    async def job_result(job_id: str, name: str):
+        job = _job(queue, job_id)
+        if job.status != "done":
+            raise HTTPException(409, f"Job is {job.status}")
+        if name not in job.outputs:
+            raise HTTPException(404, f"No output named '{name}'; available: {', '.join(sorted(job.outputs))}")
+        path = job.outputs[name]
+        return FileResponse(path, filename=os.path.basename(path), media_type="text/plain")
+
+    @app.delete("/jobs/{job_id}", status_code=204)
+    async def delete_job(job_id: str):
+        try:
+            queue.delete(job_id)
+        except KeyError:
+            raise HTTPException(404, f"Unknown job: {job_id}")
+        return Response(status_code=204)
+
+    return app
+
+
+def _job(queue, job_id):
+    try:
+        return queue.get(job_id)
+    except KeyError:
+        raise HTTPException(404, f"Unknown job: {job_id}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the sequence concatenation HTTP service.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=2, help="Jobs run at the same time (default: %(default)s)")
+    parser.add_argument(
+        "--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+        help="Jobs queued or running before new submissions are refused (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-upload-mb", type=int, default=DEFAULT_MAX_UPLOAD_BYTES >> 20,
+        help="Largest accepted upload in MiB (default: %(default)s)"
+    )
+    parser.add_argument("--data-dir", help="Directory for uploads and job outputs")
+    parser.add_argument("--cache-dir", default=default_cache_dir(),
+                        help="Directory for the parsed-input cache (default: %(default)s)")
+    args = parser.parse_args()
+    try:
+        import uvicorn
+    except ImportError:
+        sys.exit("The service needs uvicorn (pip install 'sequence-concatenator[service]')")
+
+    app = create_app(
+        data_dir=args.data_dir, workers=args.workers, max_pending=args.max_pending,
+        max_upload_bytes=args.max_upload_mb << 20, cache_dir=args.cache_dir
+    )
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.stats import compute_alignment_stats
+from sequence_concatenator.readers.loader import read_files, split_loci
+from sequence_concatenator.writers.fasta_writer import write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+
+DEFAULT_MAX_UPLOAD_BYTES = 2 << 30  # 2 GiB
+DEFAULT_MAX_PENDING = 16
+DEFAULT_KEEP_FINISHED = 100
+
+# Upload names keep at most two suffixes (e.g. ".fasta.gz") made of these characters
+_SUFFIX = re.compile(r"^\.[A-Za-z0-9]{1,10}$")
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the size limit."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once it has been cancelled."""
+
+
+class UploadStore:
+    """
+    Content-addressed store for uploaded input files.
+
+    Each upload is streamed to disk while it is hashed and saved as
+    <sha256><suffixes>, so uploading the same file twice yields the same
+    path, size and modification time and hits the parse cache.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_UPLOAD_BYTES):
+        """
+        Args:
+            directory (str): Directory uploads are stored in
+            max_bytes (int): Largest accepted upload
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def begin(self, filename):
+        """
+        Starts an upload; returns an UploadWriter to feed chunks to.
+        """
+        return UploadWriter(self, _suffixes(filename))
+
+    def path(self, upload_id):
+        """
+        Returns the path of a stored upload.
+
+        Raises:
+            KeyError: If no upload has that id
+        """
+        if os.path.basename(upload_id) != upload_id or upload_id.startswith("."):
+            raise KeyError(upload_id)
+        path = os.path.join(self.directory, upload_id)
+        if not os.path.isfile(path):
+            raise KeyError(upload_id)
+        return path
+
+
+class UploadWriter:
+    """
+    Writes one upload chunk by chunk to a temporary file, then moves it to
+    its content address on finish().
+    """
+
+    def __init__(self, store, suffix):
+        self.store = store
+        self.suffix = suffix
+        self.size = 0
+        self._digest = hashlib.sha256()
+        fd, self._tmp_path = tempfile.mkstemp(dir=store.directory, suffix=".part")
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, chunk):
+        """
+        Raises:
+            UploadTooLarge: If the upload grows past the store's limit
+        """
+        self.size += len(chunk)
+        if self.size > self.store.max_bytes:
+            self.abort()
+            raise UploadTooLarge(f"Upload exceeds {self.store.max_bytes} bytes")
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def finish(self):
+        """
+        Returns the upload id (its file name in the store).
+        """
+        self._file.close()
+        upload_id = self._digest.hexdigest() + self.suffix
+        path = os.path.join(self.store.directory, upload_id)
+        if os.path.exists(path):
+            # Keep the existing copy so its parse-cache entry stays valid
+            os.remove(self._tmp_path)
+        else:
+            os.replace(self._tmp_path, path)
+        return upload_id
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class Job:
+    """
+    State of one concatenation job, as reported by the service.
+    """
+
+    def __init__(self, inputs, options, workdir):
+        """
+        Args:
+            inputs (list of str): Input paths, in partition order
+            options (dict): Pipeline options (see JobQueue.submit)
+            workdir (str): Directory the job's own output directory is created in
+        """
+        self.id = uuid.uuid4().hex
+        self.inputs = inputs
+        self.options = options
+        self.workdir = os.path.join(workdir, self.id)
+        self.status = "queued"
+        self.stage = None
+        self.done = 0
+        self.total = 0
+        self.error = None
+        self.outputs = {}
+        self.summary = None
+        self.created = time.time()
+        self.finished = None
+        self._cancel = threading.Event()
+        self._future = None
+
+    def progress(self, stage, done=0, total=0):
+        """
+        Records progress from the worker.
+
+        Raises:
+            JobCancelled: If the job has been cancelled
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.stage, self.done, self.total = stage, done, total
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "done": self.done,
+            "total": self.total,
+            "error": self.error,
+            "outputs": sorted(self.outputs),
+            "summary": self.summary,
+        }
+
+
+class JobQueue:
+    """
+    Runs concatenation jobs on a bounded pool of worker threads.
+
+    At most max_pending jobs may be queued or running; further submissions
+    raise QueueFull so callers can ask clients to retry later. Finished jobs
+    are kept (with their outputs) until deleted or until more than
+    keep_finished have accumulated, oldest first.
+    """
+
+    def __init__(self, workdir, workers=2, max_pending=DEFAULT_MAX_PENDING,
+                 keep_finished=DEFAULT_KEEP_FINISHED, cache=None):
+        """
+        Args:
+            workdir (str): Directory job outputs are written under
+            workers (int): Jobs run at the same time
+            max_pending (int): Jobs queued or running before QueueFull
+            keep_finished (int): Finished jobs kept before the oldest is removed
+            cache (ParseCache, optional): Parsed-input cache shared by all jobs
+        """
+        self.workdir = workdir
+        self.max_pending = max_pending
+        self.keep_finished = keep_finished
+        self.cache = cache
+        self.jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sequencecat-job")
+        os.makedirs(workdir, exist_ok=True)
+
+    def pending(self):
+        return sum(job.status in ("queued", "running") for job in self.jobs.values())
+
+    def submit(self, inputs, options=None):
+        """
+        Queues a job concatenating `inputs` (paths, in partition order).
+
+        Args:
+            options (dict, optional): placeholder, nexus, interleave,
+                line_width, reader, check_lengths
+
+        Returns:
+            Job
+
+        Raises:
+            QueueFull: If max_pending jobs are already queued or running
+        """
+        with self._lock:
+            if self.pending() >= self.max_pending:
+                raise QueueFull(f"{self.max_pending} jobs are already queued or running")
+            job = Job(list(inputs), dict(options or {}), self.workdir)
+            self.jobs[job.id] = job
+            self._prune()
+        job._future = self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        """
+        Raises:
+            KeyError: If there is no such job
+        """
+        return self.jobs[job_id]
+
+    def delete(self, job_id):
+        """
+        Cancels a job if it has not finished and removes it with its outputs.
+
+        Raises:
+            KeyError: If there is no such job
+        """
+        with self._lock:
+            job = self.jobs.pop(job_id)
+        job._cancel.set()
+        if job._future is not None and job._future.cancel():
+            job.status = "cancelled"
+        elif job.status == "running":
+            # The worker removes the directory when it notices the cancellation
+            return job
+        shutil.rmtree(job.workdir, ignore_errors=True)
+        return job
+
+    def shutdown(self, wait=True):
+        for job in list(self.jobs.values()):
+            job._cancel.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _prune(self):
+        finished = [job for job in self.jobs.values() if job.status not in ("queued", "running")]
+        for job in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self.jobs[job.id]
+            shutil.rmtree(job.workdir, ignore_errors=True)
+
+    def _run(self, job):
+        job.status = "running"
+        try:
+            run_job(job, self.cache)
+        except JobCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        else:
+            job.status = "done"
+        job.finished = time.time()
+        if job._cancel.is_set():
+            shutil.rmtree(job.workdir, ignore_errors=True)
+
+
+def run_job(job, cache=None):
+    """
+    Reads, merges and writes one job's inputs into job.workdir, filling in
+    job.outputs ({name: path}) and job.summary.
+    """
+    options = job.options
+    placeholder = options.get("placeholder", "?")
+    os.makedirs(job.workdir, exist_ok=True)
+
+    results, errors = read_files(
+        job.inputs, reader=options.get("reader", "fast"),
+        check_lengths=options.get("check_lengths", False), cache=cache,
+        progress=lambda done, total: job.progress("Parsing files", done, total)
+    )
+    if errors:
+        raise IOError("; ".join(f"{os.path.basename(path)}: {message}" for path, message in errors))
+    sequence_dicts = [locus for path, sequences in results for locus in split_loci(path, sequences)]
+
+    merged, partitions = merge_sequences(
+        sequence_dicts, placeholder=placeholder,
+        progress=lambda done, total: job.progress("Merging loci", done, total)
+    )
+
+    base = os.path.join(job.workdir, "supermatrix")
+    job.progress("Writing FASTA")
+    write_fasta(merged, base + ".fasta", line_width=options.get("line_width", 60))
+    job.outputs["fasta"] = base + ".fasta"
+
+    partition_text = generate_partition_file(partitions, codon=True)
+    write_partition_file(partition_text, base + "_partition.txt")
+    job.outputs["partition"] = base + "_partition.txt"
+
+    if options.get("nexus"):
+        job.progress("Writing NEXUS")
+        write_nexus(merged, base + ".nex", partition_text, interleave=options.get("interleave", False))
+        job.outputs["nexus"] = base + ".nex"
+
+    job.progress("Computing statistics")
+    job.summary = compute_alignment_stats(merged, missing_char=placeholder)
+    job.summary["partitions"] = [list(partition) for partition in partitions]
+
+
+def _suffixes(filename):
+    parts = os.path.basename(filename or "").split(".")[1:][-2:]
+    return "".join("." + part for part in parts if _SUFFIX.match("." + part))
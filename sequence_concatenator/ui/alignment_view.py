@@ -0,0 +1,264 @@
+import bisect
+import tkinter as tk
+import tkinter.font as tkfont
+
+from sequence_concatenator.core.edit_journal import EditJournal
+
+# Widest taxon-name column drawn, in characters; longer names are cut
+MAX_NAME_WIDTH = 30
+# Column numbers are drawn on the ruler every this many columns
+RULER_STEP = 10
+
+
+class AlignmentViewport:
+    """
+    Display state of the alignment viewer, independent of Tk: the row order,
+    edits made in the viewer, and the slice of the alignment visible in a
+    window of rows x columns.
+
+    Only the visible cells are read. Sources with a row(taxon, start, end)
+    method (Alignment, SupermatrixFile) are sliced without decoding whole
+    rows; plain dicts are sliced as strings. Edits are kept in an overlay, so
+    the source is never modified, and recorded in an EditJournal that can be
+    applied to the per-locus inputs.
+    """
+
+    def __init__(self, sequences, partitions=None):
+        """
+        Args:
+            sequences (Mapping): {taxon: sequence}, an Alignment or a SupermatrixFile
+            partitions (list, optional): [(gene_label, start, end), ...] from merge_sequences
+        """
+        self.source = sequences
+        self.taxa = list(sequences)
+        self.partitions = list(partitions or [])
+        self._keys = {taxon: taxon for taxon in self.taxa}  # display name -> source key
+        self._edits = {}
+        self.journal = EditJournal()
+        self._starts = [start - 1 for _, start, _ in self.partitions]
+        self.length = self._source_length()
+
+    def _source_length(self):
+        for attr in ("alignment_length", "nchar"):
+            if hasattr(self.source, attr):
+                return getattr(self.source, attr)
+        return max((len(seq) for seq in self.source.values()), default=0)
+
+    @property
+    def num_rows(self):
+        return len(self.taxa)
+
+    def sequence(self, taxon):
+        """Returns a taxon's full (possibly edited) sequence."""
+        if taxon in self._edits:
+            return self._edits[taxon]
+        return self.source[self._keys[taxon]]
+
+    def segment(self, taxon, start, end):
+        """Returns a taxon's columns start..end-1 (0-based, half-open)."""
+        if taxon in self._edits:
+            return self._edits[taxon][start:end]
+        key = self._keys[taxon]
+        row = getattr(self.source, "row", None)
+        if row is not None:
+            return row(key, start + 1, end)
+        return self.source[key][start:end]
+
+    def window(self, first_row, rows, first_col, cols):
+        """
+        Returns [(taxon, segment), ...] for the visible rows, each segment
+        covering columns first_col..first_col+cols-1.
+        """
+        return [
+            (taxon, self.segment(taxon, first_col, first_col + cols))
+            for taxon in self.taxa[first_row:first_row + rows]
+        ]
+
+    def partition_at(self, column):
+        """Returns the label of the partition holding a 0-based column, or None."""
+        i = bisect.bisect_right(self._starts, column) - 1
+        if i >= 0 and column < self.partitions[i][2]:
+            return self.partitions[i][0]
+        return None
+
+    def partition_column(self, label):
+        """Returns the first 0-based column of a partition."""
+        for name, start, _ in self.partitions:
+            if name == label:
+                return start - 1
+        raise KeyError(label)
+
+    def set_sequence(self, taxon, sequence):
+        """
+        Replaces a taxon's sequence; returns its row index.
+
+        Raises:
+            ValueError: If the new sequence changes the row length
+        """
+        index = self.taxa.index(taxon)
+        self.journal.record_sequence(taxon, self.sequence(taxon), sequence)
+        self._edits[taxon] = sequence
+        return index
+
+    def rename(self, old, new):
+        """Renames a taxon, keeping its row; returns the row index."""
+        if new in self._keys:
+            raise ValueError(f"Taxon '{new}' already exists")
+        index = self.taxa.index(old)
+        self.journal.rename(old, new)
+        self.taxa[index] = new
+        self._keys[new] = self._keys.pop(old)
+        if old in self._edits:
+            self._edits[new] = self._edits.pop(old)
+        return index
+
+    def remove(self, taxon):
+        """Removes a taxon; returns the row index it had."""
+        index = self.taxa.index(taxon)
+        self.journal.remove(taxon)
+        del self.taxa[index]
+        del self._keys[taxon]
+        self._edits.pop(taxon, None)
+        return index
+
+    def to_dict(self):
+        """Returns {taxon: sequence} with all edits applied, in row order."""
+        return {taxon: self.sequence(taxon) for taxon in self.taxa}
+
+
+class AlignmentCanvas(tk.Frame):
+    """
+    Scrollable alignment display that draws only the visible rows and columns
+    of an AlignmentViewport: one text item per visible row, redrawn on scroll
+    or resize, so the cost of a redraw depends on the window size rather than
+    on the size of the alignment.
+    """
+
+    def __init__(self, parent, viewport, font=("Courier", 10)):
+        super().__init__(parent)
+        self.viewport = viewport
+        self.first_row = 0
+        self.first_col = 0
+        self._font = tkfont.Font(family=font[0], size=font[1])
+        self._char_width = self._font.measure("M")
+        self._line_height = self._font.metrics("linespace")
+        self._row_items = {}   # visible row index -> (name item, sequence item)
+
+        self.position_label = tk.Label(self, anchor="w", font=("Arial", 9))
+        self.position_label.grid(row=0, column=0, columnspan=2, sticky="ew")
+        self.canvas = tk.Canvas(self, background="white", highlightthickness=0)
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+        self.yscroll = tk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.yscroll.grid(row=1, column=1, sticky="ns")
+        self.xscroll = tk.Scrollbar(self, orient="horizontal", command=self._xview)
+        self.xscroll.grid(row=2, column=0, sticky="ew")
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self._on_wheel(event, horizontal=True))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_rows(-3))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_rows(3))
+        self.canvas.bind("<Shift-Button-4>", lambda event: self.scroll_columns(-RULER_STEP))
+        self.canvas.bind("<Shift-Button-5>", lambda event: self.scroll_columns(RULER_STEP))
+
+    # Geometry
+    def _name_width(self):
+        longest = max((len(taxon) for taxon in self.viewport.taxa), default=0)
+        return (min(longest, MAX_NAME_WIDTH) + 2) * self._char_width
+
+    def visible_size(self):
+        """Returns (rows, columns) that fit in the canvas."""
+        height = max(self.canvas.winfo_height(), 1)
+        width = max(self.canvas.winfo_width() - self._name_width(), 1)
+        return max(1, height // self._line_height - 1), max(1, width // self._char_width)
+
+    # Scrolling
+    def scroll_rows(self, delta):
+        self.show(self.first_row + delta, self.first_col)
+
+    def scroll_columns(self, delta):
+        self.show(self.first_row, self.first_col + delta)
+
+    def show(self, first_row, first_col):
+        rows, cols = self.visible_size()
+        self.first_row = max(0, min(first_row, self.viewport.num_rows - rows))
+        self.first_col = max(0, min(first_col, self.viewport.length - cols))
+        self.redraw()
+
+    def show_partition(self, label):
+        self.show(self.first_row, self.viewport.partition_column(label))
+
+    def _on_wheel(self, event, horizontal=False):
+        step = -1 if event.delta > 0 else 1
+        if horizontal:
+            self.scroll_columns(step * RULER_STEP)
+        else:
+            self.scroll_rows(step * 3)
+
+    def _scroll_command(self, args, first, total, page):
+        if args[0] == "moveto":
+            return int(float(args[1]) * total)
+        amount = int(args[1])
+        return first + amount * (page if args[2] == "pages" else 1)
+
+    def _yview(self, *args):
+        rows, _ = self.visible_size()
+        self.show(self._scroll_command(args, self.first_row, self.viewport.num_rows, rows), self.first_col)
+
+    def _xview(self, *args):
+        _, cols = self.visible_size()
+        self.show(self.first_row, self._scroll_command(args, self.first_col, self.viewport.length, cols))
+
+    # Drawing
+    def redraw(self):
+        """Redraws the visible window."""
+        canvas = self.canvas
+        canvas.delete("all")
+        self._row_items.clear()
+        rows, cols = self.visible_size()
+        name_width = self._name_width()
+        line = self._line_height
+
+        # Ruler: 1-based column numbers
+        first_mark = (self.first_col // RULER_STEP + 1) * RULER_STEP
+        for column in range(first_mark, self.first_col + cols + 1, RULER_STEP):
+            x = name_width + (column - 1 - self.first_col) * self._char_width
+            canvas.create_text(x, 0, text=str(column), anchor="n", font=self._font, fill="gray40")
+
+        for offset, (taxon, segment) in enumerate(
+            self.viewport.window(self.first_row, rows, self.first_col, cols)
+        ):
+            y = (offset + 1) * line
+            name = canvas.create_text(2, y, text=self._clip(taxon), anchor="nw", font=self._font, fill="navy")
+            sequence = canvas.create_text(name_width, y, text=segment, anchor="nw", font=self._font)
+            self._row_items[self.first_row + offset] = (name, sequence)
+
+        self._update_scrollbars(rows, cols)
+
+    def refresh_row(self, index):
+        """Redraws one row after an edit, if it is visible."""
+        items = self._row_items.get(index)
+        if items is None:
+            return
+        _, cols = self.visible_size()
+        taxon = self.viewport.taxa[index]
+        self.canvas.itemconfigure(items[0], text=self._clip(taxon))
+        self.canvas.itemconfigure(items[1], text=self.viewport.segment(taxon, self.first_col, self.first_col + cols))
+
+    def _clip(self, taxon):
+        return taxon if len(taxon) <= MAX_NAME_WIDTH else taxon[:MAX_NAME_WIDTH - 1] + "…"
+
+    def _update_scrollbars(self, rows, cols):
+        total_rows = max(self.viewport.num_rows, 1)
+        total_cols = max(self.viewport.length, 1)
+        self.yscroll.set(self.first_row / total_rows, min(1.0, (self.first_row + rows) / total_rows))
+        self.xscroll.set(self.first_col / total_cols, min(1.0, (self.first_col + cols) / total_cols))
+
+        last = min(self.first_col + cols, self.viewport.length)
+        text = f"Columns {self.first_col + 1}-{last} of {self.viewport.length}"
+        partition = self.viewport.partition_at(self.first_col)
+        if partition is not None:
+            text += f"  |  Partition: {partition}"
+        self.position_label.config(text=text)
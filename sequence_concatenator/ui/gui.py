@@ -1,24 +1,26 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from sequence_concatenator.readers.fasta_reader import read_fasta
-from sequence_concatenator.readers.nexus_reader import read_nexus
-from sequence_concatenator.readers.genbank_reader import read_genbank
-from sequence_concatenator.core.sequence_merger import merge_sequences
-from sequence_concatenator.core.partition_generator import generate_partition_file
-from sequence_concatenator.writers.fasta_writer import write_fasta
-from sequence_concatenator.writers.partition_writer import write_partition_file
-from sequence_concatenator.writers.nexus_writer import write_nexus
-from sequence_concatenator.core.stats import compute_alignment_stats
+from sequence_concatenator.core.edit_journal import EditJournal
 from sequence_concatenator.ui.viewer import SequenceViewer
-from sequence_concatenator.writers.report_writer import write_report
+from sequence_concatenator.ui.worker import (
+    BackgroundTask, describe_progress, export_task, load_files_task, merge_edited_task
+)
+from sequence_concatenator.readers.registry import registered_formats
+from sequence_concatenator.utils.file_utils import is_supported_format
 import os
 
+# How often the main loop checks a background task for progress (ms)
+POLL_INTERVAL_MS = 50
+
 class SequenceGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Sequence Concatenator")
         self.sequence_dicts = []
         self.loaded_files = []  # Track loaded file paths
+        self.edits = EditJournal()  # Saved viewer edits not yet applied to sequence_dicts
+        self.merged = None  # (merged, partitions) with edits applied; dropped when files are added
+        self.task = None  # Running BackgroundTask, if any
 
         self.build_interface()
 
@@ -36,6 +38,12 @@ class SequenceGUI:
         self.clear_button = tk.Button(button_frame, text="Clear All", command=self.clear_all)
         self.clear_button.pack(side="left", padx=5)
 
+        tk.Label(button_frame, text="Parallel jobs:").pack(side="left", padx=(15, 2))
+        self.jobs_var = tk.IntVar(value=os.cpu_count() or 1)
+        self.jobs_spinbox = tk.Spinbox(button_frame, from_=1, to=os.cpu_count() or 1,
+                                       width=4, textvariable=self.jobs_var)
+        self.jobs_spinbox.pack(side="left")
+
         # Loaded files list
         files_frame = tk.Frame(self.root)
         files_frame.pack(pady=10, fill='both', expand=True)
@@ -51,15 +59,21 @@ class SequenceGUI:
         self.files_listbox.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Run pipeline button
-        self.run_button = tk.Button(self.root, text="Concatenate, Export, and Report", command=self.run_pipeline)
-        self.run_button.pack(pady=10)
+        # Run pipeline and cancel buttons
+        run_frame = tk.Frame(self.root)
+        run_frame.pack(pady=10)
+
+        self.run_button = tk.Button(run_frame, text="Concatenate, Export, and Report", command=self.run_pipeline)
+        self.run_button.pack(side="left", padx=5)
+
+        self.cancel_button = tk.Button(run_frame, text="Cancel", command=self.cancel_task, state=tk.DISABLED)
+        self.cancel_button.pack(side="left", padx=5)
 
         # Status and progress
         self.status_label = tk.Label(self.root, text="Ready", fg="green", font=("Arial", 10))
         self.status_label.pack(pady=5)
 
-        self.progress = ttk.Progressbar(self.root, mode='indeterminate')
+        self.progress = ttk.Progressbar(self.root, mode='determinate')
         self.progress.pack(pady=5, fill='x', padx=20)
 
         # Stats and outputs display
@@ -68,11 +82,51 @@ class SequenceGUI:
 
     def update_status(self, message, is_working=False):
         self.status_label.config(text=message, fg="blue" if is_working else "green")
-        if is_working:
-            self.progress.start(10)
-        else:
-            self.progress.stop()
-        self.root.update()
+        if not is_working:
+            self.progress.config(value=0)
+
+    def run_task(self, func, *args, on_done):
+        """
+        Runs func(task, *args) on a background worker, keeping the window
+        responsive; on_done(result) is called on the main thread when it
+        finishes. Buttons that start work are disabled meanwhile.
+        """
+        self.task = BackgroundTask(func, *args).start()
+        self.set_busy(True)
+        self.root.after(POLL_INTERVAL_MS, self.poll_task, on_done)
+
+    def poll_task(self, on_done):
+        latest = None
+        for kind, value in self.task.poll():
+            if kind == "progress":
+                latest = value
+                continue
+            self.task = None
+            self.set_busy(False)
+            if kind == "done":
+                on_done(value)
+            elif kind == "cancelled":
+                self.update_status("Cancelled", False)
+            else:
+                self.update_status("Error", False)
+                messagebox.showerror("Error", str(value))
+            return
+        if latest is not None:
+            self.progress.config(maximum=max(latest.total, 1), value=latest.done)
+            self.update_status(describe_progress(latest), True)
+        self.root.after(POLL_INTERVAL_MS, self.poll_task, on_done)
+
+    def cancel_task(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.cancel_button.config(state=tk.DISABLED)
+            self.update_status("Cancelling...", True)
+
+    def set_busy(self, busy):
+        state = tk.DISABLED if busy else tk.NORMAL
+        for button in (self.select_button, self.edit_button, self.clear_button, self.run_button):
+            button.config(state=state)
+        self.cancel_button.config(state=tk.NORMAL if busy else tk.DISABLED)
 
     def update_files_display(self):
         self.files_listbox.delete(0, tk.END)
@@ -82,96 +136,108 @@ class SequenceGUI:
 
     def clear_all(self):
         self.sequence_dicts.clear()
+        self.edits.clear()
+        self.merged = None
         self.loaded_files.clear()
         self.files_listbox.delete(0, tk.END)
         self.stats_text.delete(1.0, tk.END)
-        self.progress.stop()
+        self.progress.config(value=0)
         self.status_label.config(text="Ready", fg="green")
         messagebox.showinfo("Cleared", "All data has been cleared.")
 
     def load_files(self):
+        formats = [(spec.label, " ".join(f"*.{ext}" for ext in spec.extensions))
+                   for spec in registered_formats()]
         paths = filedialog.askopenfilenames(filetypes=[
-            ("All supported", "*.fasta *.fa *.nex *.gbff"),
-            ("FASTA", "*.fasta *.fa"),
-            ("NEXUS", "*.nex"),
-            ("GenBank", "*.gbff")
+            ("All supported", " ".join(patterns for _, patterns in formats)),
+            *formats,
+            ("All files", "*")
         ])
         if not paths:
             return
 
-        self.update_status("Loading files...", True)
-        for path in paths:
-            if path in self.loaded_files:
-                continue
-            ext = os.path.splitext(path)[1].lower()
-            self.update_status(f"Loading {os.path.basename(path)}", True)
-            try:
-                if ext in [".fasta", ".fa"]:
-                    self.sequence_dicts.append(read_fasta(path))
-                elif ext == ".nex":
-                    self.sequence_dicts.append(read_nexus(path))
-                elif ext == ".gbff":
-                    self.sequence_dicts.append(read_genbank(path))
-                else:
-                    continue
-                self.loaded_files.append(path)
-            except Exception as e:
-                self.update_status("Error loading files", False)
-                messagebox.showerror("Read Error", f"Failed to read {path}:\n{e}")
-                return
+        new_paths = [p for p in paths if p not in self.loaded_files and is_supported_format(p)]
+        if not new_paths:
+            return
+
+        self.update_status(f"Loading {len(new_paths)} files...", True)
+        try:
+            jobs = max(1, self.jobs_var.get())
+        except tk.TclError:
+            jobs = 1
+        self.run_task(load_files_task, new_paths, jobs, on_done=self.files_loaded)
+
+    def files_loaded(self, outcome):
+        results, errors = outcome
+        for path, sequences in results:
+            self.sequence_dicts.append(sequences)
+            self.loaded_files.append(path)
+        if results:
+            self.merged = None
 
         self.update_files_display()
+        if errors:
+            self.update_status("Error loading files", False)
+            details = "\n".join(f"{os.path.basename(path)}: {message}" for path, message in errors)
+            messagebox.showerror("Read Error", f"Failed to read {len(errors)} file(s):\n{details}")
+            return
+
         self.update_status(f"Loaded {len(self.sequence_dicts)} files", False)
         messagebox.showinfo("Files Loaded", f"Total loaded: {len(self.sequence_dicts)} files.")
 
+    def with_merged(self, then):
+        """
+        Calls then(merged, partitions), merging on the background worker only
+        if files were added since the last merge. Pending edits are applied to
+        the loci they touch first, so partition boundaries are kept.
+        """
+        if self.merged is not None:
+            then(*self.merged)
+            return
+        def on_merged(outcome):
+            self.sequence_dicts, merged, partitions = outcome
+            self.edits = EditJournal()
+            self.merged = (merged, partitions)
+            then(merged, partitions)
+        self.run_task(merge_edited_task, list(self.sequence_dicts), self.edits, "?", on_done=on_merged)
+
     def edit_sequences(self):
         if not self.sequence_dicts:
             messagebox.showwarning("No Data", "Load files before editing.")
             return
-        merged, _ = merge_sequences(self.sequence_dicts, placeholder="?")
-        def on_update(updated):
-            self.sequence_dicts = [updated]
-            messagebox.showinfo("Updated", "Sequences updated for next run.")
-        SequenceViewer(self.root, merged, on_update=on_update)
+        def on_update(journal):
+            if self.merged is not None:
+                merged, partitions = self.merged
+                self.merged = (journal.apply_merged(merged), partitions)
+            self.edits.extend(journal)
+            messagebox.showinfo("Updated", f"{len(journal)} edit(s) saved for next run.")
+        def open_viewer(merged, partitions):
+            self.update_status("Ready", False)
+            SequenceViewer(self.root, merged, on_update=on_update, partitions=partitions)
+        self.with_merged(open_viewer)
 
     def run_pipeline(self):
         if not self.sequence_dicts:
             messagebox.showwarning("No Data", "Please load sequence files first.")
             return
-        # Merge
-        self.update_status("Merging sequences...", True)
-        merged, partitions = merge_sequences(self.sequence_dicts, placeholder="?")
-        # Export
-        output_base = filedialog.asksaveasfilename(defaultextension=".pdf",
+        report_path = filedialog.asksaveasfilename(defaultextension=".pdf",
                                                    filetypes=[("PDF Report", "*.pdf")])
-        if not output_base:
+        if not report_path:
             self.update_status("Export cancelled", False)
             return
-        report_path = output_base
-
-        self.update_status("Writing report...", True)
-        stats = compute_alignment_stats(merged, missing_char="?")
-        write_report(merged, partitions, stats, self.loaded_files, report_path)
 
-        # Also write data files
-        fasta_path = report_path.replace(".pdf", ".fasta")
-        partition_path = report_path.replace(".pdf", "_partition.txt")
-        nexus_path = report_path.replace(".pdf", ".nex")
-
-        self.write_data_files(merged, partitions, report_path)
+        self.update_status("Merging sequences...", True)
+        self.with_merged(lambda merged, partitions: self.run_task(
+            export_task, list(self.sequence_dicts), list(self.loaded_files), report_path,
+            "?", (merged, partitions), on_done=self.pipeline_finished
+        ))
 
-        # Show stats
+    def pipeline_finished(self, paths):
+        # Show outputs
         self.stats_text.delete(1.0, tk.END)
-        self.stats_text.insert(tk.END, f"Generated report: {os.path.basename(report_path)}\n")
+        self.stats_text.insert(tk.END, f"Generated report: {os.path.basename(paths['report'])}\n")
+        for key in ("fasta", "partition", "nexus"):
+            self.stats_text.insert(tk.END, f"Wrote: {os.path.basename(paths[key])}\n")
 
         self.update_status("Done", False)
-        messagebox.showinfo("Completed", "PDF report and data exports finished!")
-
-    def write_data_files(self, merged, partitions, report_path):
-        fasta_path = report_path.replace(".pdf", ".fasta")
-        partition_path = report_path.replace(".pdf", "_partition.txt")
-        nexus_path = report_path.replace(".pdf", ".nex")
-        write_fasta(merged, fasta_path)
-        partition_text = generate_partition_file(partitions, codon=True)
-        write_partition_file(partition_text, partition_path)
-        write_nexus(merged, nexus_path, partition_text)
\ No newline at end of file
+        messagebox.showinfo("Completed", "PDF report and data exports finished!")
\ No newline at end of file
@@ -1,28 +1,34 @@
 import tkinter as tk
-from tkinter import scrolledtext, messagebox, simpledialog
+from tkinter import scrolledtext, messagebox, simpledialog, ttk
+from sequence_concatenator.core.edit_journal import EditJournal
+from sequence_concatenator.ui.alignment_view import AlignmentCanvas, AlignmentViewport
 
 class SequenceViewer(tk.Toplevel):
-    def __init__(self, parent, sequences, on_update=None):
+    def __init__(self, parent, sequences, on_update=None, partitions=None):
         """
         Sequence editor/viewer window.
 
+        The alignment is shown in a virtualized view that draws only the
+        visible rows and columns, so large supermatrices open and scroll
+        quickly; edits update the affected row only.
+
         Args:
             parent (tk.Tk): Parent window
-            sequences (dict): {taxon: sequence}
-            on_update (callable, optional): Callback function to receive updated sequences
+            sequences (Mapping): {taxon: sequence}, an Alignment or a SupermatrixFile
+            on_update (callable, optional): Callback receiving an EditJournal of the changes made
+            partitions (list, optional): [(gene_label, start, end), ...] for jumping to loci
         """
         super().__init__(parent)
         self.title("Sequence Editor")
-        self.geometry("800x500")
+        self.geometry("1000x600")
 
         self.original_sequences = sequences
-        self.sequences = sequences.copy()
+        self.viewport = AlignmentViewport(sequences, partitions)
         self.on_update = on_update
         self.current_taxon = None
 
         self._build_ui()
         self._load_taxa()
-        self._show_all_sequences()
 
     def _build_ui(self):
         # Left panel: taxa list and controls
@@ -31,6 +37,7 @@ class SequenceViewer(tk.Toplevel):
 
         self.taxa_list = tk.Listbox(taxa_frame, height=20)
         self.taxa_list.pack(fill=tk.Y, expand=True)
+        self.taxa_list.bind("<Double-Button-1>", lambda event: self._view_selected())
 
         button_frame = tk.Frame(taxa_frame)
         button_frame.pack(fill=tk.X, pady=5)
@@ -41,69 +48,86 @@ class SequenceViewer(tk.Toplevel):
         tk.Button(button_frame, text="Apply Edit", command=self._apply_edit).pack(fill=tk.X, pady=2)
         tk.Button(button_frame, text="Save Changes", command=self._save_changes).pack(fill=tk.X, pady=10)
 
-        # Right panel: sequence display/edit area
-        self.text_box = scrolledtext.ScrolledText(self, wrap=tk.WORD, font=("Courier", 10))
-        self.text_box.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Right panel: partition navigation, alignment view and sequence editor
+        right_frame = tk.Frame(self)
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        if self.viewport.partitions:
+            nav_frame = tk.Frame(right_frame)
+            nav_frame.pack(fill=tk.X)
+            tk.Label(nav_frame, text="Go to partition:").pack(side=tk.LEFT)
+            self.partition_var = tk.StringVar()
+            partition_box = ttk.Combobox(
+                nav_frame, textvariable=self.partition_var, state="readonly",
+                values=[label for label, _, _ in self.viewport.partitions]
+            )
+            partition_box.pack(side=tk.LEFT, padx=5)
+            partition_box.bind("<<ComboboxSelected>>", lambda event: self.alignment_view.show_partition(self.partition_var.get()))
+
+        self.alignment_view = AlignmentCanvas(right_frame, self.viewport)
+        self.alignment_view.pack(fill=tk.BOTH, expand=True)
+
+        self.editor_label = tk.Label(right_frame, text="Select a taxon and click View to edit it", anchor="w")
+        self.editor_label.pack(fill=tk.X, pady=(5, 0))
+        self.text_box = scrolledtext.ScrolledText(right_frame, wrap=tk.CHAR, height=8, font=("Courier", 10))
+        self.text_box.pack(fill=tk.X)
         self.text_box.config(state=tk.DISABLED)
 
     def _load_taxa(self):
         self.taxa_list.delete(0, tk.END)
-        for taxon in sorted(self.sequences.keys()):
+        for taxon in sorted(self.viewport.taxa):
             self.taxa_list.insert(tk.END, taxon)
 
-    def _show_all_sequences(self):
-        """
-        Display all sequences read-only in FASTA style.
-        """
-        self.current_taxon = None
-        self.text_box.config(state=tk.NORMAL)
-        self.text_box.delete(1.0, tk.END)
-        for taxon, seq in self.sequences.items():
-            self.text_box.insert(tk.END, f">{taxon}\n")
-            for i in range(0, len(seq), 80):
-                self.text_box.insert(tk.END, seq[i:i+80] + "\n")
-            self.text_box.insert(tk.END, "\n")
-        self.text_box.config(state=tk.DISABLED)
+    def _selected_taxon(self):
+        selection = self.taxa_list.curselection()
+        return self.taxa_list.get(selection[0]) if selection else None
 
     def _view_selected(self):
         """
-        Display only the selected taxon's sequence and enable editing.
+        Scroll the alignment to the selected taxon and load its sequence for editing.
         """
-        selection = self.taxa_list.curselection()
-        if not selection:
+        taxon = self._selected_taxon()
+        if taxon is None:
             return
-        taxon = self.taxa_list.get(selection[0])
         self.current_taxon = taxon
-        seq = self.sequences.get(taxon, "")
+        seq = self.viewport.sequence(taxon)
+        self.alignment_view.show(self.viewport.taxa.index(taxon), self.alignment_view.first_col)
 
+        self.editor_label.config(text=f"Editing: {taxon} ({len(seq)} columns)")
         self.text_box.config(state=tk.NORMAL)
         self.text_box.delete(1.0, tk.END)
-        self.text_box.insert(tk.END, f">{taxon}\n")
-        for i in range(0, len(seq), 80):
-            self.text_box.insert(tk.END, seq[i:i+80] + "\n")
-        self.text_box.config(state=tk.NORMAL)
+        self.text_box.insert(tk.END, f">{taxon}\n" + "\n".join(seq[i:i+80] for i in range(0, len(seq), 80)))
 
     def _rename_selected(self):
-        selection = self.taxa_list.curselection()
-        if not selection:
+        old_name = self._selected_taxon()
+        if old_name is None:
             return
-        old_name = self.taxa_list.get(selection[0])
         new_name = simpledialog.askstring("Rename Taxon", f"Enter new name for '{old_name}':", initialvalue=old_name)
         if new_name and new_name != old_name:
-            self.sequences[new_name] = self.sequences.pop(old_name)
+            try:
+                index = self.viewport.rename(old_name, new_name)
+            except ValueError as e:
+                messagebox.showerror("Rename Failed", str(e))
+                return
+            if self.current_taxon == old_name:
+                self.current_taxon = new_name
             self._load_taxa()
-            self._show_all_sequences()
+            self.alignment_view.refresh_row(index)
             messagebox.showinfo("Renamed", f"'{old_name}' renamed to '{new_name}'")
 
     def _remove_selected(self):
-        selection = self.taxa_list.curselection()
-        if not selection:
+        taxon = self._selected_taxon()
+        if taxon is None:
             return
-        taxon = self.taxa_list.get(selection[0])
         if messagebox.askyesno("Remove Taxon", f"Remove '{taxon}'?"):
-            del self.sequences[taxon]
+            self.viewport.remove(taxon)
+            if self.current_taxon == taxon:
+                self.current_taxon = None
+                self.text_box.delete(1.0, tk.END)
+                self.text_box.config(state=tk.DISABLED)
             self._load_taxa()
-            self._show_all_sequences()
+            # Rows below the removed one shift up; only the visible window is redrawn
+            self.alignment_view.show(self.alignment_view.first_row, self.alignment_view.first_col)
 
     def _apply_edit(self):
         """
@@ -119,13 +143,18 @@ class SequenceViewer(tk.Toplevel):
         # Skip header line
         seq_lines = content[1:]
         new_seq = ''.join(line.strip() for line in seq_lines)
-        self.sequences[self.current_taxon] = new_seq
+        try:
+            index = self.viewport.set_sequence(self.current_taxon, new_seq)
+        except ValueError as e:
+            messagebox.showerror("Invalid Edit", str(e))
+            return
+        self.alignment_view.refresh_row(index)
         messagebox.showinfo("Sequence Updated", f"Sequence for '{self.current_taxon}' has been updated.")
 
     def _save_changes(self):
         """
-        Trigger the update callback with modified sequences.
+        Trigger the update callback with the journal of edits made so far.
         """
         if self.on_update:
-            self.on_update(self.sequences)
-        self.destroy()
\ No newline at end of file
+            self.on_update(self.viewport.journal)
+            self.viewport.journal = EditJournal()
@@ -0,0 +1,227 @@
+import os
+import queue
+import threading
+from collections import namedtuple
+
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.stats import compute_alignment_stats, compute_detailed_stats
+from sequence_concatenator.readers.loader import read_files
+from sequence_concatenator.writers.fasta_writer import write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+from sequence_concatenator.writers.report_writer import write_report
+
+Progress = namedtuple("Progress", ["stage", "done", "total", "unit"])
+Progress.__doc__ = """
+A progress report from a background task.
+
+    stage (str): What is being done, e.g. "Parsing files"
+    done (int): Units finished so far
+    total (int): Units in this stage
+    unit (str): "files", "loci", "bytes", or "" for single-step stages
+"""
+
+
+class Cancelled(Exception):
+    """Raised inside a background task once it has been cancelled."""
+
+
+class BackgroundTask:
+    """
+    Runs a function on a worker thread and hands its progress, result or error
+    to the GUI thread through a queue, so Tk widgets are only ever touched
+    from the main loop.
+
+    The function is called as func(task, *args) and reports with
+    task.progress(...). Once cancel() has been called, the next progress
+    report raises Cancelled inside the worker, so work stops at the next
+    file, locus or output row.
+    """
+
+    def __init__(self, func, *args):
+        self._func = func
+        self._args = args
+        self._events = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def wait(self, timeout=None):
+        """Blocks until the worker thread has finished; returns whether it has."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def progress(self, stage, done, total, unit=""):
+        """
+        Reports progress from the worker thread.
+
+        Raises:
+            Cancelled: If the task has been cancelled
+        """
+        if self._cancel.is_set():
+            raise Cancelled()
+        self._events.put(("progress", Progress(stage, done, total, unit)))
+
+    def poll(self):
+        """
+        Returns the events queued since the last call, oldest first, as
+        (kind, value) pairs: ("progress", Progress), ("done", result),
+        ("error", exception) or ("cancelled", None). "done", "error" and
+        "cancelled" are final.
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self):
+        try:
+            result = self._func(self, *self._args)
+        except Cancelled:
+            self._events.put(("cancelled", None))
+        except Exception as e:
+            self._events.put(("error", e))
+        else:
+            self._events.put(("done", result))
+
+
+def describe_progress(progress):
+    """
+    Returns a status line for a Progress, e.g. "Merging loci: 120 of 500".
+    """
+    if progress.unit == "bytes":
+        return f"{progress.stage}: {progress.done / 1e6:.1f} of {progress.total / 1e6:.1f} MB"
+    if progress.unit:
+        return f"{progress.stage}: {progress.done} of {progress.total} {progress.unit}"
+    return f"{progress.stage}..."
+
+
+def load_files_task(task, paths, jobs=1):
+    """
+    Parses input files, reporting each file parsed.
+
+    Returns:
+        tuple: (results, errors) as from read_files
+    """
+    return read_files(
+        paths, jobs=jobs,
+        progress=lambda done, total: task.progress("Parsing files", done, total, "files")
+    )
+
+
+def merge_task(task, sequence_dicts, placeholder="?"):
+    """
+    Merges loci, reporting each locus merged.
+
+    Returns:
+        tuple: (merged, partitions) as from merge_sequences
+    """
+    return merge_sequences(
+        sequence_dicts, placeholder=placeholder,
+        progress=lambda done, total: task.progress("Merging loci", done, total, "loci")
+    )
+
+
+def merge_edited_task(task, sequence_dicts, journal, placeholder="?"):
+    """
+    Applies an EditJournal to the per-locus inputs, then merges them. Only
+    loci the edits touch are copied; the others are passed through as is.
+
+    Returns:
+        tuple: (sequence_dicts, merged, partitions) with the edits applied
+    """
+    if len(journal):
+        task.progress("Applying edits", 0, 1)
+        sequence_dicts, _ = journal.apply(sequence_dicts, placeholder=placeholder)
+    merged, partitions = merge_task(task, sequence_dicts, placeholder)
+    return sequence_dicts, merged, partitions
+
+
+def export_task(task, sequence_dicts, input_files, report_path, placeholder="?", merged=None):
+    """
+    Merges loci and writes the FASTA, partition and NEXUS files and the PDF
+    report next to `report_path`, reporting loci merged and bytes written.
+
+    If the task is cancelled, the output files this export started writing
+    are removed; other files at the output paths are left alone.
+
+    Args:
+        merged (tuple, optional): (merged, partitions) already built from
+            sequence_dicts; when given, the loci are not merged again
+
+    Returns:
+        dict: {"fasta": path, "partition": path, "nexus": path, "report": path}
+    """
+    if merged is None:
+        merged, partitions = merge_task(task, sequence_dicts, placeholder)
+    else:
+        merged, partitions = merged
+
+    base = os.path.splitext(report_path)[0]
+    paths = {
+        "fasta": base + ".fasta",
+        "partition": base + "_partition.txt",
+        "nexus": base + ".nex",
+        "report": report_path,
+    }
+    written = []
+    try:
+        _write_outputs(task, merged, partitions, input_files, paths, placeholder, written)
+    except Cancelled:
+        for path in written:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    return paths
+
+
+def _write_outputs(task, merged, partitions, input_files, paths, placeholder, written):
+    """Writes the outputs, adding each path to `written` before it is opened."""
+    taxa = sorted(merged)
+    nchar = len(next(iter(merged.values()))) if merged else 0
+
+    written.append(paths["fasta"])
+    write_fasta(_tracked_rows(task, "Writing FASTA", merged.items(), merged), paths["fasta"])
+    partition_text = generate_partition_file(partitions, codon=True)
+    written.append(paths["partition"])
+    write_partition_file(partition_text, paths["partition"])
+    rows = ((taxon, merged[taxon]) for taxon in taxa)
+    written.append(paths["nexus"])
+    write_nexus(
+        _tracked_rows(task, "Writing NEXUS", rows, merged), paths["nexus"], partition_text,
+        taxa=taxa, nchar=nchar
+    )
+
+    task.progress("Computing statistics", 0, 1)
+    try:
+        stats = compute_detailed_stats(merged, partitions, missing_char=placeholder)
+    except ImportError:
+        stats = compute_alignment_stats(merged, missing_char=placeholder)
+    task.progress("Writing report", 0, 1)
+    written.append(paths["report"])
+    write_report(merged, partitions, stats, input_files, paths["report"], missing_char=placeholder)
+    task.progress("Writing report", 1, 1)
+
+
+def _tracked_rows(task, stage, rows, merged):
+    """Yields (taxon, sequence) rows, reporting the bytes written so far."""
+    total = sum(len(taxon) + len(sequence) + 2 for taxon, sequence in merged.items())
+    written = 0
+    task.progress(stage, written, total, "bytes")
+    for taxon, sequence in rows:
+        yield taxon, sequence
+        written += len(taxon) + len(sequence) + 2
+        task.progress(stage, written, total, "bytes")
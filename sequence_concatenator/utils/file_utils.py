@@ -1,15 +1,28 @@
+import gzip
+import io
+import os
 from pathlib import Path
 
+# Suffix and leading bytes of each supported compression format.
+COMPRESSION_SUFFIXES = {"gz": "gzip", "bgz": "gzip", "zst": "zstd"}
+OUTPUT_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_MAGIC = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+
+
 def get_extension(path):
     """
-    Returns the lowercase file extension without the leading dot.
+    Returns the lowercase file extension without the leading dot, ignoring a
+    trailing compression suffix.
 
     Args:
         path (str or Path): File path
 
     Returns:
-        str: e.g. "fasta", "nex", "gbff"
+        str: e.g. "fasta", "nex", "gbff" (also for "loci.fasta.gz")
     """
+    suffixes = [s.lower().lstrip(".") for s in Path(path).suffixes]
+    if len(suffixes) > 1 and suffixes[-1] in COMPRESSION_SUFFIXES:
+        return suffixes[-2]
     return Path(path).suffix.lower().lstrip(".")
 
 def is_supported_format(path):
@@ -20,9 +33,12 @@ def is_supported_format(path):
         path (str or Path): File path
 
     Returns:
-        bool: True if extension is recognized
+        bool: True if a registered reader recognises the file's content or
+        extension
     """
-    return get_extension(path) in {"fasta", "fa", "nex", "gbff"}
+    from sequence_concatenator.readers.registry import detect_format
+
+    return detect_format(str(path)) is not None
 
 def group_files_by_type(paths):
     """
@@ -38,4 +54,144 @@ def group_files_by_type(paths):
     for path in paths:
         ext = get_extension(path)
         grouped.setdefault(ext, []).append(path)
-    return grouped
\ No newline at end of file
+    return grouped
+
+def get_compression(path):
+    """
+    Detects the compression of a file from its leading bytes, or from its
+    suffix if it does not exist yet.
+
+    Args:
+        path (str or Path): File path
+
+    Returns:
+        str or None: "gzip", "zstd" or None for plain files
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4)
+    except OSError:
+        return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower().lstrip("."))
+    for magic, compression in _MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+def open_input(path, mode="rb"):
+    """
+    Opens a possibly compressed input file (gzip, bgzip or zstd) for reading.
+
+    Args:
+        path (str or Path): File path
+        mode (str): "rb" for bytes or "r" for text
+
+    Returns:
+        file object
+    """
+    compression = get_compression(path)
+    if compression == "gzip":
+        handle = gzip.open(path, "rb")
+    elif compression == "zstd":
+        zstd = _require_zstandard()
+        raw = open(path, "rb")
+        reader = zstd.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        handle = io.BufferedReader(reader, buffer_size=1 << 20)
+    else:
+        handle = open(path, "rb", buffering=1 << 20)
+    return handle if "b" in mode else io.TextIOWrapper(handle)
+
+def open_output(path, compress=None, threads=None):
+    """
+    Opens a text file for writing, optionally compressed.
+
+    gzip output is compressed in independent 1 MiB members on a thread pool
+    (readable by any gzip tool); zstd output uses zstandard's own worker
+    threads.
+
+    Args:
+        path (str or Path): Output path (used as given; see compressed_path)
+        compress (str, optional): None, "gzip" or "zstd"
+        threads (int, optional): Compression threads (default: all CPUs)
+
+    Returns:
+        file object
+    """
+    if compress is None:
+        return open(path, "w", buffering=1 << 20)
+    if compress == "gzip":
+        raw = ParallelGzipWriter(path, threads=threads)
+    elif compress == "zstd":
+        zstd = _require_zstandard()
+        compressor = zstd.ZstdCompressor(level=3, threads=threads or -1)
+        raw = compressor.stream_writer(open(path, "wb"), closefd=True)
+    else:
+        raise ValueError(f"Unsupported compression: {compress}")
+    return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=1 << 20))
+
+def compressed_path(path, compress=None):
+    """
+    Appends the suffix for a compression format to an output path.
+
+    Returns:
+        str: e.g. "out.fasta.gz" for ("out.fasta", "gzip")
+    """
+    return str(path) + OUTPUT_SUFFIXES[compress] if compress else str(path)
+
+def _require_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd support requires the zstandard package. "
+            "Install it with: pip install 'sequence-concatenator[zstd]'"
+        )
+    return zstandard
+
+
+class ParallelGzipWriter(io.RawIOBase):
+    """
+    Writes a multi-member gzip file, compressing fixed-size blocks on a
+    thread pool (zlib releases the GIL) and writing them in order.
+    """
+
+    def __init__(self, path, threads=None, block_size=1 << 20, level=6):
+        from concurrent.futures import ThreadPoolExecutor
+
+        super().__init__()
+        self._file = open(path, "wb")
+        self._threads = threads or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self._threads)
+        self._block_size = block_size
+        self._level = level
+        self._buffer = bytearray()
+        self._pending = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[:self._block_size]))
+            del self._buffer[:self._block_size]
+        return len(data)
+
+    def _submit(self, block):
+        self._pending.append(self._executor.submit(gzip.compress, block, self._level, mtime=0))
+        while len(self._pending) > 2 * self._threads:
+            self._file.write(self._pending.pop(0).result())
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self._pending:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            for future in self._pending:
+                self._file.write(future.result())
+            self._pending.clear()
+        finally:
+            self._executor.shutdown()
+            self._file.close()
+            super().close()
@@ -30,6 +30,23 @@ def get_all_taxa(sequence_dicts):
     return taxa
 
 
+def get_ordered_taxa(sequence_dicts):
+    """
+    Collects all unique taxa names across multiple sequence dictionaries,
+    preserving the order in which they are first seen.
+
+    Args:
+        sequence_dicts (list of dict): [{taxon: seq}, ...]
+
+    Returns:
+        list: All unique taxa
+    """
+    taxa = {}
+    for seq_dict in sequence_dicts:
+        taxa.update(dict.fromkeys(seq_dict))
+    return list(taxa)
+
+
 def ensure_consistent_length(sequence_dict):
     """
     Validates that all sequences in a dict are of equal length.
@@ -0,0 +1,139 @@
+import json
+import os
+import struct
+from pathlib import Path
+
+from sequence_concatenator.core.alignment import Alignment, np, require_numpy
+
+FORMAT_VERSION = 1
+MAGIC = b"SQCMATRX"
+HEADER = struct.Struct("<8sBQ")  # magic, format version, length of the JSON header
+DATA_ALIGNMENT = 64
+
+# Symbols stored per byte for each matrix encoding
+ENCODINGS = {"2bit": 4, "4bit": 2, "byte": 1}
+_MAX_SYMBOLS = {"2bit": 4, "4bit": 16, "byte": 256}
+
+
+def write_supermatrix(sequence_dict, output_path, partitions=None, encoding="auto"):
+    """
+    Writes an aligned supermatrix to the binary .sqm format.
+
+    Layout: a fixed header (magic, version, JSON length), a JSON header with
+    taxa, partitions, nchar, encoding and symbol alphabet, then one
+    fixed-stride row per taxon starting at a 64-byte boundary. Rows are
+    packed 4 symbols per byte ("2bit"), 2 per byte ("4bit") or stored as
+    ASCII ("byte"), so a row or column range can be read straight from a
+    memory map (see readers.binary_reader).
+
+    Args:
+        sequence_dict (dict): {taxon: sequence} with equal-length sequences,
+            or an Alignment
+        output_path (str): Output file path
+        partitions (list, optional): [(gene_label, start, end), ...]; defaults
+            to the Alignment's partitions or one partition over all columns
+        encoding (str): "auto" (smallest encoding that fits the symbols used;
+            "byte" without NumPy), "2bit", "4bit" or "byte"
+
+    Raises:
+        ValueError: If sequence lengths differ or the alphabet does not fit the encoding
+    """
+    taxa = list(sequence_dict)
+    if isinstance(sequence_dict, Alignment):
+        nchar = sequence_dict.alignment_length
+    else:
+        nchar = len(sequence_dict[taxa[0]]) if taxa else 0
+    if partitions is None:
+        partitions = getattr(sequence_dict, "partitions", None) or ([("gene1", 1, nchar)] if nchar else [])
+
+    if not isinstance(sequence_dict, Alignment):
+        for taxon in taxa:
+            if len(sequence_dict[taxon]) != nchar:
+                raise ValueError(f"Inconsistent sequence lengths in alignment: '{taxon}'")
+
+    row_data = _row_bytes(sequence_dict)
+    alphabet = _alphabet(sequence_dict, taxa)
+    encoding = _choose_encoding(encoding, alphabet)
+    per_byte = ENCODINGS[encoding]
+    row_stride = -(-nchar // per_byte)
+
+    header = json.dumps({
+        "taxa": taxa,
+        "partitions": [list(p) for p in partitions],
+        "nchar": nchar,
+        "encoding": encoding,
+        "alphabet": alphabet.decode("latin-1"),
+        "row_stride": row_stride,
+    }).encode("utf-8")
+    data_offset = -(-(HEADER.size + len(header)) // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+    # Ensure output directory exists
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb", buffering=1 << 20) as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(header)))
+        f.write(header)
+        f.write(b"\0" * (data_offset - HEADER.size - len(header)))
+        if encoding == "byte":
+            for taxon in taxa:
+                f.write(row_data(taxon))
+        else:
+            lut = np.zeros(256, dtype=np.uint8)
+            lut[np.frombuffer(alphabet, dtype=np.uint8)] = np.arange(len(alphabet), dtype=np.uint8)
+            for taxon in taxa:
+                codes = lut[np.frombuffer(row_data(taxon), dtype=np.uint8)]
+                f.write(pack_codes(codes, per_byte).tobytes())
+    os.replace(tmp_path, output_path)
+
+
+def pack_codes(codes, per_byte):
+    """
+    Packs a uint8 array of symbol codes (each < 2**(8 // per_byte)) into
+    bytes, first symbol in the high bits.
+
+    Returns:
+        numpy.ndarray: uint8 array of length ceil(len(codes) / per_byte)
+    """
+    bits = 8 // per_byte
+    padded = np.zeros(-(-len(codes) // per_byte) * per_byte, dtype=np.uint8)
+    padded[:len(codes)] = codes
+    groups = padded.reshape(-1, per_byte)
+    packed = np.zeros(len(groups), dtype=np.uint8)
+    for i in range(per_byte):
+        packed |= groups[:, i] << (8 - bits * (i + 1))
+    return packed
+
+
+def _row_bytes(sequence_dict):
+    if isinstance(sequence_dict, Alignment):
+        return sequence_dict.row_bytes
+    return lambda taxon: sequence_dict[taxon].encode("ascii")
+
+
+def _alphabet(sequence_dict, taxa):
+    if isinstance(sequence_dict, Alignment):
+        counts = np.zeros(256, dtype=np.int64)
+        for _, rows in sequence_dict._row_blocks():
+            counts += np.bincount(rows.ravel(), minlength=256)
+        return bytes(np.flatnonzero(counts).astype(np.uint8))
+    symbols = set()
+    for taxon in taxa:
+        symbols.update(sequence_dict[taxon])
+    return "".join(sorted(symbols)).encode("ascii")
+
+
+def _choose_encoding(encoding, alphabet):
+    if encoding == "auto":
+        if np is None:
+            return "byte"
+        return next(name for name in ("2bit", "4bit", "byte") if len(alphabet) <= _MAX_SYMBOLS[name])
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown supermatrix encoding: {encoding}")
+    if len(alphabet) > _MAX_SYMBOLS[encoding]:
+        raise ValueError(
+            f"{len(alphabet)} distinct symbols do not fit the {encoding} encoding"
+        )
+    if encoding != "byte":
+        require_numpy()
+    return encoding
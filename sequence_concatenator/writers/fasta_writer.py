@@ -1,23 +1,70 @@
-from Bio.Seq import Seq
-from Bio.SeqRecord import SeqRecord
-from Bio import SeqIO
 from pathlib import Path
 
-def write_fasta(sequence_dict, output_path):
+from sequence_concatenator.utils.file_utils import open_output
+
+DEFAULT_LINE_WIDTH = 60
+BUFFER_SIZE = 1 << 20
+
+
+def write_fasta(sequence_dict, output_path, line_width=DEFAULT_LINE_WIDTH, buffer_size=BUFFER_SIZE,
+                compress=None):
     """
     Writes concatenated sequences to a FASTA file.
 
     Args:
-        sequence_dict (dict): {taxon: sequence}
+        sequence_dict (dict or iterable): {taxon: sequence}, or an iterable of
+            (taxon, sequence) pairs so rows can be streamed from the merge engine
         output_path (str): Output FASTA file path
+        line_width (int): Residues per sequence line; 0 or None writes each
+            sequence on a single line
+        buffer_size (int): Size of the output buffer in bytes
+        compress (str, optional): "gzip" or "zstd" to compress the output
+
+    Raises:
+        ValueError: If line_width is negative
     """
-   # Ensure output directory exists
+    _check_line_width(line_width)
+
+    # Ensure output directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    
 
-    records = []
-    for taxon, sequence in sequence_dict.items():
-        record = SeqRecord(Seq(sequence), id=taxon, description="")
-        records.append(record)
+    if compress:
+        handle = open_output(output_path, compress)
+    else:
+        handle = open(output_path, 'w', buffering=buffer_size)
+    with handle as f:
+        write_fasta_records(f, sequence_dict, line_width)
+
+
+def write_fasta_records(handle, sequence_dict, line_width=DEFAULT_LINE_WIDTH):
+    """
+    Writes FASTA records to an open text handle.
+
+    Args:
+        handle (file): Writable text handle
+        sequence_dict (dict or iterable): {taxon: sequence} or (taxon, sequence) pairs
+        line_width (int): Residues per sequence line; 0 or None for no wrapping
+
+    Raises:
+        ValueError: If line_width is negative
+    """
+    _check_line_width(line_width)
+    records = sequence_dict.items() if hasattr(sequence_dict, "items") else sequence_dict
+    write = handle.write
+
+    for taxon, sequence in records:
+        write(f">{taxon}\n")
+        if not sequence:
+            continue
+        if not line_width or len(sequence) <= line_width:
+            write(sequence)
+        else:
+            write("\n".join(
+                sequence[i:i + line_width] for i in range(0, len(sequence), line_width)
+            ))
+        write("\n")
+
 
-    SeqIO.write(records, output_path, "fasta")
\ No newline at end of file
+def _check_line_width(line_width):
+    if line_width is not None and line_width < 0:
+        raise ValueError(f"Line width must be 0 or more, got {line_width}")
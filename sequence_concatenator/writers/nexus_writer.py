@@ -1,33 +1,113 @@
+import re
 from pathlib import Path
 
-def write_nexus(sequence_dict, output_path, partitions=None):
+from sequence_concatenator.utils.file_utils import open_output
+
+DEFAULT_BLOCK_WIDTH = 60
+BUFFER_SIZE = 1 << 20
+
+_UNSAFE_LABEL = re.compile(r"[\s()\[\]{}/\\,;:=*'\"`<>^]")
+
+
+def write_nexus(sequence_dict, output_path, partitions=None, interleave=False,
+                block_width=DEFAULT_BLOCK_WIDTH, taxa=None, nchar=None, compress=None):
     """
     Writes concatenated sequences to a NEXUS file with optional CHARSET entries.
 
     Args:
-        sequence_dict (dict): {taxon: sequence}
+        sequence_dict (dict or iterable): {taxon: sequence}, written in sorted
+            taxon order; or an iterable of (taxon, sequence) pairs, written in
+            the order given (requires `taxa` and `nchar`)
         output_path (str): Output NEXUS file path
         partitions (str, optional): CHARSET text to append (from partition_generator)
+        interleave (bool): Write the matrix in blocks of `block_width` columns
+            across all taxa instead of one line per taxon (requires a dict)
+        block_width (int): Columns per block in interleaved mode
+        taxa (list, optional): Taxon labels, required for iterable input
+        nchar (int, optional): Alignment length, required for iterable input
+        compress (str, optional): "gzip" or "zstd" to compress the output
     """
-    taxa = sorted(sequence_dict.keys())
-    alignment_length = len(next(iter(sequence_dict.values())))
+    if hasattr(sequence_dict, "items"):
+        if taxa is None:
+            taxa = sorted(sequence_dict.keys())
+        if nchar is None:
+            nchar = len(next(iter(sequence_dict.values())))
+        rows = ((taxon, sequence_dict[taxon]) for taxon in taxa)
+    else:
+        if taxa is None or nchar is None:
+            raise ValueError("taxa and nchar are required when writing rows from an iterable")
+        if interleave:
+            raise ValueError("Interleaved NEXUS output needs random access to rows; pass a dict")
+        rows = sequence_dict
+
+    labels = {taxon: format_label(taxon) for taxon in taxa}
+    label_width = max((len(label) for label in labels.values()), default=0)
 
     # Ensure output directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w') as f:
-        f.write("#NEXUS\n\n")
-        f.write("Begin data;\n")
-        f.write(f"  Dimensions ntax={len(taxa)} nchar={alignment_length};\n")
-        f.write("  Format datatype=dna missing=? gap=-;\n")
-        f.write("  Matrix\n")
+    if compress:
+        handle = open_output(output_path, compress)
+    else:
+        handle = open(output_path, 'w', buffering=BUFFER_SIZE)
+    with handle as f:
+        write = f.write
+        write("#NEXUS\n\n")
+        write("Begin data;\n")
+        write(f"  Dimensions ntax={len(taxa)} nchar={nchar};\n")
+        if interleave:
+            write("  Format datatype=dna missing=? gap=- interleave=yes;\n")
+        else:
+            write("  Format datatype=dna missing=? gap=-;\n")
+        write("  Matrix\n")
 
-        for taxon in taxa:
-            f.write(f"{taxon:<15} {sequence_dict[taxon]}\n")
+        if interleave:
+            padded = [labels[taxon].ljust(label_width) + " " for taxon in taxa]
+            block = _block_reader(sequence_dict)
+            for block_start in range(0, nchar, block_width):
+                if block_start:
+                    write("\n")
+                block_end = block_start + block_width
+                for taxon, label in zip(taxa, padded):
+                    write(label)
+                    write(block(taxon, block_start, block_end))
+                    write("\n")
+        else:
+            for taxon, sequence in rows:
+                write(labels[taxon].ljust(label_width))
+                write(" ")
+                write(sequence)
+                write("\n")
 
-        f.write("  ;\nEnd;\n\n")
+        write("  ;\nEnd;\n\n")
 
         if partitions:
-            f.write("Begin assumptions;\n")
-            f.write(partitions.strip() + '\n')
-            f.write("End;\n")
+            write("Begin assumptions;\n")
+            write(partitions.strip() + '\n')
+            write("End;\n")
+
+
+def _block_reader(sequence_dict):
+    """
+    Returns block(taxon, start, end) giving a 0-based slice of a row. An
+    Alignment decodes only the slice, rather than its whole row per block.
+    """
+    if hasattr(sequence_dict, "row"):
+        return lambda taxon, start, end: sequence_dict.row(taxon, start + 1, end)
+    return lambda taxon, start, end: sequence_dict[taxon][start:end]
+
+
+def format_label(taxon):
+    """
+    Returns a taxon name as a NEXUS token, single-quoting it if it contains
+    whitespace or punctuation.
+
+    Args:
+        taxon (str): Taxon name
+
+    Returns:
+        str: NEXUS-safe label
+    """
+    if taxon and not _UNSAFE_LABEL.search(taxon):
+        return taxon
+    return "'" + taxon.replace("'", "''") + "'"
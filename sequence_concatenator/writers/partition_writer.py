@@ -1,18 +1,21 @@
 from pathlib import Path
 
-def write_partition_file(partition_text, output_path):
+from sequence_concatenator.utils.file_utils import open_output
+
+def write_partition_file(partition_text, output_path, compress=None):
     """
     Writes partition info (CHARSET entries) to a text file.
 
     Args:
         partition_text (str): Formatted CHARSET data
         output_path (str): Path to output partition file
+        compress (str, optional): "gzip" or "zstd" to compress the output
     """
     # Ensure output directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(output_path, 'w') as f:
+        with open_output(output_path, compress) as f:
             f.write(partition_text.strip() + '\n')
     except Exception as e:
         raise IOError(f"Failed to write partition file '{output_path}': {e}")
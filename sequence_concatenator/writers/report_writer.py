@@ -1,26 +1,67 @@
+import io
 import os
 import tempfile
 from datetime import datetime
-from fpdf import FPDF
-import matplotlib.pyplot as plt
 
+from sequence_concatenator.core.stats import AlignmentStats
 
-def write_report(merged, partitions, stats, input_files, output_path):
+# fpdf, matplotlib, Pillow and NumPy are imported when a report is written,
+# not when this module is imported
+
+# Lists longer than this are summarized: histograms instead of one bar per
+# item, truncated tables
+DEFAULT_MAX_ITEMS = 50
+# Largest (taxa, partitions) grid drawn in the occupancy heatmap; bigger
+# matrices are averaged over blocks of rows and columns
+HEATMAP_MAX_CELLS = (200, 200)
+
+
+def write_report(merged, partitions, stats, input_files, output_path, missing_char="?",
+                 max_items=DEFAULT_MAX_ITEMS, jobs=1):
     """
     Writes a PDF report summarizing the concatenation run with charts.
 
+    Per-taxon and per-partition charts switch to histograms when there are
+    more than `max_items` taxa or partitions, and long lists are truncated,
+    so the report stays readable and fast for large supermatrices. With
+    detailed statistics an occupancy heatmap (taxa x partitions) is added.
+    Charts are drawn with matplotlib's Agg renderer, optionally in parallel.
+
     Args:
-        merged (dict): {taxon: concatenated_sequence}
+        merged (dict or Alignment): {taxon: concatenated_sequence}
         partitions (list): [(gene_label, start, end), ...]
-        stats (dict): Alignment statistics from compute_alignment_stats
+        stats (dict or AlignmentStats): Statistics from compute_alignment_stats,
+            or from compute_detailed_stats (used as-is, nothing is recounted)
         input_files (list): List of input file paths
         output_path (str): Path to write the PDF report
+        missing_char (str): Missing-data character, when stats is a plain dict
+        max_items (int): Most taxa, partitions or files listed individually
+        jobs (int): Worker processes drawing the charts; 0 or None uses one per CPU
     """
+    from fpdf import FPDF
+
     # Ensure output directory exists
     directory = os.path.dirname(output_path) or '.'
     os.makedirs(directory, exist_ok=True)
 
     now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    detailed = isinstance(stats, AlignmentStats)
+
+    # Missing data per taxon
+    if detailed:
+        taxa = stats.taxa
+        missing_pct = [round(fraction * 100, 2) for fraction in stats.taxon_missing_fraction()]
+    elif hasattr(merged, "missing_per_taxon"):  # Alignment
+        taxa = list(merged.keys())
+        length = merged.alignment_length
+        missing_pct = [round((count/length)*100, 2) if length>0 else 0 for count in merged.missing_per_taxon(missing_char)]
+    else:
+        taxa = list(merged.keys())
+        missing_pct = [round((seq.count(missing_char)/len(seq))*100, 2) if len(seq)>0 else 0 for seq in merged.values()]
+
+    # Charts are drawn up front so they can be rendered in parallel
+    charts = _chart_specs(taxa, missing_pct, partitions, stats if detailed else None, max_items)
+    images = _render_charts(charts, jobs)
 
     # Initialize PDF
     pdf = FPDF()
@@ -41,8 +82,9 @@ def write_report(merged, partitions, stats, input_files, output_path):
     pdf.set_font("Arial", 'B', 12)
     pdf.cell(0, 8, "Input Files:", ln=True)
     pdf.set_font("Arial", '', 12)
-    for path in input_files:
+    for path in input_files[:max_items]:
         pdf.cell(0, 6, f"- {os.path.basename(path)}", ln=True)
+    _more(pdf, len(input_files) - max_items, "files")
     pdf.ln(5)
 
     # Summary
@@ -52,43 +94,203 @@ def write_report(merged, partitions, stats, input_files, output_path):
     pdf.cell(0, 6, f"Taxa: {stats.get('num_taxa', 0)}", ln=True)
     pdf.cell(0, 6, f"Alignment length: {stats.get('alignment_length', 0)} bp", ln=True)
     pdf.cell(0, 6, f"Missing data: {stats.get('missing_count', 0)} ({stats.get('missing_percentage', 0)}%)", ln=True)
+    if detailed:
+        pdf.cell(0, 6, f"Gaps: {stats['gap_count']} ({stats['gap_percentage']}%)", ln=True)
+        if stats["gc_content"] is not None:
+            pdf.cell(0, 6, f"GC content: {round(stats['gc_content'] * 100, 2)}%", ln=True)
+        pdf.cell(0, 6, f"Variable sites: {stats['variable_sites']}", ln=True)
+        pdf.cell(0, 6, f"Parsimony-informative sites: {stats['informative_sites']}", ln=True)
     pdf.ln(5)
 
-    # Partition info text
+    # Partition table
     pdf.set_font("Arial", 'B', 12)
     pdf.cell(0, 8, "Partitions:", ln=True)
-    pdf.set_font("Arial", '', 12)
-    for label, start, end in partitions:
-        pdf.cell(0, 6, f"- {label}: {start}-{end}", ln=True)
+    if detailed:
+        rows = [
+            (row["label"], f"{row['start']}-{row['end']}", row["length"], row["taxa_present"],
+             round(row["missing_fraction"] * 100, 2), row["variable_sites"], row["informative_sites"])
+            for row in stats.partition_table()[:max_items]
+        ]
+        _table(pdf, ["Partition", "Range", "Length", "Taxa", "Missing %", "Variable", "Informative"],
+               rows, [50, 30, 20, 20, 20, 20, 20])
+    else:
+        rows = [(label, f"{start}-{end}", end - start + 1) for label, start, end in partitions[:max_items]]
+        _table(pdf, ["Partition", "Range", "Length"], rows, [90, 50, 40])
+    _more(pdf, len(partitions) - max_items, "partitions")
     pdf.ln(5)
 
-    # Generate charts
-    # 1) Missing data per taxon
-    taxa = list(merged.keys())
-    missing_pct = [round((seq.count('?')/len(seq))*100, 2) if len(seq)>0 else 0 for seq in merged.values()]
-    fig, ax = plt.subplots()
-    ax.bar(taxa, missing_pct)
-    ax.set_ylabel('Missing Data (%)')
-    ax.set_title('Missing Data per Taxon')
-    chart1 = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-    fig.savefig(chart1.name, bbox_inches='tight')
-    plt.close(fig)
-    pdf.image(chart1.name, w=180)
-    os.unlink(chart1.name)
-    pdf.ln(5)
+    # Taxa with the most missing data, when they are not all charted
+    if len(taxa) > max_items:
+        pdf.set_font("Arial", 'B', 12)
+        pdf.cell(0, 8, "Least Complete Taxa:", ln=True)
+        worst = sorted(range(len(taxa)), key=lambda i: -missing_pct[i])[:max_items]
+        _table(pdf, ["Taxon", "Missing %"], [(taxa[i], missing_pct[i]) for i in worst], [140, 40])
+        pdf.ln(5)
+
+    # Charts
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, image in enumerate(images):
+            _add_image(pdf, image, os.path.join(tmp, f"chart{i}.png"))
+            pdf.ln(5)
+
+        # Save PDF (PyFPDF reads the image files while writing)
+        pdf.output(output_path)
+
+
+def _chart_specs(taxa, missing_pct, partitions, stats, max_items):
+    """Returns picklable descriptions of the charts to draw."""
+    specs = []
+    if len(taxa) <= max_items:
+        specs.append({"kind": "bar", "title": "Missing Data per Taxon",
+                      "ylabel": "Missing Data (%)", "labels": taxa, "values": missing_pct})
+    else:
+        specs.append({"kind": "histogram", "title": f"Missing Data per Taxon ({len(taxa)} taxa)",
+                      "xlabel": "Missing Data (%)", "ylabel": "Taxa", "values": missing_pct,
+                      "bins": list(range(0, 105, 5))})
 
-    # 2) Partition lengths
     labels = [p[0] for p in partitions]
     lengths = [p[2] - p[1] + 1 for p in partitions]
-    fig, ax = plt.subplots()
-    ax.bar(labels, lengths)
-    ax.set_ylabel('Length (bp)')
-    ax.set_title('Partition Lengths')
-    chart2 = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-    fig.savefig(chart2.name, bbox_inches='tight')
-    plt.close(fig)
-    pdf.image(chart2.name, w=180)
-    os.unlink(chart2.name)
-
-    # Save PDF
-    pdf.output(output_path)
\ No newline at end of file
+    if len(partitions) <= max_items:
+        specs.append({"kind": "bar", "title": "Partition Lengths",
+                      "ylabel": "Length (bp)", "labels": labels, "values": lengths})
+    else:
+        specs.append({"kind": "histogram", "title": f"Partition Lengths ({len(partitions)} partitions)",
+                      "xlabel": "Length (bp)", "ylabel": "Partitions", "values": lengths, "bins": 30})
+
+    if stats is not None and stats.num_taxa and len(stats.partitions):
+        import numpy as np
+
+        lengths = np.array([max(1, end - start + 1) for _, start, end in stats.partitions])
+        occupancy = 1.0 - stats.taxon_partition_missing / lengths
+        binned, rows_per_bin, cols_per_bin = _bin_matrix(occupancy, *HEATMAP_MAX_CELLS)
+        specs.append({
+            "kind": "heatmap", "title": "Occupancy (fraction of cells with data)",
+            "xlabel": "Partitions" + (f" (blocks of {cols_per_bin})" if cols_per_bin > 1 else ""),
+            "ylabel": "Taxa" + (f" (blocks of {rows_per_bin})" if rows_per_bin > 1 else ""),
+            "matrix": binned,
+        })
+    return specs
+
+
+def _bin_matrix(matrix, max_rows, max_cols):
+    """
+    Averages a matrix over blocks of rows and columns so that it has at most
+    max_rows x max_cols cells.
+
+    Returns:
+        tuple: (binned matrix, rows per block, columns per block)
+    """
+    import numpy as np
+
+    rows_per_bin = -(-matrix.shape[0] // max_rows)
+    cols_per_bin = -(-matrix.shape[1] // max_cols)
+    for axis, size in ((0, rows_per_bin), (1, cols_per_bin)):
+        if size > 1:
+            starts = np.arange(0, matrix.shape[axis], size)
+            counts = np.diff(np.append(starts, matrix.shape[axis]))
+            shape = [1, 1]
+            shape[axis] = len(counts)
+            matrix = np.add.reduceat(matrix, starts, axis=axis) / counts.reshape(shape)
+    return matrix, rows_per_bin, cols_per_bin
+
+
+def _render_charts(specs, jobs):
+    workers = min(jobs or os.cpu_count() or 1, len(specs))
+    if workers <= 1:
+        return [_render_chart(spec) for spec in specs]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_chart, specs))
+
+
+def _render_chart(spec):
+    """Draws one chart with the Agg renderer and returns it as RGB PNG bytes."""
+    from matplotlib.figure import Figure
+    from PIL import Image
+
+    spec = dict(spec)
+    draw = _DRAW[spec.pop("kind")]
+    fig = Figure(figsize=(8, 4.5))
+    draw(fig, fig.add_subplot(), **spec)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+
+    # Drop the alpha channel: PyFPDF splits RGBA PNGs pixel by pixel in Python
+    buffer.seek(0)
+    rgb = io.BytesIO()
+    Image.open(buffer).convert("RGB").save(rgb, format="PNG")
+    return rgb.getvalue()
+
+
+def _draw_bar(fig, ax, title, ylabel, labels, values):
+    ax.bar(range(len(values)), values)
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=90 if len(labels) > 10 else 0, fontsize=7 if len(labels) > 10 else 9)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+
+
+def _draw_histogram(fig, ax, title, xlabel, ylabel, values, bins):
+    ax.hist(values, bins=bins)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+
+
+def _draw_heatmap(fig, ax, title, xlabel, ylabel, matrix):
+    image = ax.imshow(matrix, aspect="auto", interpolation="nearest", vmin=0.0, vmax=1.0, cmap="viridis")
+    fig.colorbar(image, ax=ax)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+
+
+_DRAW = {"bar": _draw_bar, "histogram": _draw_histogram, "heatmap": _draw_heatmap}
+
+
+def _add_image(pdf, image, path):
+    from fpdf import FPDF_VERSION
+
+    # fpdf2 embeds images from memory; PyFPDF 1.7 only reads image files
+    if int(FPDF_VERSION.split(".")[0]) >= 2:
+        pdf.image(io.BytesIO(image), w=180)
+        return
+    with open(path, "wb") as f:
+        f.write(image)
+    pdf.image(path, w=180)
+
+
+def _table(pdf, headers, rows, widths, height=5):
+    """Writes a table in a small font, repeating the header on each new page."""
+    def header():
+        pdf.set_font("Arial", 'B', 8)
+        for text, width in zip(headers, widths):
+            pdf.cell(width, height, text, border=1)
+        pdf.ln()
+        pdf.set_font("Arial", '', 8)
+
+    header()
+    for row in rows:
+        if pdf.get_y() + height > pdf.page_break_trigger:
+            pdf.add_page()
+            header()
+        for value, width in zip(row, widths):
+            pdf.cell(width, height, _fit(pdf, str(value), width - 2), border=1)
+        pdf.ln()
+
+
+def _fit(pdf, text, width):
+    """Truncates text to fit in `width` at the current font."""
+    if pdf.get_string_width(text) <= width:
+        return text
+    while text and pdf.get_string_width(text + "...") > width:
+        text = text[:-1]
+    return text + "..."
+
+
+def _more(pdf, hidden, noun):
+    if hidden > 0:
+        pdf.set_font("Arial", 'I', 10)
+        pdf.cell(0, 6, f"... and {hidden} more {noun} not shown", ln=True)
+        pdf.set_font("Arial", '', 12)
@@ -0,0 +1,66 @@
+import csv
+import json
+from pathlib import Path
+
+
+def write_stats_json(stats, output_path):
+    """
+    Writes the summary, per-taxon and per-partition statistics as JSON.
+
+    Args:
+        stats (AlignmentStats): From compute_detailed_stats
+        output_path (str): Output JSON file path
+    """
+    # Ensure output directory exists
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with open(output_path, 'w') as f:
+            json.dump(stats.to_dict(), f, indent=2)
+            f.write('\n')
+    except Exception as e:
+        raise IOError(f"Failed to write statistics file '{output_path}': {e}")
+
+
+def write_stats_csv(stats, output_base):
+    """
+    Writes per-taxon, per-partition and per-column statistics as CSV files:
+    <output_base>_taxa.csv, <output_base>_partitions.csv and <output_base>_columns.csv.
+    Base composition is expanded into one column per state.
+
+    Args:
+        stats (AlignmentStats): From compute_detailed_stats
+        output_base (str): Base path for the CSV files
+
+    Returns:
+        list: Paths of the files written
+    """
+    paths = [f"{output_base}_taxa.csv", f"{output_base}_partitions.csv", f"{output_base}_columns.csv"]
+    Path(output_base).parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        _write_table(paths[0], stats.taxon_table(), stats.states)
+        _write_table(paths[1], stats.partition_table(), stats.states)
+        with open(paths[2], 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["column", "missing", "gaps", "variable", "informative"])
+            columns = zip(
+                stats.column_missing.tolist(), stats.column_gaps.tolist(),
+                stats.column_variable.astype(int).tolist(), stats.column_informative.astype(int).tolist()
+            )
+            writer.writerows((i, *values) for i, values in enumerate(columns, start=1))
+    except Exception as e:
+        raise IOError(f"Failed to write statistics files '{output_base}_*.csv': {e}")
+    return paths
+
+
+def _write_table(path, rows, states):
+    with open(path, 'w', newline='') as f:
+        writer = None
+        for row in rows:
+            composition = row.pop("composition")
+            row.update({state: composition[state] for state in states})
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
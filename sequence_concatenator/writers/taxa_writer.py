@@ -0,0 +1,28 @@
+from pathlib import Path
+
+
+def write_reconciliation_report(report, output_path):
+    """
+    Writes a taxon reconciliation report as tab-separated sections:
+    renamed names, taxa merged from several names, and per-locus conflicts.
+
+    Args:
+        report (ReconciliationReport): From TaxonReconciler.plan or apply
+        output_path (str): Output file path
+    """
+    # Ensure output directory exists
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with open(output_path, 'w') as f:
+            f.write("# renamed\nname\ttaxon\tsource\n")
+            for name, (taxon, source) in report.renamed.items():
+                f.write(f"{name}\t{taxon}\t{source}\n")
+            f.write("\n# merged\ntaxon\tnames\n")
+            for taxon, names in report.merged.items():
+                f.write(f"{taxon}\t{','.join(names)}\n")
+            f.write("\n# conflicts\nlocus\ttaxon\tkept\tdropped\n")
+            for locus_index, taxon, kept, dropped in report.conflicts:
+                f.write(f"gene{locus_index + 1}\t{taxon}\t{kept}\t{','.join(dropped)}\n")
+    except Exception as e:
+        raise IOError(f"Failed to write reconciliation report '{output_path}': {e}")
@@ -0,0 +1,49 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sequence_concatenator.core.alignment import Alignment
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.stats import compute_alignment_stats
+
+INPUT_DICTS = [
+    {"Taxon1": "AAA", "Taxon2": "CC"},
+    {"Taxon1": "GGG", "Taxon3": "TTT"},
+    {"Taxon2": "T-T", "Taxon3": "AAA"}
+]
+
+def test_array_backend_matches_dict_backend():
+    merged, partitions = merge_sequences(INPUT_DICTS, placeholder="?")
+    alignment, array_partitions = merge_sequences(INPUT_DICTS, placeholder="?", backend="array")
+
+    assert isinstance(alignment, Alignment)
+    assert array_partitions == partitions == alignment.partitions
+    assert alignment.matrix.dtype == np.uint8
+    assert alignment.matrix.shape == (3, 9)
+    assert alignment.to_dict() == merged
+    assert list(alignment) == list(merged)
+
+def test_missing_counts():
+    alignment, _ = merge_sequences(INPUT_DICTS, placeholder="?", backend="array")
+
+    assert alignment.missing_per_taxon().tolist() == [3, 4, 3]
+    assert alignment.missing_per_column().tolist() == [1, 1, 2, 1, 1, 1, 1, 1, 1]
+    assert alignment.missing_per_partition().tolist() == [[0, 0, 3], [1, 3, 0], [3, 0, 0]]
+    assert alignment.missing_per_taxon("?-").tolist() == [3, 5, 3]
+
+def test_stats_accept_alignment():
+    merged, _ = merge_sequences(INPUT_DICTS, placeholder="?")
+    alignment, _ = merge_sequences(INPUT_DICTS, placeholder="?", backend="array")
+
+    assert compute_alignment_stats(alignment) == compute_alignment_stats(merged)
+
+def test_from_dict_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        Alignment.from_dict({"Taxon1": "AAA", "Taxon2": "AA"})
+
+if __name__ == "__main__":
+    test_array_backend_matches_dict_backend()
+    test_missing_counts()
+    test_stats_accept_alignment()
+    test_from_dict_rejects_ragged_rows()
+    print("alignment passed ✔️")
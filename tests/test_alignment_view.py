@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from sequence_concatenator.core.alignment import Alignment
+from sequence_concatenator.ui.alignment_view import AlignmentViewport
+
+SEQUENCES = {"A": "ACGTACGTAC", "B": "TTTTGGGGCC", "C": "??????ACGT"}
+PARTITIONS = [("gene1", 1, 4), ("gene2", 5, 10)]
+
+def test_window_slices_visible_cells():
+    for source in (SEQUENCES, Alignment.from_dict(SEQUENCES, PARTITIONS)):
+        viewport = AlignmentViewport(source, PARTITIONS)
+        assert viewport.length == 10 and viewport.num_rows == 3
+        assert viewport.window(1, 5, 2, 3) == [("B", "TTG"), ("C", "???")]
+        assert viewport.window(0, 1, 8, 10) == [("A", "AC")]
+
+def test_partition_navigation():
+    viewport = AlignmentViewport(SEQUENCES, PARTITIONS + [("empty", 11, 10)])
+    assert viewport.partition_column("gene2") == 4
+    assert [viewport.partition_at(c) for c in (0, 3, 4, 9, 10)] == ["gene1", "gene1", "gene2", "gene2", None]
+
+def test_edits_are_overlaid():
+    source = dict(SEQUENCES)
+    viewport = AlignmentViewport(source, PARTITIONS)
+    assert viewport.set_sequence("B", "NNNNGGGGCC") == 1
+    assert viewport.rename("B", "B2") == 1
+    assert viewport.remove("A") == 0
+    assert viewport.window(0, 2, 0, 3) == [("B2", "NNN"), ("C", "???")]
+    assert viewport.length == 10
+    assert viewport.to_dict() == {"B2": "NNNNGGGGCC", "C": "??????ACGT"}
+    assert source == SEQUENCES
+    assert list(viewport.journal) == [("patch", "B", 0, "NNNN"), ("rename", "B", "B2"), ("remove", "A")]
+    for bad in (lambda: viewport.rename("B2", "C"), lambda: viewport.set_sequence("C", "ACGT")):
+        try:
+            bad()
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+def test_windows_of_a_large_alignment():
+    row = "ACGT" * 500_000
+    viewport = AlignmentViewport({f"T{i}": row for i in range(500)})
+    for first in range(0, 2_000_000, 100_000):
+        assert len(viewport.window(first // 10_000, 60, first, 200)) == 60
+
+if __name__ == "__main__":
+    test_window_slices_visible_cells()
+    test_partition_navigation()
+    test_edits_are_overlaid()
+    test_windows_of_a_large_alignment()
+    print("alignment view passed ✔️")
@@ -0,0 +1,101 @@
+import gzip
+import os
+import tempfile
+
+import pytest
+
+from sequence_concatenator.core.streaming import stream_concatenate
+from sequence_concatenator.readers.loader import read_file_auto
+from sequence_concatenator.utils.file_utils import (
+    compressed_path, get_compression, get_extension, is_supported_format, open_input, open_output
+)
+from sequence_concatenator.writers.fasta_writer import write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+
+DATA = os.path.join(os.path.dirname(__file__), "..", "data")
+
+def _gzip_copy(src, dst):
+    with open(src, "rb") as f, gzip.open(dst, "wb") as out:
+        out.write(f.read())
+    return dst
+
+def test_double_suffix_detection():
+    assert get_extension("loci.fasta.gz") == "fasta"
+    assert get_extension("loci.NEX.ZST") == "nex"
+    assert get_extension("loci.gbff.bgz") == "gbff"
+    assert get_extension("archive.gz") == "gz"
+    assert is_supported_format("loci.fa.gz") is True
+    assert is_supported_format("loci.txt.gz") is False
+
+def test_magic_bytes_win_over_suffix():
+    with tempfile.TemporaryDirectory() as tmp:
+        disguised = _gzip_copy(os.path.join(DATA, "input1.fasta"), os.path.join(tmp, "a.fasta"))
+        plain = os.path.join(tmp, "b.fasta.gz")
+        with open(plain, "w") as f:
+            f.write(">T1\nACGT\n")
+        assert get_compression(disguised) == "gzip"
+        assert get_compression(plain) is None
+        assert get_compression(os.path.join(tmp, "missing.zst")) == "zstd"
+        assert read_file_auto(disguised) == read_file_auto(os.path.join(DATA, "input1.fasta"))
+        assert read_file_auto(plain) == {"T1": "ACGT"}
+
+def test_compressed_inputs_match_plain():
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("input1.fasta", "input2.nex.nex", "input3.gbff"):
+            src = os.path.join(DATA, name)
+            dst = _gzip_copy(src, os.path.join(tmp, name + ".gz"))
+            for reader in ("fast", "biopython"):
+                assert read_file_auto(dst, reader=reader) == read_file_auto(src, reader=reader)
+
+ROWS = {f"Taxon{i}": "ACGT?-" * 5000 for i in range(20)}
+
+def _check_fasta_round_trip(tmp, compress):
+    plain = os.path.join(tmp, "out.fasta")
+    write_fasta(ROWS, plain)
+    with open(plain, "rb") as f:
+        expected = f.read()
+    path = compressed_path(plain, compress)
+    write_fasta(ROWS, path, compress=compress)
+    assert get_compression(path) == compress
+    with open_input(path) as f:
+        assert f.read() == expected
+    assert read_file_auto(path) == ROWS
+
+def test_compressed_output_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        _check_fasta_round_trip(tmp, "gzip")
+
+        # Multi-member gzip output is readable by the standard library
+        path = os.path.join(tmp, "blocks.txt.gz")
+        with open_output(path, "gzip", threads=2) as f:
+            f.write("x" * (3 << 20))
+        with gzip.open(path, "rt") as f:
+            assert f.read() == "x" * (3 << 20)
+
+        write_nexus(ROWS, os.path.join(tmp, "out.nex.gz"), compress="gzip")
+        assert read_file_auto(os.path.join(tmp, "out.nex.gz")) == ROWS
+
+def test_zstd_output_round_trip():
+    pytest.importorskip("zstandard")
+    with tempfile.TemporaryDirectory() as tmp:
+        _check_fasta_round_trip(tmp, "zstd")
+
+def test_streaming_compressed():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = _gzip_copy(os.path.join(DATA, "input1.fasta"), os.path.join(tmp, "input1.fasta.gz"))
+        plain_base = os.path.join(tmp, "plain")
+        gz_base = os.path.join(tmp, "gz")
+        stream_concatenate([os.path.join(DATA, "input1.fasta")], plain_base, nexus=True)
+        stream_concatenate([src], gz_base, nexus=True, compress="gzip")
+        for suffix in (".fasta", ".nex", "_partition.txt"):
+            with open(plain_base + suffix, "rb") as a, open_input(gz_base + suffix + ".gz") as b:
+                assert a.read() == b.read()
+
+if __name__ == "__main__":
+    test_double_suffix_detection()
+    test_magic_bytes_win_over_suffix()
+    test_compressed_inputs_match_plain()
+    test_compressed_output_round_trip()
+    test_zstd_output_round_trip()
+    test_streaming_compressed()
+    print("compression passed ✔️")
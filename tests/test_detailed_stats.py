@@ -0,0 +1,97 @@
+import json
+import os
+import random
+import tempfile
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.stats import compute_alignment_stats, compute_detailed_stats
+from sequence_concatenator.writers.stats_writer import write_stats_csv, write_stats_json
+
+def _random_loci(seed=3, alphabet="ACGTacgtN-?"):
+    rng = random.Random(seed)
+    loci = []
+    for _ in range(6):
+        length = rng.randint(1, 40)
+        taxa = rng.sample([f"T{i}" for i in range(9)], rng.randint(2, 9))
+        loci.append({t: "".join(rng.choice(alphabet) for _ in range(length)) for t in taxa})
+    return loci
+
+def _column_flags(column, states):
+    counts = {s: column.upper().replace("U", "T").count(s) for s in states}
+    return (sum(c > 0 for c in counts.values()) >= 2, sum(c >= 2 for c in counts.values()) >= 2)
+
+def test_matches_brute_force():
+    merged, partitions = merge_sequences(_random_loci())
+    for jobs in (1, 3):
+        stats = compute_detailed_stats(merged, partitions, jobs=jobs)
+        basic = compute_alignment_stats(merged)
+        for key in basic:
+            assert stats[key] == basic[key]
+        assert stats["datatype"] == "dna"
+
+        rows = list(merged.values())
+        columns = ["".join(row[i] for row in rows) for i in range(len(rows[0]))]
+        flags = [_column_flags(column, "ACGT") for column in columns]
+        assert stats["variable_sites"] == sum(v for v, _ in flags)
+        assert stats["informative_sites"] == sum(i for _, i in flags)
+        assert stats.column_gaps.tolist() == [column.count("-") for column in columns]
+
+        for row, (taxon, seq) in zip(stats.taxon_table(), merged.items()):
+            assert row["taxon"] == taxon and row["missing"] == seq.count("?")
+            upper = seq.upper()
+            acgt = sum(upper.count(b) for b in "ACGT")
+            assert row["gc_content"] == (round((upper.count("G") + upper.count("C")) / acgt, 4) if acgt else None)
+
+        for row, (label, start, end) in zip(stats.partition_table(), partitions):
+            block = [seq[start - 1:end] for seq in rows]
+            assert row["label"] == label and row["length"] == end - start + 1
+            assert row["taxa_present"] == sum(s.count("?") < len(s) for s in block)
+            assert row["variable_sites"] == sum(v for v, _ in flags[start - 1:end])
+            assert row["composition"]["A"] == sum(s.upper().count("A") for s in block)
+
+def test_workers_merge_deterministically():
+    rng = random.Random(5)
+    loci = [{f"T{t}": "".join(rng.choice("ACGT-?") for _ in range(rng.randint(1, 12))) for t in range(5)}
+            for _ in range(40)]
+    merged, partitions = merge_sequences(loci)
+    serial = compute_detailed_stats(merged, partitions)
+    for jobs in (2, 7):
+        parallel = compute_detailed_stats(merged, partitions, jobs=jobs)
+        assert parallel.to_dict() == serial.to_dict()
+        assert parallel.column_missing.tolist() == serial.column_missing.tolist()
+        assert parallel.column_informative.tolist() == serial.column_informative.tolist()
+
+def test_protein_and_custom_missing():
+    stats = compute_detailed_stats({"a": "MKV-N", "b": "MRV-N", "c": "MRL-D"}, missing_char="-")
+    assert stats["datatype"] == "protein"
+    assert stats["gc_content"] is None
+    assert stats["missing_count"] == 3 and stats["gap_count"] == 0
+    assert stats.column_variable.tolist() == [False, True, True, False, True]
+    assert stats.column_informative.tolist() == [False, False, False, False, False]
+
+def test_exports():
+    merged, partitions = merge_sequences(_random_loci())
+    stats = compute_detailed_stats(merged, partitions)
+    with tempfile.TemporaryDirectory() as tmp:
+        write_stats_json(stats, os.path.join(tmp, "s.json"))
+        with open(os.path.join(tmp, "s.json")) as f:
+            data = json.load(f)
+        assert data["summary"]["informative_sites"] == stats["informative_sites"]
+        assert [p["label"] for p in data["partitions"]] == [p[0] for p in partitions]
+
+        paths = write_stats_csv(stats, os.path.join(tmp, "s"))
+        with open(paths[2]) as f:
+            assert len(f.read().splitlines()) == stats.alignment_length + 1
+        with open(paths[0]) as f:
+            assert f.readline().strip().endswith("A,C,G,T")
+
+if __name__ == "__main__":
+    test_matches_brute_force()
+    test_workers_merge_deterministically()
+    test_protein_and_custom_missing()
+    test_exports()
+    print("detailed stats passed ✔️")
@@ -0,0 +1,72 @@
+from sequence_concatenator.core.edit_journal import EditJournal, diff_range
+from sequence_concatenator.core.sequence_merger import merge_sequences
+
+LOCI = [
+    {"A": "ACGT", "B": "TTTT"},
+    {"A": "GGGGGG", "C": "CCCCCC"},
+    {"B": "AAA", "C": "CCC"},
+]
+
+def test_apply_touches_only_edited_loci():
+    merged, partitions = merge_sequences(LOCI)
+    journal = EditJournal()
+    journal.record_sequence("A", merged["A"], merged["A"][:5] + "NN" + merged["A"][7:])
+    journal.rename("C", "C2")
+    journal.remove("B")
+
+    loci, touched = journal.apply(LOCI)
+    assert touched == [0, 1, 2]
+    assert loci == [{"A": "ACGT"}, {"A": "GNNGGG", "C2": "CCCCCC"}, {"C2": "CCC"}]
+    assert LOCI[1] == {"A": "GGGGGG", "C": "CCCCCC"}
+
+    # Partition boundaries survive and match editing the merged matrix directly
+    remerged, new_partitions = merge_sequences(loci)
+    assert new_partitions == partitions
+    assert remerged == journal.apply_merged(merged)
+
+    patch_only = EditJournal([("patch", "A", 1, "NN")])
+    loci, touched = patch_only.apply(LOCI)
+    assert touched == [0] and loci[1] is LOCI[1] and loci[2] is LOCI[2]
+
+def test_patch_spanning_loci_and_missing_taxa():
+    merged, partitions = merge_sequences(LOCI)
+    journal = EditJournal()
+    # Columns 3..11 cover the end of gene1, all of gene2 and the start of gene3
+    journal.record_sequence("B", merged["B"], merged["B"][:3] + "X" * 8 + merged["B"][11:])
+    loci, _ = journal.apply(LOCI, partitions)
+    assert loci[0]["B"] == "TTTX"
+    assert loci[1]["B"] == "XXXXXX"
+    assert loci[2]["B"] == "XAA"
+    assert merge_sequences(loci)[0] == journal.apply_merged(merged)
+
+    # Writing only placeholders over an absent taxon does not add it to the locus
+    untouched = EditJournal([("patch", "B", 4, "??????")])
+    assert untouched.apply(LOCI)[0][1] is LOCI[1]
+
+def test_rejects_length_changes_and_rename_collisions():
+    journal = EditJournal()
+    try:
+        journal.record_sequence("A", "ACGT", "ACG")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    journal.rename("A", "C")
+    try:
+        journal.apply(LOCI)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+def test_diff_range_on_long_rows():
+    row = "ACGT" * 1_000_000
+    edited = row[:2_000_000] + "N" + row[2_000_001:]
+    assert diff_range(row, edited) == (2_000_000, 2_000_001)
+    assert diff_range(row, row) is None
+    assert diff_range("ACGT", "NCGN") == (0, 4)
+
+if __name__ == "__main__":
+    test_apply_touches_only_edited_loci()
+    test_patch_spanning_loci_and_missing_taxa()
+    test_rejects_length_changes_and_rename_collisions()
+    test_diff_range_on_long_rows()
+    print("edit journal passed ✔️")
@@ -1,5 +1,8 @@
 import os
-from export.fasta_writer import write_fasta
+
+import pytest
+
+from sequence_concatenator.writers.fasta_writer import write_fasta
 from Bio import SeqIO
 
 def test_write_fasta():
@@ -24,5 +27,25 @@ def test_write_fasta():
     # # Cleanup
     # os.remove(output_file)
 
+def test_write_fasta_wrapping_and_streaming():
+    output_file = "test_data/output_wrapped.fasta"
+
+    rows = (taxon for taxon in [("Taxon1", "ACGTACGTAC"), ("Taxon2", ""), ("Taxon3", "ACG")])
+    write_fasta(rows, output_file, line_width=4)
+    with open(output_file) as f:
+        assert f.read() == ">Taxon1\nACGT\nACGT\nAC\n>Taxon2\n>Taxon3\nACG\n"
+
+    write_fasta({"Taxon1": "ACGTACGTAC"}, output_file, line_width=0)
+    with open(output_file) as f:
+        assert f.read() == ">Taxon1\nACGTACGTAC\n"
+
+    with pytest.raises(ValueError, match="Line width"):
+        write_fasta({"Taxon1": "ACGTACGTAC"}, output_file, line_width=-3)
+    with open(output_file) as f:
+        assert f.read() == ">Taxon1\nACGTACGTAC\n"  # not truncated
+
+    os.remove(output_file)
+
 if __name__ == "__main__":
-    test_write_fasta()
\ No newline at end of file
+    test_write_fasta()
+    test_write_fasta_wrapping_and_streaming()
\ No newline at end of file
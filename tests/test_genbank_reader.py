@@ -0,0 +1,42 @@
+import gzip
+import os
+import shutil
+import tempfile
+import warnings
+
+from sequence_concatenator.readers.genbank_reader import GenBankLabelCollisionWarning, read_genbank
+
+GENBANK = os.path.join(os.path.dirname(__file__), "..", "data", "input3.gbff")
+
+def _records(tmp, organisms):
+    with open(GENBANK) as f:
+        template = f.read()
+    path = os.path.join(tmp, "multi.gbff")
+    with open(path, "w") as f:
+        for i, organism in enumerate(organisms):
+            f.write(template.replace("Taxon1", organism).replace("aacgtg", "acgt" + "ac" * i))
+            if not template.endswith("\n"):
+                f.write("\n")
+    return path
+
+def test_fast_reader_matches_biopython():
+    assert read_genbank(GENBANK) == read_genbank(GENBANK, reader="biopython") == {"Taxon1": "AACGTG"}
+
+def test_gzip_and_collisions():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _records(tmp, ["Homo sapiens", "Mus musculus", "Homo erectus"])
+        gz_path = path + ".gz"
+        with open(path, "rb") as src, gzip.open(gz_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            plain = read_genbank(path)
+            compressed = read_genbank(gz_path)
+        assert plain == compressed == {"Homo": "ACGTACAC", "Mus": "ACGTAC"}
+        assert [w.category for w in caught] == [GenBankLabelCollisionWarning] * 2
+
+if __name__ == "__main__":
+    test_fast_reader_matches_biopython()
+    test_gzip_and_collisions()
+    print("genbank_reader passed ✔️")
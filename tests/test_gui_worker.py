@@ -0,0 +1,132 @@
+import os
+import tempfile
+import threading
+
+from sequence_concatenator.core.edit_journal import EditJournal
+from sequence_concatenator.readers.loader import read_files
+from sequence_concatenator.ui.worker import (
+    BackgroundTask, Cancelled, describe_progress, export_task, load_files_task, merge_edited_task
+)
+
+def _write_loci(directory, count=5):
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"locus{i}.fasta")
+        with open(path, "w") as f:
+            f.write(f">A\n{'ACGT' * (i + 1)}\n>B\n{'ACGA' * (i + 1)}\n")
+        paths.append(path)
+    return paths
+
+def _run(func, *args):
+    task = BackgroundTask(func, *args).start()
+    assert task.wait(30)
+    return task.poll()
+
+def test_load_and_export_report_progress():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_loci(tmp)
+        events = _run(load_files_task, paths, 1)
+        assert events[-1][0] == "done"
+        results, errors = events[-1][1]
+        assert len(results) == 5 and errors == []
+        assert [p.done for kind, p in events if kind == "progress"] == [1, 2, 3, 4, 5]
+
+        report = os.path.join(tmp, "out", "run.pdf")
+        events = _run(export_task, [seqs for _, seqs in results], paths, report)
+        assert events[-1][0] == "done", events[-1]
+        written = events[-1][1]
+        assert all(os.path.exists(path) for path in written.values())
+        assert written["fasta"] == os.path.join(tmp, "out", "run.fasta")
+
+        progress = [p for kind, p in events if kind == "progress"]
+        stages = list(dict.fromkeys(p.stage for p in progress))
+        assert stages == ["Merging loci", "Writing FASTA", "Writing NEXUS", "Computing statistics", "Writing report"]
+        fasta = [p for p in progress if p.stage == "Writing FASTA"]
+        assert fasta[-1].done == fasta[-1].total and fasta[-1].unit == "bytes"
+        assert describe_progress(progress[0]) == "Merging loci: 1 of 5 loci"
+
+def test_cancel_stops_and_cleans_up():
+    started = threading.Event()
+    def slow(task):
+        for i in range(10_000):
+            started.set()
+            task.progress("Spinning", i, 10_000, "steps")
+            threading.Event().wait(0.001)
+        return "finished"
+
+    task = BackgroundTask(slow).start()
+    started.wait(5)
+    task.cancel()
+    assert task.wait(5)
+    assert task.poll()[-1] == ("cancelled", None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_loci(tmp)
+        results, _ = read_files(paths)
+        report = os.path.join(tmp, "run.pdf")
+        task = BackgroundTask(export_task, [s for _, s in results], paths, report)
+        task.cancel()
+        task.start()
+        assert task.wait(30) and task.poll()[-1][0] == "cancelled"
+        assert not os.path.exists(os.path.join(tmp, "run.fasta"))
+
+        # A later export cancelled while writing the FASTA removes only that file,
+        # not the other outputs of the earlier export
+        earlier = [os.path.join(tmp, name) for name in ("run.fasta", "run.nex", "run.pdf")]
+        for path in earlier:
+            with open(path, "w") as f:
+                f.write("earlier export\n")
+
+        class CancelWhileWritingFasta(BackgroundTask):
+            def progress(self, stage, done, total, unit=""):
+                if stage == "Writing FASTA" and done:
+                    self.cancel()
+                super().progress(stage, done, total, unit)
+
+        task = CancelWhileWritingFasta(export_task, [s for _, s in results], paths, report).start()
+        assert task.wait(30) and task.poll()[-1][0] == "cancelled"
+        assert [os.path.exists(path) for path in earlier] == [False, True, True]
+
+def test_read_files_progress_can_abort():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_loci(tmp)
+        seen = []
+        def progress(done, total):
+            seen.append(done)
+            if done == 2:
+                raise Cancelled()
+        try:
+            read_files(paths, progress=progress)
+            assert False, "expected Cancelled"
+        except Cancelled:
+            pass
+        assert seen == [1, 2]
+
+def test_edits_keep_partitions_and_skip_remerge():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_loci(tmp, 3)
+        loci = [s for _, s in read_files(paths)[0]]
+        journal = EditJournal([("rename", "B", "B2"), ("patch", "A", 4, "NNNN")])
+        kind, (edited, merged, partitions) = _run(merge_edited_task, loci, journal)[-1]
+        assert kind == "done"
+        assert edited[0] == {"A": "ACGT", "B2": "ACGA"} and edited[1]["A"] == "NNNNACGT"
+        assert [label for label, _, _ in partitions] == ["gene1", "gene2", "gene3"]
+        assert merged["B2"].startswith("ACGA")
+
+        events = _run(export_task, edited, paths, os.path.join(tmp, "run.pdf"), "?", (merged, partitions))
+        assert events[-1][0] == "done"
+        assert "Merging loci" not in {p.stage for kind, p in events if kind == "progress"}
+
+def test_errors_are_reported():
+    def broken(task):
+        raise ValueError("bad input")
+    kind, error = _run(broken)[-1]
+    assert kind == "error" and str(error) == "bad input"
+
+if __name__ == "__main__":
+    test_load_and_export_report_progress()
+    test_cancel_stops_and_cleans_up()
+    test_read_files_progress_can_abort()
+    test_edits_keep_partitions_and_skip_remerge()
+    test_errors_are_reported()
+    print("gui worker passed ✔️")
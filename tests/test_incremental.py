@@ -0,0 +1,73 @@
+import os
+import tempfile
+
+import pytest
+
+from sequence_concatenator.core.incremental import run_incremental
+
+def _write(path, records):
+    with open(path, "w") as f:
+        for taxon, seq in records.items():
+            f.write(f">{taxon}\n{seq}\n")
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def _assert_matches_full_build(tmp, paths, out, **kwargs):
+    reference = os.path.join(tmp, "reference", "out")
+    mode, partitions, stats = run_incremental(paths, reference, **kwargs)
+    assert mode == "full"
+    for suffix in (".fasta", "_partition.txt", ".nex"):
+        if os.path.exists(reference + suffix):
+            assert _read(out + suffix) == _read(reference + suffix), suffix
+    os.remove(reference + ".manifest.json")
+    return partitions, stats
+
+def test_incremental_modes():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"locus{i}.fasta") for i in range(3)]
+        _write(paths[0], {"A": "ACGT" * 20, "B": "AC-T" * 20})
+        _write(paths[1], {"B": "GGGCC", "C": "TT?TT"})
+        _write(paths[2], {"A": "AAA", "C": "CCC"})
+        out = os.path.join(tmp, "out", "combined")
+        options = dict(nexus=True, line_width=7)
+
+        assert run_incremental(paths, out, **options)[0] == "full"
+        assert run_incremental(paths, out, **options)[0] == "unchanged"
+
+        # Same length and taxa: patched in place
+        _write(paths[1], {"B": "CCCGG", "C": "T--TT"})
+        mode, partitions, stats = run_incremental(paths, out, **options)
+        assert mode == "patched"
+        assert (partitions, stats) == _assert_matches_full_build(tmp, paths, out, **options)
+
+        # Locus grows and gains a taxon: rebuilt with shifted coordinates
+        _write(paths[1], {"B": "CCCGGAA", "D": "T--TTAA"})
+        mode, partitions, stats = run_incremental(paths, out, **options)
+        assert mode == "rebuilt"
+        assert partitions == [("gene1", 1, 80), ("gene2", 81, 87), ("gene3", 88, 90)]
+        assert (partitions, stats) == _assert_matches_full_build(tmp, paths, out, **options)
+
+        # Different settings force a full build
+        assert run_incremental(paths, out, nexus=True, line_width=0)[0] == "full"
+
+def test_check_lengths_is_honoured_and_forces_full_build():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"locus{i}.fasta") for i in range(2)]
+        _write(paths[0], {"A": "ACGT", "B": "ACGA"})
+        _write(paths[1], {"A": "GG", "B": "GGC"})  # ragged
+        out = os.path.join(tmp, "out", "combined")
+
+        assert run_incremental(paths, out)[0] == "full"
+        with pytest.raises(IOError, match="Inconsistent sequence lengths"):
+            run_incremental(paths, out, check_lengths=True)
+
+        _write(paths[1], {"A": "GGC", "B": "GGC"})
+        assert run_incremental(paths, out)[0] == "patched"
+        assert run_incremental(paths, out, check_lengths=True)[0] == "full"
+
+if __name__ == "__main__":
+    test_incremental_modes()
+    test_check_lengths_is_honoured_and_forces_full_build()
+    print("incremental passed ✔️")
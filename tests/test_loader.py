@@ -0,0 +1,35 @@
+import os
+
+from sequence_concatenator.readers.loader import read_file_auto, read_files
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+FASTA = os.path.join(DATA_DIR, "input1.fasta")
+NEXUS = os.path.join(DATA_DIR, "input2.nex.nex")
+GENBANK = os.path.join(DATA_DIR, "input3.gbff")
+
+def test_read_file_auto():
+    assert read_file_auto(FASTA) == {"Taxon1": "ATGCCG", "Taxon2": "ATGCC-"}
+    assert read_file_auto(GENBANK) == {"Taxon1": "AACGTG"}
+
+def test_read_files_preserves_order_in_parallel():
+    paths = [GENBANK, FASTA, NEXUS, FASTA]
+    serial, serial_errors = read_files(paths, jobs=1)
+    parallel, parallel_errors = read_files(paths, jobs=2)
+
+    assert serial_errors == parallel_errors == []
+    assert [p for p, _ in parallel] == paths
+    assert parallel == serial
+
+def test_read_files_collects_errors():
+    paths = [FASTA, "missing.fasta", "notes.txt", GENBANK]
+    results, errors = read_files(paths, jobs=2)
+
+    assert [p for p, _ in results] == [FASTA, GENBANK]
+    assert [p for p, _ in errors] == ["missing.fasta", "notes.txt"]
+    assert "Unsupported format" in errors[1][1]
+
+if __name__ == "__main__":
+    test_read_file_auto()
+    test_read_files_preserves_order_in_parallel()
+    test_read_files_collects_errors()
+    print("loader passed ✔️")
@@ -0,0 +1,89 @@
+import os
+import tempfile
+
+import pytest
+
+from sequence_concatenator.readers.nexus_reader import parse_nexus, read_nexus
+
+INTERLEAVED = """#NEXUS
+[comment [nested; with 'quote] ]
+Begin data;
+Dimensions ntax=3 nchar=8;
+Format datatype=dna missing=N gap=- matchchar=. interleave;
+Matrix
+Taxon1  acgt
+'Taxon 2'  ..-N
+T3 ACNT
+
+Taxon1  GGCC
+'Taxon 2'  ....
+T3 ggcc
+;
+End;
+begin sets;
+charset g1 = 1-4;
+charset 'g 2' = 5-8\\2 8;
+end;
+"""
+
+WRAPPED = """#NEXUS
+BEGIN CHARACTERS;
+  DIMENSIONS NCHAR=10;
+  FORMAT DATATYPE=DNA;
+  MATRIX
+    A ACGTA
+      CGTAC
+    'B''s' ACGTA CGT
+      AC
+  ;
+END;
+"""
+
+def _write(text):
+    handle = tempfile.NamedTemporaryFile("w", suffix=".nex", delete=False)
+    handle.write(text)
+    handle.close()
+    return handle.name
+
+def test_interleaved_matrix_with_format_tokens_and_charsets():
+    path = _write(INTERLEAVED)
+    try:
+        parsed = parse_nexus(path)
+        bio = read_nexus(path, reader="biopython")
+    finally:
+        os.remove(path)
+
+    assert parsed.sequences == {"Taxon1": "acgtGGCC", "Taxon 2": "ac-NGGCC", "T3": "ACNTggcc"}
+    assert parsed.sequences == bio
+    assert (parsed.missing, parsed.gap, parsed.matchchar) == ("N", "-", ".")
+    assert parsed.charsets == {"g1": [(1, 4, 1)], "g 2": [(5, 8, 2), (8, 8, 1)]}
+
+def test_wrapped_sequential_matrix():
+    path = _write(WRAPPED)
+    try:
+        assert read_nexus(path) == {"A": "ACGTACGTAC", "B's": "ACGTACGTAC"}
+    finally:
+        os.remove(path)
+
+def test_polymorphisms_fall_back_to_biopython():
+    path = _write("#NEXUS\nbegin data; dimensions ntax=2 nchar=3; format datatype=dna;\n"
+                  "matrix\nA AC(GT)\nB ACG\n;\nend;\n")
+    try:
+        assert read_nexus(path) == {"A": "ACK", "B": "ACG"}
+    finally:
+        os.remove(path)
+
+def test_invalid_file():
+    path = _write(">not nexus\nACGT\n")
+    try:
+        with pytest.raises(IOError):
+            read_nexus(path)
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    test_interleaved_matrix_with_format_tokens_and_charsets()
+    test_wrapped_sequential_matrix()
+    test_polymorphisms_fall_back_to_biopython()
+    test_invalid_file()
+    print("nexus_reader passed ✔️")
@@ -1,7 +1,10 @@
 # test_nexus_writer.py
 
 import os
-from export.nexus_writer import write_nexus
+
+import pytest
+
+from sequence_concatenator.writers.nexus_writer import write_nexus
 from pathlib import Path
 
 def test_write_nexus():
@@ -32,5 +35,52 @@ CHARSET gene2 = 4-6;
 
     # os.remove(output_file)
 
+def test_write_nexus_interleaved_and_streamed():
+    from Bio.Nexus import Nexus
+
+    sequence_dict = {
+        "Taxon2": "ACGTACGTAC",
+        "Long taxon": "CCCCCGGGGG",
+        "T1": "AC-TAC??AC"
+    }
+
+    output_file = "test_data/output_interleaved.nex"
+    write_nexus(sequence_dict, output_file, interleave=True, block_width=4)
+    with open(output_file) as f:
+        content = f.read()
+    assert "interleave=yes" in content
+    assert "'Long taxon' CCCC\nT1           AC-T\nTaxon2       ACGT\n\n" in content
+
+    parsed = Nexus.Nexus()
+    parsed.read(output_file)
+    assert {t: "".join(s).upper() for t, s in parsed.matrix.items()} == {
+        "Long taxon": "CCCCCGGGGG", "T1": "AC-TAC??AC", "Taxon2": "ACGTACGTAC"
+    }
+
+    rows = iter([("T1", "AC"), ("Taxon2", "GT")])
+    write_nexus(rows, output_file, taxa=["T1", "Taxon2"], nchar=2)
+    with open(output_file) as f:
+        content = f.read()
+    assert "ntax=2 nchar=2" in content
+    assert "T1     AC\nTaxon2 GT\n" in content
+
+    os.remove(output_file)
+
+def test_write_nexus_interleaved_alignment():
+    pytest.importorskip("numpy")
+    from sequence_concatenator.core.alignment import Alignment
+
+    sequence_dict = {"Taxon2": "ACGTACGTAC", "T1": "AC-TAC??AC"}
+    os.makedirs("test_data", exist_ok=True)
+    expected_file = "test_data/output_interleaved_dict.nex"
+    output_file = "test_data/output_interleaved_alignment.nex"
+    write_nexus(sequence_dict, expected_file, interleave=True, block_width=4)
+    write_nexus(Alignment.from_dict(sequence_dict), output_file, interleave=True, block_width=4)
+    with open(expected_file) as f, open(output_file) as g:
+        assert g.read() == f.read()
+    os.remove(expected_file)
+    os.remove(output_file)
+
 if __name__ == "__main__":
-    test_write_nexus()
\ No newline at end of file
+    test_write_nexus()
+    test_write_nexus_interleaved_and_streamed()
\ No newline at end of file
@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from sequence_concatenator.core.alignment import Alignment
+from sequence_concatenator.core.occupancy import filter_occupancy
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.core.sequence_merger import merge_sequences
+
+LOCI = [
+    {"A": "ACGTAC", "B": "ACG-A?", "C": "ACGTA?", "D": "??????"},
+    {"A": "GGG", "B": "GGC"},
+    {"A": "TTAA", "B": "T?AA", "C": "TTA-", "D": "T???"},
+]
+
+def _alignment():
+    merged, partitions = merge_sequences(LOCI, backend="array")
+    return merged
+
+def test_no_thresholds_keeps_everything():
+    alignment = _alignment()
+    filtered, report = filter_occupancy(alignment)
+    assert filtered.to_dict() == alignment.to_dict()
+    assert filtered.partitions == alignment.partitions
+    assert report.dropped_loci == report.dropped_taxa == [] and report.dropped_columns == 0
+    assert report.locus_occupancy == {"gene1": 0.75, "gene2": 0.5, "gene3": 1.0}
+
+def test_locus_then_taxon_then_column():
+    filtered, report = filter_occupancy(
+        _alignment(), min_locus=0.6, min_taxon=0.5, min_column=1.0
+    )
+    # gene2 (2 of 4 taxa) goes first; D has 1 of 10 cells left; then columns
+    # with a gap or placeholder among A, B, C go
+    assert report.dropped_loci == ["gene2"]
+    assert report.dropped_taxa == ["D"]
+    assert filtered.taxa == ["A", "B", "C"]
+    assert filtered.to_dict() == {"A": "ACGATA", "B": "ACGATA", "C": "ACGATA"}
+    assert filtered.partitions == [("gene1", 1, 4), ("gene3", 5, 6)]
+    assert report.trimmed_loci == ["gene1", "gene3"]
+    assert report.dropped_columns == 4
+
+def test_locus_emptied_by_column_filter():
+    filtered, report = filter_occupancy(
+        Alignment.from_dict({"A": "AC??", "B": "AG??"}, [("gene1", 1, 2), ("gene2", 3, 4)]),
+        min_column=0.5
+    )
+    assert filtered.to_dict() == {"A": "AC", "B": "AG"}
+    assert filtered.partitions == [("gene1", 1, 2)]
+    assert report.dropped_loci == ["gene2"] and report.trimmed_loci == []
+    # The emptied locus is counted as dropped, not as dropped columns
+    assert report.dropped_columns == 0
+
+def test_codon_charsets_only_for_untrimmed_loci():
+    text = generate_partition_file([("gene1", 1, 4), ("gene3", 5, 9)], codon={"gene3"})
+    assert "gene1_pos1" not in text
+    assert "CHARSET gene3_pos1 = 5-9\\3;" in text
+    assert generate_partition_file([("g", 1, 3)], codon=True).count("CHARSET") == 4
+
+if __name__ == "__main__":
+    test_no_thresholds_keeps_everything()
+    test_locus_then_taxon_then_column()
+    test_locus_emptied_by_column_filter()
+    test_codon_charsets_only_for_untrimmed_loci()
+    print("occupancy passed ✔️")
@@ -0,0 +1,123 @@
+import os
+import tempfile
+
+from sequence_concatenator.readers.loader import read_files
+from sequence_concatenator.readers.parse_cache import ParseCache, WarmParseCache
+
+def _write(directory, name, text):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+def test_cache_hit_and_invalidation():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, "cache"))
+        path = _write(tmp, "a.fasta", ">T1\nACGT\n")
+        calls = []
+
+        def parse(p):
+            calls.append(p)
+            return {"T1": "ACGT", "Tä": ""}
+
+        assert cache.read(path, parse) == {"T1": "ACGT", "Tä": ""}
+        assert cache.read(path, parse) == {"T1": "ACGT", "Tä": ""}
+        assert len(calls) == 1
+        assert cache.get(path, variant="other") is None
+
+        _write(tmp, "a.fasta", ">T1\nACGTT\n")
+        os.utime(path, ns=(1, 1))
+        assert cache.get(path) is None
+
+def test_content_hash_and_corrupt_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, "cache"), content_hash=True)
+        path = _write(tmp, "a.fasta", ">T1\nACGT\n")
+        cache.put(path, {"T1": "ACGT"})
+        os.utime(path, ns=(1, 1))
+        assert cache.get(path) == {"T1": "ACGT"}
+
+        entry = cache._entry_path(cache.key(path))
+        with open(entry, "r+b") as f:
+            f.truncate(10)
+        assert cache.get(path) is None
+
+def test_lru_eviction():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, "cache"), max_bytes=150)
+        paths = [_write(tmp, f"{i}.fasta", "") for i in range(3)]
+        cache.put(paths[0], {"T": "A" * 50})
+        cache.put(paths[1], {"T": "C" * 50})
+        os.utime(cache._entry_path(cache.key(paths[0])), ns=(1, 1))
+        os.utime(cache._entry_path(cache.key(paths[1])), ns=(2, 2))
+        cache.get(paths[0])  # touch: paths[1] is now least recently used
+        cache.put(paths[2], {"T": "G" * 50})
+
+        assert cache.get(paths[0]) == {"T": "A" * 50}
+        assert cache.get(paths[1]) is None
+        assert cache.get(paths[2]) == {"T": "G" * 50}
+
+def test_put_scans_directory_only_when_over_limit():
+    class CountingCache(ParseCache):
+        scans = 0
+
+        def evict(self):
+            self.scans += 1
+            super().evict()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = CountingCache(os.path.join(tmp, "cache"), max_bytes=250)
+        paths = [_write(tmp, f"{i}.fasta", "") for i in range(4)]
+        for path in paths[:3]:
+            cache.put(path, {"T": "A" * 50})
+        assert cache.scans == 1  # the initial size scan
+        cache.put(paths[3], {"T": "C" * 50})
+        assert cache.scans == 2
+        entries = os.listdir(cache.cache_dir)
+        assert len(entries) == 3
+        assert sum(os.path.getsize(os.path.join(cache.cache_dir, e)) for e in entries) <= 250
+
+def test_read_files_uses_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, "cache"))
+        path = _write(tmp, "a.fasta", ">T1\nACGT\n")
+        first, _ = read_files([path], cache=cache)
+        cache_entries = os.listdir(cache.cache_dir)
+
+        # Same size and mtime, different content: only a cache hit still
+        # returns the first parse
+        stat = os.stat(path)
+        _write(tmp, "a.fasta", ">T1\nTTTT\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        for jobs in (1, 2):
+            second, _ = read_files([path], jobs=jobs, cache=cache)
+            assert first == second == [(path, {"T1": "ACGT"})]
+        assert len(cache_entries) == 1
+        assert read_files([path])[0] == [(path, {"T1": "TTTT"})]
+
+def test_warm_cache_keeps_recent_entries_in_memory():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = WarmParseCache(os.path.join(tmp, "cache"), memory_bytes=12)
+        a = _write(tmp, "a.fasta", ">T1\nACGT\n")
+        b = _write(tmp, "b.fasta", ">T2\nGGGGG\n")
+        parsed = cache.read(a, lambda p: {"T1": "ACGT"})
+        assert cache.read(a, lambda p: None) is parsed
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # b pushes a out of memory; a is then served from disk
+        cache.read(b, lambda p: {"T2": "GGGGG"})
+        assert cache.read(a, lambda p: None) == {"T1": "ACGT"}
+        assert (cache.hits, cache.disk_hits, cache.misses) == (2, 1, 2)
+
+        # Worker processes receive the on-disk cache only
+        second, _ = read_files([a, b], jobs=2, cache=cache)
+        assert [seqs for _, seqs in second] == [{"T1": "ACGT"}, {"T2": "GGGGG"}]
+
+if __name__ == "__main__":
+    test_cache_hit_and_invalidation()
+    test_content_hash_and_corrupt_entries()
+    test_lru_eviction()
+    test_put_scans_directory_only_when_over_limit()
+    test_read_files_uses_cache()
+    test_warm_cache_keeps_recent_entries_in_memory()
+    print("parse_cache passed ✔️")
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+
+from sequence_concatenator.core.pipeline import read_and_merge, write_outputs
+from sequence_concatenator.core.sequence_merger import LocusMerger, merge_sequences
+from sequence_concatenator.readers.loader import read_file_auto
+from sequence_concatenator.readers.parse_cache import WarmParseCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _write_loci(directory, count=6):
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"locus{i}.fasta")
+        with open(path, "w") as f:
+            # Taxon T{i} first appears in locus i; loci have different lengths
+            f.write("".join(f">T{j}\n{'ACGT'[j % 4] * (i + 3)}\n" for j in range(i + 1)))
+        paths.append(path)
+    return paths
+
+def test_locus_merger_matches_merge_sequences():
+    loci = [{"A": "ACGT", "B": "AC"}, {}, {"C": "GG", "A": "TT"}, {"B": "A"}]
+    merger = LocusMerger("-")
+    for locus in loci:
+        merger.add(locus)
+    assert merger.result() == merge_sequences(loci, placeholder="-") == (
+        {"A": "ACGTTT-", "B": "AC----A", "C": "----GG-"},
+        [("gene1", 1, 4), ("gene2", 5, 4), ("gene3", 5, 6), ("gene4", 7, 7)],
+    )
+
+def test_read_and_merge_keeps_input_order():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_loci(tmp)
+        expected = merge_sequences([read_file_auto(p) for p in paths])
+        seen = []
+        for jobs in (1, 2):
+            merged, partitions, errors = asyncio.run(read_and_merge(
+                paths, jobs=jobs, queue_size=1, progress=lambda done, total: seen.append(done)
+            ))
+            assert errors == [] and (merged, partitions) == expected
+        assert seen == [1, 2, 3, 4, 5, 6] * 2
+
+        cache = WarmParseCache(os.path.join(tmp, "cache"))
+        for _ in range(2):
+            assert asyncio.run(read_and_merge(paths, cache=cache))[:2] == expected
+        assert cache.hits == len(paths)
+
+        merged, _, errors = asyncio.run(read_and_merge(paths[:2] + [os.path.join(tmp, "missing.fasta")]))
+        assert merged is None and len(errors) == 1 and errors[0][0].endswith("missing.fasta")
+
+def test_overlap_outputs_match_sequential_cli():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_loci(tmp)
+        outputs = {}
+        for mode in ("sequential", "overlap"):
+            out = os.path.join(tmp, mode)
+            extra = ["--overlap", "--jobs", "2"] if mode == "overlap" else []
+            result = subprocess.run(
+                [sys.executable, os.path.join(ROOT, "cli.py"), *paths, "--out", out, "--nexus",
+                 "--no-cache", *extra],
+                capture_output=True, text=True
+            )
+            assert result.returncode == 0, result.stderr
+            outputs[mode] = [
+                open(out + suffix).read() for suffix in (".fasta", "_partition.txt", ".nex")
+            ]
+            assert "Taxa: 6" in result.stdout
+        assert outputs["sequential"] == outputs["overlap"]
+
+def test_write_outputs_reports_paths():
+    merged, partitions = merge_sequences([{"A": "ACGT", "B": "AC-T"}, {"A": "GG"}])
+    with tempfile.TemporaryDirectory() as tmp:
+        stats, paths = asyncio.run(write_outputs(merged, partitions, os.path.join(tmp, "run"), nexus=True))
+        assert sorted(paths) == ["fasta", "nexus", "partition"]
+        assert all(os.path.exists(path) for path in paths.values())
+        assert stats["num_taxa"] == 2 and stats["alignment_length"] == 6
+
+if __name__ == "__main__":
+    test_locus_merger_matches_merge_sequences()
+    test_read_and_merge_keeps_input_order()
+    test_overlap_outputs_match_sequential_cli()
+    test_write_outputs_reports_paths()
+    print("pipeline passed ✔️")
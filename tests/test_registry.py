@@ -0,0 +1,142 @@
+import os
+import tempfile
+
+from sequence_concatenator.readers.loader import read_file_auto, read_files
+from sequence_concatenator.readers.registry import (
+    ReaderSpec, _formats, detect_format, format_for_extension, register_reader
+)
+from sequence_concatenator.utils.file_utils import is_supported_format
+
+DATA = os.path.join(os.path.dirname(__file__), "..", "data")
+
+EXPECTED = {"Taxon1": "ACGTACGTAC", "Taxon_2": "AC-TACGTAC", "T3": "ACGTAC?TAC"}
+
+PHYLIP_SEQUENTIAL = """3 10
+Taxon1     ACGTACGTAC
+Taxon_2    AC-TACGTAC
+T3         ACGTAC?TAC
+"""
+
+PHYLIP_INTERLEAVED = """ 3 10
+Taxon1 ACGTA
+Taxon_2 AC-TA
+T3 ACGTA
+
+CGTAC
+CGTAC
+C?TAC
+"""
+
+PHYLIP_WRAPPED = """3 10 S
+Taxon1 ACGTA
+CGTAC
+Taxon_2 AC-TA
+CGTAC
+T3 ACGTA
+C?TAC
+"""
+
+PHYLIP_STRICT_SPACES = """3 10
+Homo sapieACGTACGTAC
+Pan trogloAC-TACGTAC
+T3        ACGTAC?TAC
+"""
+
+CLUSTAL = """CLUSTAL W (1.83) multiple sequence alignment
+
+
+Taxon1         ACGTA 5
+Taxon_2        AC-TA 4
+T3             ACGTA 5
+               ** **
+
+Taxon1         CGTAC 10
+Taxon_2        CGTAC 9
+T3             C?TAC 10
+               * ***
+"""
+
+STOCKHOLM = """# STOCKHOLM 1.0
+#=GF ID   test
+Taxon1   ACGTA
+Taxon_2  AC-TA
+T3       ACGTA
+#=GC SS_cons .....
+
+Taxon1   CGTAC
+Taxon_2  CGTAC
+T3       C?TAC
+#=GC SS_cons .....
+//
+"""
+
+def _write(tmp, name, text):
+    path = os.path.join(tmp, name)
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+def test_new_formats_match_biopython():
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            ("seq.phy", PHYLIP_SEQUENTIAL, "phylip"),
+            ("inter.phy", PHYLIP_INTERLEAVED, "phylip"),
+            ("wrapped.phy", PHYLIP_WRAPPED, "phylip"),
+            ("a.aln", CLUSTAL, "clustal"),
+            ("a.sto", STOCKHOLM, "stockholm"),
+        ]
+        for name, text, fmt in cases:
+            path = _write(tmp, name, text)
+            assert detect_format(path) == fmt
+            assert read_file_auto(path) == EXPECTED, name
+            if name != "wrapped.phy":  # Biopython's relaxed PHYLIP reader is interleaved-only
+                assert read_file_auto(path, reader="biopython") == EXPECTED, name
+
+def test_strict_phylip_names_with_spaces():
+    expected = {"Homo sapie": "ACGTACGTAC", "Pan troglo": "AC-TACGTAC", "T3": "ACGTAC?TAC"}
+    with tempfile.TemporaryDirectory() as tmp:
+        sequential = PHYLIP_STRICT_SPACES.replace("3 10", "3 10 S")
+        for name, text in (("inter.phy", PHYLIP_STRICT_SPACES), ("seq.phy", sequential)):
+            assert read_file_auto(_write(tmp, name, text)) == expected, name
+
+def test_content_wins_over_extension():
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(DATA, "input1.fasta")) as f:
+            fasta = f.read()
+        misnamed = _write(tmp, "input1.aln", fasta)
+        unnamed = _write(tmp, "input1.txt", fasta)
+        assert detect_format(misnamed) == detect_format(unnamed) == "fasta"
+        assert read_file_auto(unnamed) == read_file_auto(os.path.join(DATA, "input1.fasta"))
+        assert is_supported_format(unnamed) is True
+
+        # Unrecognised content falls back to the extension
+        assert detect_format(_write(tmp, "empty.fas", "")) == "fasta"
+        assert detect_format(_write(tmp, "notes.txt", "hello")) is None
+        assert format_for_extension("loci.nexus.gz") == "nexus"
+
+        results, errors = read_files([misnamed, os.path.join(tmp, "notes.txt")])
+        assert [path for path, _ in results] == [misnamed]
+        assert "Unsupported format" in errors[0][1]
+
+def test_register_reader():
+    spec = ReaderSpec(
+        "upper", "Upper", ("up",),
+        lambda path, reader="fast", check_lengths=False: {"X": "ACGT"},
+        lambda head: head.startswith(b"UPPER")
+    )
+    register_reader(spec)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write(tmp, "a.dat", "UPPER\n")
+            assert detect_format(path) == "upper"
+            assert read_file_auto(path) == {"X": "ACGT"}
+            assert is_supported_format("b.up") is True
+    finally:
+        del _formats["upper"]
+
+if __name__ == "__main__":
+    test_new_formats_match_biopython()
+    test_strict_phylip_names_with_spaces()
+    test_content_wins_over_extension()
+    test_register_reader()
+    print("registry passed ✔️")
@@ -0,0 +1,53 @@
+import io
+import os
+import tempfile
+
+import pytest
+from PIL import Image
+
+np = pytest.importorskip("numpy")
+
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.stats import compute_alignment_stats, compute_detailed_stats
+from sequence_concatenator.writers.report_writer import _bin_matrix, _chart_specs, _render_chart, write_report
+
+def _loci(num_loci=12, num_taxa=30):
+    return [{f"T{t}": "ACGT?-"[(t + i) % 6] * (i + 2) for t in range(num_taxa) if (t * i) % 4} for i in range(num_loci)]
+
+def test_bin_matrix_averages_blocks():
+    matrix = np.arange(20, dtype=float).reshape(4, 5)
+    binned, rows, cols = _bin_matrix(matrix, 2, 2)
+    assert (rows, cols) == (2, 3)
+    assert binned.tolist() == [[3.5, 6.0], [13.5, 16.0]]
+    same, rows, cols = _bin_matrix(matrix, 10, 10)
+    assert (rows, cols) == (1, 1) and same is matrix
+
+def test_summarized_charts_above_max_items():
+    merged, partitions = merge_sequences(_loci())
+    stats = compute_detailed_stats(merged, partitions)
+    missing = [round(f * 100, 2) for f in stats.taxon_missing_fraction()]
+    kinds = [spec["kind"] for spec in _chart_specs(stats.taxa, missing, partitions, stats, 5)]
+    assert kinds == ["histogram", "histogram", "heatmap"]
+    kinds = [spec["kind"] for spec in _chart_specs(stats.taxa, missing, partitions, None, 100)]
+    assert kinds == ["bar", "bar"]
+
+def test_charts_are_rgb_png():
+    spec = {"kind": "bar", "title": "t", "ylabel": "y", "labels": ["a", "b"], "values": [1, 2]}
+    image = Image.open(io.BytesIO(_render_chart(spec)))
+    assert image.format == "PNG" and image.mode == "RGB"
+
+def test_write_report():
+    merged, partitions = merge_sequences(_loci())
+    with tempfile.TemporaryDirectory() as tmp:
+        for stats, jobs in ((compute_detailed_stats(merged, partitions), 2), (compute_alignment_stats(merged), 1)):
+            path = os.path.join(tmp, "report.pdf")
+            write_report(merged, partitions, stats, ["a.fasta"] * 12, path, max_items=5, jobs=jobs)
+            with open(path, "rb") as f:
+                assert f.read(5) == b"%PDF-"
+
+if __name__ == "__main__":
+    test_bin_matrix_averages_blocks()
+    test_summarized_charts_above_max_items()
+    test_charts_are_rgb_png()
+    test_write_report()
+    print("report writer passed ✔️")
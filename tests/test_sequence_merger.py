@@ -1,4 +1,4 @@
-from core.sequence_merger import merge_sequences
+from sequence_concatenator.core.sequence_merger import merge_sequences
 
 def test_merge_sequences():
     input_dicts = [
@@ -21,5 +21,21 @@ def test_merge_sequences():
 
     print("sequence_merger passed ✔️")
 
+def test_merge_sequences_pads_and_orders_taxa():
+    input_dicts = [
+        {"Taxon2": "AC", "Taxon1": "ACGT"},
+        {"Taxon3": "GG"},
+        {}
+    ]
+
+    merged, partitions = merge_sequences(input_dicts, placeholder="-")
+
+    assert list(merged) == ["Taxon2", "Taxon1", "Taxon3"]
+    assert merged["Taxon2"] == "AC----"
+    assert merged["Taxon1"] == "ACGT--"
+    assert merged["Taxon3"] == "----GG"
+    assert partitions == [("gene1", 1, 4), ("gene2", 5, 6), ("gene3", 7, 6)]
+
 if __name__ == "__main__":
     test_merge_sequences()
+    test_merge_sequences_pads_and_orders_taxa()
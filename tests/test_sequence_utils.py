@@ -1,4 +1,4 @@
-from utils.sequence_utils import pad_sequence, get_all_taxa, ensure_consistent_length
+from sequence_concatenator.utils.sequence_utils import pad_sequence, get_all_taxa, get_ordered_taxa, ensure_consistent_length
 
 def test_pad_sequence():
     assert pad_sequence("ACT", 5) == "ACT??"
@@ -13,6 +13,13 @@ def test_get_all_taxa():
     taxa = get_all_taxa(seq_dicts)
     assert taxa == {"Taxon1", "Taxon2", "Taxon3"}
 
+def test_get_ordered_taxa():
+    seq_dicts = [
+        {"Taxon2": "AAA", "Taxon1": "CCC"},
+        {"Taxon3": "GGG", "Taxon2": "TTT"}
+    ]
+    assert get_ordered_taxa(seq_dicts) == ["Taxon2", "Taxon1", "Taxon3"]
+
 def test_ensure_consistent_length_valid():
     sequence_dict = {"Taxon1": "AAA", "Taxon2": "GGG", "Taxon3": "TTT"}
     ensure_consistent_length(sequence_dict)  # should not raise
@@ -28,6 +35,7 @@ def test_ensure_consistent_length_invalid():
 if __name__ == "__main__":
     test_pad_sequence()
     test_get_all_taxa()
+    test_get_ordered_taxa()
     test_ensure_consistent_length_valid()
     test_ensure_consistent_length_invalid()
     print("sequence_utils passed ✔️")
\ No newline at end of file
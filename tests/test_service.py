@@ -0,0 +1,104 @@
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("httpx")  # required by fastapi.testclient
+
+from fastapi.testclient import TestClient
+
+from sequence_concatenator.service.app import create_app
+from sequence_concatenator.service.jobs import JobQueue, QueueFull
+
+LOCUS1 = b">A\nACGT\n>B\nACGA\n"
+LOCUS2 = b">A\nGGGGCC\n>C\nGGGGTT\n"
+
+def _wait(client, job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = client.get(f"/jobs/{job_id}").json()
+        if status["status"] not in ("queued", "running"):
+            return status
+        time.sleep(0.02)
+    raise AssertionError("job did not finish")
+
+def _run_job(client, uploads, **options):
+    response = client.post("/jobs", json={"uploads": uploads, **options})
+    assert response.status_code == 202, response.text
+    assert response.headers["Location"] == f"/jobs/{response.json()['job_id']}"
+    return _wait(client, response.json()["job_id"])
+
+def test_upload_concatenate_and_download():
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(data_dir=os.path.join(tmp, "data"), cache_dir=os.path.join(tmp, "cache"))
+        with TestClient(app) as client:
+            ids = []
+            for name, body in (("locus1.fasta", LOCUS1), ("locus2.fa", LOCUS2)):
+                response = client.post("/uploads", params={"name": name}, content=body)
+                assert response.status_code == 201
+                ids.append(response.json()["upload_id"])
+            assert ids[0].endswith(".fasta") and ids[1].endswith(".fa")
+
+            status = _run_job(client, ids, nexus=True)
+            assert status["status"] == "done", status
+            assert status["outputs"] == ["fasta", "nexus", "partition"]
+            assert status["summary"]["num_taxa"] == 3
+            assert status["summary"]["partitions"] == [["gene1", 1, 4], ["gene2", 5, 10]]
+
+            fasta = client.get(f"/jobs/{status['job_id']}/results/fasta").text
+            assert ">C\n????GGGGTT" in fasta
+            assert client.get(f"/jobs/{status['job_id']}/results/stats").status_code == 404
+
+            # Re-uploading the same content reuses the stored file and the warm cache
+            again = client.post("/uploads", params={"name": "copy.fasta"}, content=LOCUS1).json()
+            assert again["upload_id"] == ids[0]
+            hits = client.get("/health").json()["cache"]["hits"]
+            assert _run_job(client, ids)["status"] == "done"
+            assert client.get("/health").json()["cache"]["hits"] == hits + 2
+
+            assert client.delete(f"/jobs/{status['job_id']}").status_code == 204
+            assert client.get(f"/jobs/{status['job_id']}").status_code == 404
+
+def test_rejects_bad_requests():
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app(data_dir=os.path.join(tmp, "data"), cache_dir=os.path.join(tmp, "cache"),
+                         max_upload_bytes=16)
+        with TestClient(app) as client:
+            assert client.post("/uploads", params={"name": "big.fasta"}, content=b"A" * 17).status_code == 413
+            assert os.listdir(os.path.join(tmp, "data", "uploads")) == []
+            assert client.post("/jobs", json={"uploads": ["missing.fasta"]}).status_code == 404
+            assert client.post("/jobs", json={"uploads": ["../etc/passwd"]}).status_code == 404
+            assert client.post("/jobs", json={"uploads": []}).status_code == 422
+
+            ragged = client.post("/uploads", params={"name": "ragged.fasta"}, content=b">A\nACGT\n>B\nAC\n").json()
+            status = _run_job(client, [ragged["upload_id"]], check_lengths=True)
+            assert status["status"] == "failed" and status["error"]
+
+def test_queue_is_bounded():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "locus.fasta")
+        with open(path, "wb") as f:
+            f.write(LOCUS1)
+        release = threading.Event()
+        queue = JobQueue(os.path.join(tmp, "jobs"), workers=1, max_pending=2)
+        blocker = queue._executor.submit(release.wait)  # occupy the only worker
+        first = queue.submit([path])
+        queue.submit([path])
+        try:
+            queue.submit([path])
+            assert False, "expected QueueFull"
+        except QueueFull:
+            pass
+        queue.delete(first.id)
+        assert first.status == "cancelled" and not os.path.exists(first.workdir)
+        release.set()
+        blocker.result()
+        queue.shutdown()
+
+if __name__ == "__main__":
+    test_upload_concatenate_and_download()
+    test_rejects_bad_requests()
+    test_queue_is_bounded()
+    print("service passed ✔️")
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+from sequence_concatenator import __version__
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the CLI must not import unless a code path needs them
+HEAVY_MODULES = ("numpy", "matplotlib", "fpdf", "PIL", "Bio", "multiprocessing", "zstandard")
+
+def _importtime(*args):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    imported = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                imported.add(name.strip())
+    return result.stdout, imported
+
+def _heavy(imported):
+    return sorted(name for name in imported if name.split(".")[0] in HEAVY_MODULES)
+
+def test_cli_import_is_light():
+    _, imported = _importtime("-c", "import sequence_concatenator.cli")
+    assert "sequence_concatenator.cli" in imported
+    assert _heavy(imported) == []
+
+def test_version_imports_nothing_heavy():
+    stdout, imported = _importtime("-m", "sequence_concatenator.cli", "--version")
+    assert stdout.strip().endswith(__version__)
+    assert _heavy(imported) == []
+
+if __name__ == "__main__":
+    test_cli_import_is_light()
+    test_version_imports_nothing_heavy()
+    print("startup passed ✔️")
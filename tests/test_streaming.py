@@ -0,0 +1,120 @@
+import os
+import random
+import tempfile
+from collections import Counter
+
+import pytest
+
+from sequence_concatenator.core.partition_generator import generate_partition_file
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.stats import compute_alignment_stats
+from sequence_concatenator.core import streaming
+from sequence_concatenator.core.streaming import (
+    MAX_OPEN_FILES, UnreadableInputs, index_fasta, index_inputs, iter_rows, plan_supermatrix, stream_concatenate
+)
+from sequence_concatenator.readers.loader import read_file_auto
+from sequence_concatenator.writers.fasta_writer import write_fasta
+from sequence_concatenator.writers.nexus_writer import write_nexus
+from sequence_concatenator.writers.partition_writer import write_partition_file
+
+GENBANK = os.path.join(os.path.dirname(__file__), "..", "data", "input3.gbff")
+
+def _write_loci(directory, num_loci=5, seed=3):
+    rng = random.Random(seed)
+    paths = []
+    for i in range(num_loci):
+        path = os.path.join(directory, f"locus{i}.fasta")
+        with open(path, "w") as f:
+            for t in range(6):
+                if rng.random() < 0.3:
+                    continue
+                seq = "".join(rng.choice("ACGT-") for _ in range(rng.randint(50, 140)))
+                f.write(f">Taxon{t} desc\n")
+                for j in range(0, len(seq), 70):
+                    f.write(seq[j:j + 70] + "\n")
+        paths.append(path)
+    return paths
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def test_streaming_output_matches_in_memory():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_loci(tmp) + [GENBANK]
+
+        merged, partitions = merge_sequences([read_file_auto(p) for p in paths])
+        partition_text = generate_partition_file(partitions, codon=True)
+        write_fasta(merged, os.path.join(tmp, "mem.fasta"))
+        write_partition_file(partition_text, os.path.join(tmp, "mem_partition.txt"))
+        write_nexus(merged, os.path.join(tmp, "mem.nex"), partition_text)
+
+        stream_partitions, stats = stream_concatenate(paths, os.path.join(tmp, "stream"), nexus=True)
+
+        assert stream_partitions == partitions
+        assert stats == compute_alignment_stats(merged)
+        for suffix in (".fasta", "_partition.txt", ".nex"):
+            assert _read_bytes(os.path.join(tmp, "stream" + suffix)) == _read_bytes(os.path.join(tmp, "mem" + suffix))
+
+def test_index_fasta():
+    with tempfile.NamedTemporaryFile("w", suffix=".fasta", delete=False) as f:
+        f.write(">A x\nAC GT\nAA\n>B\n\n")
+    try:
+        assert index_fasta(f.name) == {"A": (5, 14, 6), "B": (17, 18, 0)}
+    finally:
+        os.remove(f.name)
+
+def test_unreadable_inputs_are_reported_together():
+    with tempfile.TemporaryDirectory() as tmp:
+        good = os.path.join(tmp, "good.fasta")
+        with open(good, "w") as f:
+            f.write(">A\nACGT\n>B\nACGA\n")
+        non_ascii = os.path.join(tmp, "non_ascii.fasta")
+        with open(non_ascii, "wb") as f:
+            f.write(b">A\nACGT\xc3\xa9\n>B\nACGTA\n")
+        ragged = os.path.join(tmp, "ragged.fasta")
+        with open(ragged, "w") as f:
+            f.write(">A\nACGT\n>B\nAC\n")
+
+        assert len(index_inputs([good, ragged])) == 2
+        with pytest.raises(UnreadableInputs) as caught:
+            index_inputs([non_ascii, good, ragged], check_lengths=True)
+        errors = caught.value.errors
+        assert [path for path, _ in errors] == [non_ascii, ragged]
+        assert "expected 4" in errors[1][1]
+
+def test_rows_open_each_input_once_per_batch(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(MAX_OPEN_FILES + 6):
+            path = os.path.join(tmp, f"locus{i}.fasta")
+            with open(path, "w") as f:
+                f.write("".join(f">T{t}\n{'ACGT'[(t + i) % 4] * 3}\n" for t in range(5) if (t + i) % 3))
+            paths.append(path)
+        loci = index_inputs(paths)
+        taxa, partitions = plan_supermatrix(loci)
+        expected = merge_sequences([read_file_auto(p) for p in paths])[0]
+
+        opened = []
+        real_open = open
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(streaming, "open", counting_open, raising=False)
+        assert dict(iter_rows(loci, partitions, taxa)) == expected
+        assert sorted(opened) == sorted(paths)
+        # Two taxa per batch: three batches, each opening a file at most once
+        opened.clear()
+        batch_bytes = 2 * partitions[-1][2]
+        assert dict(iter_rows(loci, partitions, taxa, batch_bytes=batch_bytes)) == expected
+        assert max(Counter(opened).values()) == 3
+
+if __name__ == "__main__":
+    test_streaming_output_matches_in_memory()
+    test_index_fasta()
+    test_unreadable_inputs_are_reported_together()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        test_rows_open_each_input_once_per_batch(monkeypatch)
+    print("streaming passed ✔️")
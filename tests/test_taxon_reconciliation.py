@@ -0,0 +1,75 @@
+import os
+import tempfile
+
+from sequence_concatenator.core.sequence_merger import merge_sequences
+from sequence_concatenator.core.streaming import InMemoryLocusIndex, reconcile_loci, stream_loci
+from sequence_concatenator.core.taxon_reconciliation import TaxonReconciler, load_table
+from sequence_concatenator.writers.fasta_writer import write_fasta
+
+LOCI = [
+    {"Homo_sapiens_XM001": "ACGT", "Mus_musculus_XM002": "ACGA"},
+    {"Homo": "GG", "Mus": "GC"},
+    {"NC_012920.1": "TTT", "human": "TTA", "MN000001": "TAA"},
+]
+
+def _reconciler():
+    return TaxonReconciler(
+        rules=[(r"^([A-Z][a-z]+)_([a-z]+)_.*$", r"\1_\2")],
+        synonyms={"Homo": "Homo_sapiens", "Mus": "Mus_musculus", "human": "Homo_sapiens"},
+        accessions={"NC_012920": "Homo_sapiens", "MN000001": "Mus_musculus"},
+    )
+
+def test_canonical_names():
+    reconciler = _reconciler()
+    assert reconciler.resolve("Homo_sapiens_XM001") == ("Homo_sapiens", "rule")
+    assert reconciler.resolve("Homo") == ("Homo_sapiens", "synonym")
+    assert reconciler.resolve("NC_012920.1") == ("Homo_sapiens", "accession")
+    assert reconciler.resolve("Danio_rerio") == ("Danio_rerio", None)
+
+def test_apply_merges_rows_and_reports_conflicts():
+    reconciled, report = _reconciler().apply(LOCI)
+    assert reconciled == [
+        {"Homo_sapiens": "ACGT", "Mus_musculus": "ACGA"},
+        {"Homo_sapiens": "GG", "Mus_musculus": "GC"},
+        {"Homo_sapiens": "TTT", "Mus_musculus": "TAA"},
+    ]
+    merged, _ = merge_sequences(reconciled)
+    assert merged == {"Homo_sapiens": "ACGTGGTTT", "Mus_musculus": "ACGAGCTAA"}
+    assert report.conflicts == [(2, "Homo_sapiens", "NC_012920.1", ["human"])]
+    assert report.merged["Homo_sapiens"] == ["Homo_sapiens_XM001", "Homo", "NC_012920.1"]
+    assert report.renamed["human"] == ("Homo_sapiens", "synonym")
+
+def test_streaming_matches_in_memory():
+    with tempfile.TemporaryDirectory() as tmp:
+        reconciled, _ = _reconciler().apply(LOCI)
+        merged, _ = merge_sequences(reconciled)
+        expected = os.path.join(tmp, "expected.fasta")
+        write_fasta(merged, expected)
+
+        loci = [InMemoryLocusIndex(f"locus{i}", seqs) for i, seqs in enumerate(LOCI)]
+        loci, report = reconcile_loci(loci, _reconciler())
+        stream_loci(loci, os.path.join(tmp, "streamed"))
+        with open(expected) as a, open(os.path.join(tmp, "streamed.fasta")) as b:
+            assert a.read() == b.read()
+        assert len(report.conflicts) == 1
+
+def test_load_table():
+    with tempfile.TemporaryDirectory() as tmp:
+        tsv = os.path.join(tmp, "rules.tsv")
+        with open(tsv, "w") as f:
+            f.write("# pattern\treplacement\n\n^(\\w+)\\.\\d+$\t\\1\nfoo\tbar\n")
+        csv_path = os.path.join(tmp, "syn.csv")
+        with open(csv_path, "w") as f:
+            f.write("Homo,Homo_sapiens\n\"Mus, house\",Mus_musculus\n")
+        assert load_table(tsv) == [("^(\\w+)\\.\\d+$", "\\1"), ("foo", "bar")]
+        assert load_table(csv_path) == [("Homo", "Homo_sapiens"), ("Mus, house", "Mus_musculus")]
+        reconciler = TaxonReconciler.from_files(tsv, csv_path)
+        assert reconciler.canonical("ABC123.2") == "ABC123"
+        assert reconciler.canonical("Homo") == "Homo_sapiens"
+
+if __name__ == "__main__":
+    test_canonical_names()
+    test_apply_merges_rows_and_reports_conflicts()
+    test_streaming_matches_in_memory()
+    test_load_table()
+    print("taxon reconciliation passed ✔️")